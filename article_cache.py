@@ -0,0 +1,217 @@
+"""Persistent on-disk cache of extracted article text.
+
+Extracted text is stored one file per article, addressed by a hash of the
+normalized URL, so reruns of the pipeline do not touch the network for
+articles that were already fetched. Entries expire after a TTL and the
+cache is held under a byte cap by evicting the least recently used files.
+
+File metadata carries all the bookkeeping (mtime = when stored, atime =
+last read), so there is no index to corrupt and several processes can
+share one cache directory.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+# Default cache location and limits
+DEFAULT_ARTICLE_CACHE_DIR = "./data/article_cache"
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600       # One week
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024     # 200 MB
+
+# Eviction frees space down to this fraction of the cap, so a full cache
+# is not rescanned on every put
+EVICT_LOW_WATER = 0.9
+
+# Query parameters that never change the article being served
+TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "cmpid", "ocid"}
+
+
+def normalize_url(url: str) -> str:
+    """Normalize a URL so trivially different links share one cache entry.
+
+    Lowercases the scheme and host, drops the fragment, tracking parameters
+    (``utm_*`` and friends) and a trailing slash, and sorts the query string.
+    """
+    parts = urlsplit(url.strip())
+    query = [
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith("utm_") and k.lower() not in TRACKING_PARAMS
+    ]
+    path = parts.path.rstrip("/") if parts.path not in ("", "/") else ""
+    return urlunsplit((
+        parts.scheme.lower(),
+        parts.netloc.lower(),
+        path,
+        urlencode(sorted(query)),
+        "",
+    ))
+
+
+def url_key(url: str, namespace: str = "text") -> str:
+    """Return the content address for a URL within a namespace."""
+    return hashlib.sha256(f"{namespace}:{normalize_url(url)}".encode("utf-8")).hexdigest()
+
+
+class ArticleCache:
+    """TTL + LRU-bounded file cache of article text keyed by normalized URL."""
+
+    def __init__(
+        self,
+        cache_dir: str = DEFAULT_ARTICLE_CACHE_DIR,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total_bytes = self._scan_size()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def _iter_files(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".txt"):
+                    yield os.path.join(root, name)
+
+    def _scan_size(self) -> int:
+        total = 0
+        for path in self._iter_files():
+            try:
+                total += os.path.getsize(path)
+            except OSError:
+                continue
+        return total
+
+    def _remove(self, path: str) -> None:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        with self._lock:
+            self._total_bytes -= size
+
+    def get(self, url: str, namespace: str = "text") -> Optional[str]:
+        """Return cached text for a URL, or None on a miss or expired entry."""
+        path = self._path(url_key(url, namespace))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._count(hit=False)
+            return None
+
+        now = time.time()
+        if now - stat.st_mtime > self.ttl_seconds:
+            self._remove(path)
+            self._count(hit=False)
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            os.utime(path, (now, stat.st_mtime))  # Record the access for LRU
+        except OSError as e:
+            logger.debug(f"Could not read cached article {url}: {e}")
+            self._count(hit=False)
+            return None
+
+        self._count(hit=True)
+        return text
+
+    def put(self, url: str, text: str, namespace: str = "text") -> None:
+        """Store text for a URL, evicting old entries if over the byte cap."""
+        path = self._path(url_key(url, namespace))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            old_size = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+            size = os.path.getsize(path)
+        except OSError as e:
+            logger.warning(f"Could not cache article {url}: {e}")
+            return
+
+        with self._lock:
+            self._total_bytes += size - old_size
+            over_cap = self._total_bytes > self.max_bytes
+        if over_cap:
+            self.evict()
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones, until under the low-water mark.
+
+        Freeing space below the cap (to ``EVICT_LOW_WATER`` of it) means the
+        directory scan runs once per tenth of the cap written, not per put.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self._iter_files():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                self._remove(path)
+                removed += 1
+            else:
+                entries.append((max(stat.st_atime, stat.st_mtime), path))
+
+        entries.sort()
+        target = self.max_bytes * EVICT_LOW_WATER
+        for _, path in entries:
+            with self._lock:
+                if self._total_bytes <= target:
+                    break
+            self._remove(path)
+            removed += 1
+
+        if removed:
+            logger.info(f"Evicted {removed} cached articles")
+        return removed
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current size."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "bytes": self._total_bytes}
+
+
+# Singleton instance for easy access
+_article_cache: Optional[ArticleCache] = None
+
+
+def get_article_cache(cache_dir: str = DEFAULT_ARTICLE_CACHE_DIR) -> ArticleCache:
+    """Get or create the article cache singleton."""
+    global _article_cache
+    if _article_cache is None:
+        _article_cache = ArticleCache(cache_dir)
+    return _article_cache
@@ -0,0 +1,233 @@
+"""CPU-bound article HTML parsing, optionally on a process pool.
+
+Downloading stays on the I/O thread pool in news_tracker; when pages queue
+up faster than they can be parsed, parsing is handed to a few worker
+processes. Pages go through a lean readability-style lxml extractor first;
+the full newspaper3k stack is only used when that comes back too short.
+
+Workers use the spawn start method, so each one re-imports the parent's
+``__main__`` module (for main.py, its whole import graph) before it can
+parse anything. That start-up cost is why the pool is small and only
+started once there is a backlog; light days parse inline.
+"""
+
+import logging
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Default number of parser processes
+DEFAULT_PARSE_WORKERS = min(4, os.cpu_count() or 1)
+
+# Concurrent parse requests that make starting the process pool worthwhile
+POOL_BACKLOG = 4
+
+# Lean extractions shorter than this fall back to newspaper3k
+LEAN_MIN_TEXT_LENGTH = 500
+
+# Paragraphs shorter than this don't count towards a container's score
+MIN_PARAGRAPH_LENGTH = 25
+
+# Elements that never hold article text
+BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "header", "footer", "nav", "aside",
+    "form", "figure", "iframe", "svg", "button",
+)
+
+# class/id hints for boilerplate and for article bodies
+NEGATIVE_HINTS = re.compile(
+    r"comment|footer|sidebar|\bnav|menu|share|social|related|promo|advert|"
+    r"\bads?\b|subscribe|newsletter|cookie|banner|popup",
+    re.IGNORECASE,
+)
+POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|post|story|text", re.IGNORECASE)
+
+
+def _hints(element) -> str:
+    return f"{element.get('class', '')} {element.get('id', '')}"
+
+
+def _paragraph_text(paragraph) -> str:
+    """Return a paragraph's text, or "" when it is mostly links."""
+    text = " ".join(paragraph.text_content().split())
+    if not text:
+        return ""
+    link_chars = sum(len(a.text_content()) for a in paragraph.iter("a"))
+    if link_chars > len(text) / 2:
+        return ""
+    return text
+
+
+def extract_lean(html: str) -> Tuple[str, str]:
+    """Extract (title, text) with a single lxml pass, readability style.
+
+    Every paragraph scores its parent (and half that for its grandparent)
+    by length; the text of the best-scoring container's paragraphs wins.
+    """
+    import lxml.html
+    from lxml.etree import ParserError
+
+    try:
+        root = lxml.html.fromstring(html)
+    except (ParserError, ValueError):
+        return "", ""
+
+    title = root.xpath("string(//meta[@property='og:title']/@content)") or root.findtext(".//title") or ""
+
+    for element in list(root.iter(*BOILERPLATE_TAGS)):
+        element.drop_tree()
+    for element in root.xpath("//*[@class or @id]"):
+        # The root and <body> often carry page-wide classes ("js cookies")
+        if element.getparent() is None or element.tag == "body":
+            continue
+        hints = _hints(element)
+        if NEGATIVE_HINTS.search(hints) and not POSITIVE_HINTS.search(hints):
+            element.drop_tree()
+
+    scores = {}
+    for paragraph in root.iter("p"):
+        length = len(_paragraph_text(paragraph))
+        if length < MIN_PARAGRAPH_LENGTH:
+            continue
+        parent = paragraph.getparent()
+        if parent is None:
+            continue
+        scores[parent] = scores.get(parent, 0.0) + length
+        grandparent = parent.getparent()
+        if grandparent is not None:
+            scores[grandparent] = scores.get(grandparent, 0.0) + length / 2
+
+    if not scores:
+        return title.strip(), ""
+    for candidate in scores:
+        if POSITIVE_HINTS.search(_hints(candidate)) or candidate.tag == "article":
+            scores[candidate] *= 1.25
+    best = max(scores, key=scores.get)
+
+    paragraphs = (_paragraph_text(p) for p in best.iter("p"))
+    text = "\n\n".join(p for p in paragraphs if p)
+    return title.strip(), text
+
+
+def parse_with_newspaper(url: str, html: str) -> Tuple[str, str]:
+    """Parse downloaded article HTML with newspaper3k.
+
+    Returns:
+        Tuple of (title, text)
+    """
+    from newspaper import Article
+
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    return article.title or "", article.text or ""
+
+
+def parse_article_html(url: str, html: str) -> Tuple[str, str]:
+    """Parse downloaded article HTML, falling back to newspaper3k when the
+    lean extraction is too short to be the whole article.
+
+    Returns:
+        Tuple of (title, text)
+    """
+    try:
+        title, text = extract_lean(html)
+    except Exception as e:
+        logger.debug(f"Lean extraction failed for {url}: {e}")
+        title, text = "", ""
+    if len(text) >= LEAN_MIN_TEXT_LENGTH:
+        return title, text
+
+    full_title, full_text = parse_with_newspaper(url, html)
+    if len(full_text) > len(text):
+        return full_title or title, full_text
+    return title or full_title, text
+
+
+class ParsePool:
+    """Process pool for article parsing, started on first use.
+
+    Pages are parsed inline on the calling thread until ``backlog`` parse
+    requests are waiting at once; only then are the worker processes
+    spawned. With ``workers <= 1`` parsing always runs inline. If the pool
+    breaks (e.g. a worker is killed) parsing falls back to inline.
+    """
+
+    def __init__(self, workers: Optional[int] = None, backlog: int = POOL_BACKLOG):
+        self.workers = DEFAULT_PARSE_WORKERS if workers is None else workers
+        self.backlog = backlog
+        self._lock = threading.Lock()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._broken = False
+        self._closed = False
+        self._waiting = 0
+
+    def _get_executor(self, pending: int = 1) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 1 or self._broken:
+            return None
+        with self._lock:
+            if self._closed:
+                return None
+            if self._executor is None:
+                if self._waiting + pending < self.backlog:
+                    return None
+                # Spawn, not fork: the parent is running fetch threads
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def parse(self, url: str, html: str) -> Tuple[str, str]:
+        """Parse article HTML, returning (title, text)."""
+        with self._lock:
+            self._waiting += 1
+        try:
+            executor = self._get_executor(pending=0)
+            if executor is None:
+                return parse_article_html(url, html)
+            try:
+                return executor.submit(parse_article_html, url, html).result()
+            except BrokenProcessPool:
+                logger.warning("Parse pool broke; parsing inline from now on")
+                self._broken = True
+                return parse_article_html(url, html)
+        finally:
+            with self._lock:
+                self._waiting -= 1
+
+    def parse_many(self, pages: Sequence[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Parse (url, html) pairs across the pool, preserving input order."""
+        executor = self._get_executor(pending=len(pages))
+        if executor is None:
+            return [parse_article_html(url, html) for url, html in pages]
+        results = []
+        try:
+            futures = [executor.submit(parse_article_html, url, html) for url, html in pages]
+            for future in futures:
+                results.append(future.result())
+        except BrokenProcessPool:
+            logger.warning("Parse pool broke; parsing inline from now on")
+            self._broken = True
+            results.extend(parse_article_html(url, html) for url, html in pages[len(results):])
+        return results
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; later parse calls run inline."""
+        with self._lock:
+            self._closed = True
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait, cancel_futures=not wait)
+                self._executor = None
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
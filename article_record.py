@@ -0,0 +1,115 @@
+"""Compact in-memory representation of a fetched article.
+
+An :class:`ArticleRecord` keeps an article's metadata and the first
+:data:`PREFIX_CHARS` characters of its text; longer texts stay in the
+on-disk article cache and are read back only when ``record["content"]``
+is accessed, and are not kept after that. Curation compares only the
+prefix (similarity uses 500 characters, prompts up to 2000), so memory per
+article is bounded no matter how long the extracted body is.
+
+Records are read-only mappings, so code written for article dicts
+(``article.get("title")``, ``article["content"]``) works unchanged.
+"""
+
+import logging
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, Union
+
+from article_cache import ArticleCache
+
+logger = logging.getLogger(__name__)
+
+# Characters of content kept in memory (curation needs at most 2000)
+PREFIX_CHARS = 2000
+
+# Article cache namespace for texts the record spilled itself
+RECORD_NAMESPACE = "record"
+
+FIELDS = ("title", "content", "link", "guid", "published")
+
+
+class ArticleRecord(Mapping):
+    """Read-only article mapping holding a content prefix; full text loads on demand.
+
+    Args:
+        title, link, guid, published: Article metadata
+        content: Full article text
+        cache: Where the full text lives when longer than the prefix; without
+            a cache the full text is kept in memory
+        cached_as: Cache namespace the text is already stored under (e.g.
+            "text" for extracted articles); None stores it under
+            :data:`RECORD_NAMESPACE`
+    """
+
+    __slots__ = ("title", "link", "guid", "published", "prefix", "content_length",
+                 "_cache", "_namespace", "_content")
+
+    def __init__(
+        self,
+        title: str,
+        link: str,
+        content: str,
+        guid: Optional[str] = None,
+        published: Optional[datetime] = None,
+        cache: Optional[ArticleCache] = None,
+        cached_as: Optional[str] = None
+    ):
+        self.title = title
+        self.link = link
+        self.guid = guid
+        self.published = published
+        self.prefix = content[:PREFIX_CHARS]
+        self.content_length = len(content)
+        self._cache = None
+        self._namespace = None
+        self._content = None
+        if len(content) > PREFIX_CHARS:
+            if cache is None:
+                self._content = content
+            else:
+                if cached_as is None:
+                    cache.put(link, content, namespace=RECORD_NAMESPACE)
+                self._cache = cache
+                self._namespace = cached_as or RECORD_NAMESPACE
+
+    @property
+    def content(self) -> str:
+        """Full article text (read from the cache when not held in memory)."""
+        if self._cache is None:
+            return self._content if self._content is not None else self.prefix
+        text = self._cache.get(self.link, namespace=self._namespace)
+        if text is None:
+            logger.warning(
+                f"Full text of {self.link} is no longer cached; using its first {PREFIX_CHARS} characters"
+            )
+            return self.prefix
+        return text
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELDS)
+
+    def __len__(self) -> int:
+        return len(FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ArticleRecord(title={self.title!r}, link={self.link!r}, content_length={self.content_length})"
+
+
+def content_prefix(story: Union[ArticleRecord, Dict[str, Any]], chars: int = PREFIX_CHARS) -> str:
+    """First ``chars`` (at most :data:`PREFIX_CHARS`) characters of a story's content."""
+    if isinstance(story, ArticleRecord):
+        return story.prefix[:chars]
+    return (story.get('content', '') or '')[:chars]
+
+
+def content_length(story: Union[ArticleRecord, Dict[str, Any]]) -> int:
+    """Length of a story's full content, without loading it."""
+    if isinstance(story, ArticleRecord):
+        return story.content_length
+    return len(story.get('content', '') or '')
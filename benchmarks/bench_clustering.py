@@ -0,0 +1,86 @@
+"""Benchmark story clustering: exhaustive scan, blocked candidates and batch TF-IDF.
+
+Usage:
+    python -m benchmarks.bench_clustering --sizes 1000 10000
+    python -m benchmarks.bench_clustering --sizes 10000 --exact-max 10000
+
+The exhaustive scan is quadratic; above ``--exact-max`` stories its time is
+extrapolated from the largest measured run and marked with ``~``.
+"""
+
+import argparse
+import time
+
+from benchmarks.story_corpus import pairwise_scores, synthetic_stories
+from story_similarity import SimilarityThresholds, TfidfSimilarity
+from topic_curator import IncrementalStoryCombiner
+
+
+def run(stories, use_index: bool):
+    """Cluster ``stories``; returns (combiner, seconds, cluster label per story)."""
+    combiner = IncrementalStoryCombiner(use_index=use_index)
+    start = time.perf_counter()
+    combiner.extend(stories)
+    elapsed = time.perf_counter() - start
+    return combiner, elapsed, combiner.labels()
+
+
+def run_tfidf(stories):
+    """Cluster ``stories`` in one batch; returns (cluster count, seconds, labels)."""
+    start = time.perf_counter()
+    clusters = TfidfSimilarity(stories, SimilarityThresholds()).cluster()
+    elapsed = time.perf_counter() - start
+    labels = [0] * len(stories)
+    for label, members in enumerate(clusters):
+        for i in members:
+            labels[i] = label
+    return len(clusters), elapsed, labels
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--exact-max", type=int, default=2000, help="Largest size to scan exhaustively")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(f"{'Stories':>8} {'Mode':<10} {'Time':>9} {'Compares':>11} {'Clusters':>9} "
+          f"{'Prec':>6} {'Recall':>6} {'F1':>6} {'Agree':>6}")
+    exact_rate = None  # Seconds per comparison in the exhaustive scan
+    for size in sorted(args.sizes):
+        stories = synthetic_stories(size, seed=args.seed)
+        truth = [s["topic"] for s in stories]
+
+        indexed, indexed_time, indexed_labels = run(stories, use_index=True)
+        precision, recall, f1 = pairwise_scores(indexed_labels, truth)
+        agree = "-"
+        if size <= args.exact_max:
+            exact, exact_time, exact_labels = run(stories, use_index=False)
+            exact_rate = exact_time / max(exact.comparisons, 1)
+            exact_p, exact_r, exact_f1 = pairwise_scores(exact_labels, truth)
+            agree = f"{pairwise_scores(indexed_labels, exact_labels)[2]:.3f}"
+            print(f"{size:>8} {'exhaustive':<10} {exact_time:8.2f}s {exact.comparisons:>11,} "
+                  f"{len(exact.clusters):>9} {exact_p:>6.3f} {exact_r:>6.3f} {exact_f1:>6.3f}")
+        elif exact_rate is not None:
+            # Exhaustive scan compares each story with every earlier story outside its cluster
+            estimated = exact_rate * size * (size - size / len(indexed.clusters)) / 2
+            print(f"{size:>8} {'exhaustive':<10} ~{estimated:7.0f}s {'(estimated)':>11}")
+            exact_time = estimated
+        else:
+            exact_time = None
+
+        print(f"{size:>8} {'blocked':<10} {indexed_time:8.2f}s {indexed.comparisons:>11,} "
+              f"{len(indexed.clusters):>9} {precision:>6.3f} {recall:>6.3f} {f1:>6.3f} {agree:>6}")
+
+        tfidf_clusters, tfidf_time, tfidf_labels = run_tfidf(stories)
+        tfidf_p, tfidf_r, tfidf_f1 = pairwise_scores(tfidf_labels, truth)
+        tfidf_agree = "-" if size > args.exact_max else f"{pairwise_scores(tfidf_labels, exact_labels)[2]:.3f}"
+        print(f"{size:>8} {'tfidf':<10} {tfidf_time:8.2f}s {'(batched)':>11} "
+              f"{tfidf_clusters:>9} {tfidf_p:>6.3f} {tfidf_r:>6.3f} {tfidf_f1:>6.3f} {tfidf_agree:>6}")
+        if exact_time:
+            print(f"{'':>8} speedup: blocked {exact_time / indexed_time:.0f}x, "
+                  f"tfidf {exact_time / tfidf_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
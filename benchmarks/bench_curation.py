@@ -0,0 +1,171 @@
+"""Benchmark story curation stage by stage on synthetic corpora.
+
+Measures wall time and peak traced memory of each stage for
+``topic_curator.select_top_stories`` and ``story_arc.create_episode_arc``
+and checks cluster quality against the corpus ground truth, so speed work
+cannot silently degrade curation.
+
+Usage:
+    python -m benchmarks.bench_curation --sizes 100 1000 10000
+    python -m benchmarks.bench_curation --max-sources 8 --sentences 20 40 --min-f1 0.95
+
+Stages:
+    clustering  cluster_stories on the whole corpus
+    scoring     significance of every cluster's primary story
+    facts       key facts and quotes of every cluster's combined content
+    selection   select_top_stories end to end (clustering included)
+    arc         create_episode_arc over every cluster's primary story
+
+Time comes from an untraced pass and memory from a second pass under
+tracemalloc (peak allocations above the stage's starting point).
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, List, Tuple
+
+from benchmarks.story_corpus import pairwise_scores, synthetic_stories
+from keyword_scanner import get_keyword_scanner
+from story_arc import create_episode_arc
+from story_features import clear_feature_cache
+from topic_curator import (
+    calculate_significance_score,
+    cluster_stories,
+    extract_key_facts,
+    extract_key_quotes,
+    primary_story,
+    select_top_stories,
+)
+
+STAGES = ("clustering", "scoring", "facts", "selection", "arc")
+
+
+def past_predictions(stories: List[Dict[str, Any]], count: int) -> List[Dict[str, Any]]:
+    """Predictions built from corpus titles, so some come true."""
+    return [
+        {"prediction": f"We expect {story['title']} to matter", "episode_date": "2026-01-01"}
+        for story in stories[:count]
+    ]
+
+
+def run_pipeline(
+    stories: List[Dict[str, Any]],
+    predictions: List[Dict[str, Any]],
+    max_stories: int,
+    trace: bool = False
+) -> Tuple[Dict[str, float], List[List[Dict[str, Any]]], list]:
+    """Run every stage once from cold feature caches.
+
+    Returns:
+        Tuple of ({stage: seconds, or peak MB when tracing}, clusters, selected stories)
+    """
+    measurements: Dict[str, float] = {}
+
+    def stage(name: str, function: Callable[[], Any]) -> Any:
+        if trace:
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        result = function()
+        if trace:
+            measurements[name] = (tracemalloc.get_traced_memory()[1] - baseline) / 1e6
+        else:
+            measurements[name] = time.perf_counter() - start
+        return result
+
+    clear_feature_cache()
+    clusters = stage("clustering", lambda: cluster_stories(stories))
+    stage("scoring", lambda: [calculate_significance_score(primary_story(c), len(c)) for c in clusters])
+    stage("facts", lambda: [
+        (extract_key_facts(content), extract_key_quotes(content))
+        for content in (" ".join(s.get('content', '') for s in c) for c in clusters)
+    ])
+    clear_feature_cache()
+    selected = stage("selection", lambda: select_top_stories(
+        stories, max_stories=max_stories, min_significance=0
+    ))
+    stage("arc", lambda: create_episode_arc([primary_story(c) for c in clusters], predictions))
+    return measurements, clusters, selected
+
+
+def quality(stories: List[Dict[str, Any]], clusters, selected) -> Dict[str, Any]:
+    """Cluster and selection quality against the ``topic`` ground truth."""
+    label = {id(story): i for i, cluster in enumerate(clusters) for story in cluster}
+    predicted = [label[id(story)] for story in stories]
+    truth = [story["topic"] for story in stories]
+    precision, recall, f1 = pairwise_scores(predicted, truth)
+    topic_sizes = Counter(truth)
+    # A selected story is whole when its sources are exactly one topic's sources
+    whole = sum(
+        1 for story in selected
+        if len({s["topic"] for s in story.sources}) == 1
+        and topic_sizes[story.sources[0]["topic"]] == story.source_count
+    )
+    return {
+        "clusters": len(clusters),
+        "topics": len(topic_sizes),
+        "precision": round(precision, 4),
+        "recall": round(recall, 4),
+        "f1": round(f1, 4),
+        "whole_selected": whole,
+        "selected": len(selected),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--max-sources", type=int, default=4, help="Most sources (duplicates) per topic")
+    parser.add_argument("--sentences", type=int, nargs=2, default=[6, 10], metavar=("MIN", "MAX"),
+                        help="Sentences per topic copy (content length)")
+    parser.add_argument("--max-stories", type=int, default=4)
+    parser.add_argument("--predictions", type=int, default=50, help="Past predictions checked by the arc")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--skip-memory", action="store_true", help="Skip the traced memory pass")
+    parser.add_argument("--min-f1", type=float, default=0.0, help="Exit 1 if cluster F1 falls below this")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    get_keyword_scanner()  # Compile the shared keyword regex outside the timings
+    results = []
+    print(f"{'Articles':>8} {'Stage':<11} {'Time':>9} {'Peak mem':>10}")
+    for size in args.sizes:
+        stories = synthetic_stories(size, args.max_sources, args.seed, tuple(args.sentences))
+        predictions = past_predictions(stories, args.predictions)
+        seconds, clusters, selected = run_pipeline(stories, predictions, args.max_stories)
+        memory: Dict[str, float] = {}
+        if not args.skip_memory:
+            tracemalloc.start()
+            memory = run_pipeline(stories, predictions, args.max_stories, trace=True)[0]
+            tracemalloc.stop()
+
+        for name in STAGES:
+            peak = f"{memory[name]:8.1f}MB" if memory else f"{'-':>10}"
+            print(f"{size:>8} {name:<11} {seconds[name]:8.3f}s {peak}")
+        scores = quality(stories, clusters, selected)
+        print(f"{'':>8} clusters {scores['clusters']} for {scores['topics']} topics, "
+              f"P {scores['precision']:.3f} R {scores['recall']:.3f} F1 {scores['f1']:.3f}, "
+              f"whole selected topics {scores['whole_selected']}/{scores['selected']}")
+        results.append({
+            "articles": size,
+            "seconds": {name: round(value, 4) for name, value in seconds.items()},
+            "peak_mb": {name: round(value, 2) for name, value in memory.items()},
+            "quality": scores,
+        })
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+    worst = min(r["quality"]["f1"] for r in results)
+    if worst < args.min_f1:
+        print(f"Cluster F1 {worst:.3f} is below --min-f1 {args.min_f1}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
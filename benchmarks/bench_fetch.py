@@ -0,0 +1,125 @@
+"""Benchmark article ingestion against local stand-in sites, fully offline.
+
+Runs ``news_tracker.get_recent_articles`` serially and concurrently and
+reports articles/sec, p50/p95 latency per fetch and peak RSS, optionally
+as JSON for tracking regressions between ingestion changes.
+
+Usage:
+    python -m benchmarks.bench_fetch --sites 6 --feeds 2 --items 8 --latency 0.1
+    python -m benchmarks.bench_fetch --forbidden-rate 0.2 --paragraphs 80 --json results.json
+"""
+
+import argparse
+import json
+import os
+import resource
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Sequence
+
+import news_tracker
+from article_cache import ArticleCache
+from domain_health import DomainHealthTracker
+from feed_cache import FeedCache
+from benchmarks.news_server import StandInNewsServer
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile (0 for no values)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, round(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def run(feed_urls, max_workers: int, per_host_limit: int, cache_dir: str, parse_workers=None):
+    """Run one cold ingestion pass with caches isolated in ``cache_dir``.
+
+    Returns:
+        Tuple of (articles, elapsed seconds, FetchBudget with per-fetch latencies)
+    """
+    budget = news_tracker.FetchBudget(None)
+    start = time.perf_counter()
+    articles = news_tracker.get_recent_articles(
+        feed_urls=feed_urls, max_workers=max_workers, per_host_limit=per_host_limit,
+        feed_cache=FeedCache(os.path.join(cache_dir, "feeds.json")),
+        article_cache=ArticleCache(os.path.join(cache_dir, "articles")),
+        skip_seen=False,
+        parse_workers=parse_workers,
+        domain_health=DomainHealthTracker(os.path.join(cache_dir, "domains.json")),
+        budget=budget,
+    )
+    return articles, time.perf_counter() - start, budget
+
+
+def summarize(name: str, articles: List[Dict[str, Any]], elapsed: float, budget) -> Dict[str, Any]:
+    return {
+        "run": name,
+        "articles": len(articles),
+        "seconds": round(elapsed, 3),
+        "articles_per_sec": round(len(articles) / elapsed, 1),
+        "fetches": len(budget.latencies),
+        "p50_fetch_ms": round(percentile(budget.latencies, 50) * 1000, 1),
+        "p95_fetch_ms": round(percentile(budget.latencies, 95) * 1000, 1),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sites", type=int, default=6)
+    parser.add_argument("--feeds", type=int, default=2, help="Feeds per site")
+    parser.add_argument("--items", type=int, default=8, help="Items per feed")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds per response")
+    parser.add_argument("--forbidden-rate", type=float, default=0.0, help="Share of articles answering 403")
+    parser.add_argument("--paragraphs", type=int, default=8, help="Paragraphs per article page")
+    parser.add_argument("--workers", type=int, default=news_tracker.MAX_CONCURRENT_FETCHES)
+    parser.add_argument("--per-host", type=int, default=news_tracker.MAX_FETCHES_PER_HOST)
+    parser.add_argument("--skip-serial", action="store_true", help="Only run the concurrent pass")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp, StandInNewsServer(
+        args.sites, args.feeds, args.items, args.latency, args.paragraphs, args.forbidden_rate
+    ) as server:
+        if not args.skip_serial:
+            serial, elapsed, budget = run(
+                server.feed_urls, 1, 1, os.path.join(tmp, "serial"), parse_workers=1
+            )
+            results.append(summarize("serial", serial, elapsed, budget))
+        pooled, elapsed, budget = run(
+            server.feed_urls, args.workers, args.per_host, os.path.join(tmp, "concurrent")
+        )
+        results.append(summarize("concurrent", pooled, elapsed, budget))
+        forbidden = server.forbidden
+
+    print(f"\nArticles: {len(pooled)}, 403 responses served: {forbidden}")
+    if not args.skip_serial:
+        same = [a["link"] for a in serial] == [a["link"] for a in pooled]
+        print(f"Identical order: {same}")
+    print(f"{'Run':<11} {'Time':>7} {'Art/s':>7} {'Fetches':>8} {'p50 ms':>8} {'p95 ms':>8} {'Peak RSS':>9}")
+    for r in results:
+        print(
+            f"{r['run']:<11} {r['seconds']:6.2f}s {r['articles_per_sec']:7.1f} {r['fetches']:8d} "
+            f"{r['p50_fetch_ms']:8.1f} {r['p95_fetch_ms']:8.1f} {r['peak_rss_mb']:7.1f}MB"
+        )
+    if len(results) == 2:
+        print(f"Speedup: {results[0]['seconds'] / results[1]['seconds']:.1f}x")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Micro-benchmark key fact and quote extraction on large story clusters.
+
+Compares the early-exit scanners in topic_curator with the previous
+split-then-filter implementation on the concatenated content of a
+multi-source cluster, which can reach hundreds of KB.
+
+Usage:
+    python -m benchmarks.bench_key_content --size-kb 500 --repeat 20
+
+Two clusters are measured: a typical one whose facts and quotes appear
+early, and a sparse one with few matches, which forces full scans.
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import List
+
+from benchmarks.story_corpus import synthetic_stories
+from topic_curator import extract_key_facts, extract_key_quotes
+
+QUOTE = "\"We expect the new {word} platform to change how developers build {other}\""
+APOSTROPHES = "The company's {word} team didn't say when it'd ship."
+
+
+def baseline_key_facts(content: str) -> List[str]:
+    """The previous extract_key_facts: split everything, then filter."""
+    facts = []
+    for sentence in re.split(r'[.!?]', content):
+        sentence = sentence.strip()
+        if re.search(r'\$[\d,]+|\d+%|\d+\s*(million|billion|trillion)', sentence, re.I):
+            if 20 < len(sentence) < 200:
+                facts.append(sentence)
+        elif any(kw in sentence.lower() for kw in ["announced", "reported", "confirmed", "revealed"]):
+            if 20 < len(sentence) < 200:
+                facts.append(sentence)
+    return facts[:5]
+
+
+def baseline_key_quotes(content: str) -> List[str]:
+    """The previous extract_key_quotes: collect every match, then dedupe."""
+    quotes = []
+    for pattern in [r'"([^"]{30,200})"', r"'([^']{30,200})'", r'"([^"]{30,200})"']:
+        quotes.extend(re.findall(pattern, content))
+    seen = set()
+    unique_quotes = []
+    for q in quotes:
+        if q.lower() not in seen:
+            seen.add(q.lower())
+            unique_quotes.append(q)
+    return unique_quotes[:3]
+
+
+def cluster_content(size_kb: int, sparse: bool, seed: int = 0) -> str:
+    """Concatenated content of a synthetic cluster of about ``size_kb`` KB."""
+    rng = random.Random(seed)
+    parts: List[str] = []
+    size = 0
+    stories = synthetic_stories(max(50, size_kb), seed=seed)
+    while size < size_kb * 1000:
+        story = rng.choice(stories)
+        content = story["content"]
+        words = content.split()
+        if sparse:
+            # No figures or quotes, apostrophes only
+            content = re.sub(r"\d+%", "many", content) + " " + APOSTROPHES.format(word=rng.choice(words))
+        elif rng.random() < 0.3:
+            content += " " + QUOTE.format(word=rng.choice(words), other=rng.choice(words))
+        parts.append(content)
+        size += len(content) + 1
+    return " ".join(parts)
+
+
+def measure(function, content: str, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function(content)
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-kb", type=int, default=500, help="Cluster content size")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'Cluster':<8} {'Extract':<7} {'Baseline':>10} {'Scanner':>10} {'Speedup':>8} {'Same':>5}")
+    for name, sparse in (("typical", False), ("sparse", True)):
+        content = cluster_content(args.size_kb, sparse)
+        for kind, baseline, scanner in (
+            ("facts", baseline_key_facts, extract_key_facts),
+            ("quotes", baseline_key_quotes, extract_key_quotes),
+        ):
+            before = measure(baseline, content, args.repeat)
+            after = measure(scanner, content, args.repeat)
+            same = baseline(content) == scanner(content)
+            print(f"{name:<8} {kind:<7} {before * 1000:8.2f}ms {after * 1000:8.2f}ms "
+                  f"{before / after:7.1f}x {str(same):>5}")
+    print(f"Content: {len(content) / 1000:.0f} KB per cluster, {args.repeat} repeats")
+
+
+if __name__ == "__main__":
+    main()
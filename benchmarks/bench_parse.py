@@ -0,0 +1,85 @@
+"""Benchmark article extraction throughput on a corpus of saved HTML.
+
+Compares the full newspaper3k parse, the lean lxml fast path (with its
+newspaper fallback) and the lean path on a process pool.
+
+Usage:
+    python -m benchmarks.bench_parse --corpus ./saved_pages
+    python -m benchmarks.bench_parse --synthetic 200 --workers 4
+
+Without ``--corpus`` a synthetic corpus of article pages is generated.
+"""
+
+import argparse
+import glob
+import os
+import time
+
+from article_parser import (
+    DEFAULT_PARSE_WORKERS,
+    LEAN_MIN_TEXT_LENGTH,
+    ParsePool,
+    extract_lean,
+    parse_article_html,
+    parse_with_newspaper,
+)
+from benchmarks.news_server import render_article
+
+
+def load_corpus(corpus_dir: str):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "**", "*.htm*"), recursive=True)):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            pages.append((f"file://{os.path.abspath(path)}", f.read()))
+    return pages
+
+
+def synthetic_corpus(count: int, paragraphs: int):
+    return [
+        (f"http://bench.local/article/{i}.html", render_article(0, 0, i, paragraphs))
+        for i in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="Directory of saved .html pages")
+    parser.add_argument("--synthetic", type=int, default=200, help="Synthetic pages if no corpus")
+    parser.add_argument("--paragraphs", type=int, default=40, help="Paragraphs per synthetic page")
+    parser.add_argument("--workers", type=int, default=DEFAULT_PARSE_WORKERS)
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.synthetic, args.paragraphs)
+    if not pages:
+        raise SystemExit("No pages to parse")
+    size_mb = sum(len(html) for _, html in pages) / 1e6
+
+    start = time.perf_counter()
+    full = [parse_with_newspaper(url, html) for url, html in pages]
+    full_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    serial = [parse_article_html(url, html) for url, html in pages]
+    serial_time = time.perf_counter() - start
+
+    fallbacks = sum(len(extract_lean(html)[1]) < LEAN_MIN_TEXT_LENGTH for _, html in pages)
+    full_chars = sum(len(text) for _, text in full) or 1
+    lean_chars = sum(len(text) for _, text in serial)
+
+    with ParsePool(args.workers) as pool:
+        pool.parse_many(pages[:args.workers])  # Exclude worker start-up from the timing
+        start = time.perf_counter()
+        pooled = pool.parse_many(pages)
+        pooled_time = time.perf_counter() - start
+
+    print(f"Pages: {len(pages)} ({size_mb:.1f} MB), workers: {args.workers}")
+    print(f"Newspaper fallbacks: {fallbacks}/{len(pages)}, text kept vs newspaper: {lean_chars / full_chars:.0%}")
+    print(f"Pooled output identical: {serial == pooled}")
+    print(f"Newspaper:   {full_time:6.2f}s  ({len(pages) / full_time:7.1f} pages/s)")
+    print(f"Lean:        {serial_time:6.2f}s  ({len(pages) / serial_time:7.1f} pages/s)")
+    print(f"Lean pooled: {pooled_time:6.2f}s  ({len(pages) / pooled_time:7.1f} pages/s)")
+    print(f"Lean speedup: {full_time / serial_time:5.1f}x, pooled: {full_time / pooled_time:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Local stand-in news sites for offline ingestion benchmarks.
+
+Each simulated site runs its own HTTP server on an ephemeral localhost port,
+so per-host limits in the fetcher see them as distinct hosts. Every site
+serves RSS feeds at ``/feed/<n>.xml`` and article pages at
+``/article/<n>/<m>.html``. Feeds carry an ETag and honour If-None-Match,
+so conditional polling can be measured too. A configurable share of
+article pages answers 403, the way sites that block scrapers do.
+"""
+
+import hashlib
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+ARTICLE_PARAGRAPH = (
+    "Researchers announced a new model that reportedly cut inference costs by "
+    "40% while matching the accuracy of much larger systems. Analysts said the "
+    "result could reshape pricing across the industry over the next year."
+)
+
+
+def render_article(site: int, feed: int, item: int, paragraphs: int = 8) -> str:
+    """Render a synthetic article page."""
+    body = "\n".join(
+        f"<p>{ARTICLE_PARAGRAPH} (site {site}, feed {feed}, item {item}, part {i})</p>"
+        for i in range(paragraphs)
+    )
+    return (
+        "<html><head><title>"
+        f"Story {site}-{feed}-{item}"
+        "</title></head><body><nav>Home | World | Tech</nav>"
+        f"<article><h1>Story {site}-{feed}-{item}</h1>{body}</article>"
+        "<footer>Copyright</footer></body></html>"
+    )
+
+
+def render_feed(base_url: str, site: int, feed: int, items: int, published: datetime) -> str:
+    """Render a synthetic RSS feed whose items were all published at ``published``."""
+    published = format_datetime(published)
+    entries = "".join(
+        "<item>"
+        f"<title>Story {site}-{feed}-{i}</title>"
+        f"<link>{base_url}/article/{feed}/{i}.html</link>"
+        f"<guid>{base_url}/article/{feed}/{i}.html</guid>"
+        f"<description>Summary of story {site}-{feed}-{i}</description>"
+        f"<pubDate>{published}</pubDate>"
+        "</item>"
+        for i in range(items)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+        f"<title>Site {site} feed {feed}</title><link>{base_url}</link>"
+        f"<description>Stand-in feed</description>{entries}</channel></rss>"
+    )
+
+
+class StandInNewsServer:
+    """A set of local news sites serving synthetic feeds and articles.
+
+    Usage:
+        with StandInNewsServer(sites=4, feeds_per_site=2, latency=0.05) as server:
+            articles = get_recent_articles(feed_urls=server.feed_urls)
+    """
+
+    def __init__(
+        self,
+        sites: int = 4,
+        feeds_per_site: int = 2,
+        items_per_feed: int = 10,
+        latency: float = 0.05,
+        paragraphs: int = 8,
+        forbidden_rate: float = 0.0,
+    ):
+        self.sites = sites
+        self.feeds_per_site = feeds_per_site
+        self.items_per_feed = items_per_feed
+        self.latency = latency
+        self.paragraphs = paragraphs
+        self.forbidden_rate = forbidden_rate
+        self.forbidden = 0
+        self.published = datetime.now(timezone.utc)
+        self.requests = 0
+        self.not_modified = 0
+        self._counter_lock = threading.Lock()
+        self._servers: List[ThreadingHTTPServer] = []
+        self._threads: List[threading.Thread] = []
+
+    def _handler(self, site: int):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                with server._counter_lock:
+                    server.requests += 1
+                parts = self.path.strip("/").split("/")
+                base_url = f"http://{self.headers.get('Host')}"
+                etag = None
+                if len(parts) == 2 and parts[0] == "feed":
+                    feed = int(parts[1].split(".")[0])
+                    body = render_feed(base_url, site, feed, server.items_per_feed, server.published)
+                    content_type = "application/rss+xml"
+                    etag = '"' + hashlib.md5(body.encode("utf-8")).hexdigest() + '"'
+                    if self.headers.get("If-None-Match") == etag:
+                        with server._counter_lock:
+                            server.not_modified += 1
+                        self.send_response(304)
+                        self.send_header("ETag", etag)
+                        self.end_headers()
+                        return
+                elif len(parts) == 3 and parts[0] == "article":
+                    if server.is_forbidden(site, self.path):
+                        with server._counter_lock:
+                            server.forbidden += 1
+                        self.send_error(403)
+                        return
+                    feed, item = int(parts[1]), int(parts[2].split(".")[0])
+                    body = render_article(site, feed, item, server.paragraphs)
+                    content_type = "text/html"
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                if etag:
+                    self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(payload)
+
+        return Handler
+
+    def is_forbidden(self, site: int, path: str) -> bool:
+        """Deterministically pick ``forbidden_rate`` of article paths to answer 403."""
+        digest = hashlib.md5(f"{site}{path}".encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], "big") / 2 ** 32 < self.forbidden_rate
+
+    def start(self) -> "StandInNewsServer":
+        for site in range(self.sites):
+            httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler(site))
+            httpd.daemon_threads = True
+            thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+            thread.start()
+            self._servers.append(httpd)
+            self._threads.append(thread)
+        return self
+
+    def stop(self) -> None:
+        for httpd in self._servers:
+            httpd.shutdown()
+            httpd.server_close()
+        self._servers.clear()
+        self._threads.clear()
+
+    def __enter__(self) -> "StandInNewsServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    @property
+    def site_urls(self) -> List[str]:
+        return [f"http://127.0.0.1:{httpd.server_address[1]}" for httpd in self._servers]
+
+    @property
+    def feed_urls(self) -> List[str]:
+        return [
+            f"{base}/feed/{feed}.xml"
+            for base in self.site_urls
+            for feed in range(self.feeds_per_site)
+        ]
@@ -0,0 +1,134 @@
+"""Synthetic news corpora with known story clusters, for curation benchmarks.
+
+Each topic is covered by one or more sources. Sources reword the title
+(reordering, dropping words, adding a site tag) and either syndicate the
+topic's copy with light edits or rewrite it from the same facts. Topics
+share a pool of common companies and buzzwords, so unrelated stories
+overlap the way real tech headlines do. Every story carries its ground-truth
+``topic`` id.
+"""
+
+import random
+from datetime import datetime, timedelta
+from itertools import combinations
+from typing import Any, Dict, List, Sequence, Tuple
+
+COMPANIES = [
+    "Apple", "Google", "Microsoft", "Amazon", "Meta", "Nvidia", "OpenAI",
+    "Anthropic", "Tesla", "Samsung", "Intel", "AMD", "Coinbase", "Binance",
+]
+BUZZWORDS = ["AI", "model", "chip", "cloud", "launch", "deal", "data", "security", "crypto", "app"]
+VERBS = ["unveils", "launches", "delays", "cuts", "buys", "sues", "expands", "tests", "drops", "ships"]
+SYLLABLES = [c + v for c in "bcdfghjklmnprstvwxz" for v in "aeiou"]
+SITE_TAGS = ["", "", " - Reuters", " | TechDaily", "Report: ", "Exclusive: "]
+TITLE_TEMPLATES = [
+    "{company} {verb} {words}",
+    "{words} as {company} {verb} {extra}",
+    "{company} {verb} {words} after {extra}",
+]
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _sentence(rng: random.Random, words: Sequence[str], vocabulary: Sequence[str]) -> str:
+    picked = [rng.choice(words) if rng.random() < 0.4 else rng.choice(vocabulary)
+              for _ in range(rng.randint(8, 16))]
+    if rng.random() < 0.3:
+        picked.insert(rng.randrange(len(picked)), f"{rng.randint(2, 90)}%")
+    if rng.random() < 0.3:
+        picked.insert(rng.randrange(len(picked)), rng.choice(BUZZWORDS))
+    return " ".join(picked).capitalize()
+
+
+def _topic(rng: random.Random, vocabulary: Sequence[str], sentence_range: Tuple[int, int]) -> Dict[str, Any]:
+    company = rng.choice(COMPANIES)
+    words = rng.sample(vocabulary, 6) + [rng.choice(BUZZWORDS)]
+    sentences = [_sentence(rng, words, vocabulary) for _ in range(rng.randint(*sentence_range))]
+    return {
+        "company": company,
+        "verb": rng.choice(VERBS),
+        "template": rng.choice(TITLE_TEMPLATES),
+        "extra": rng.choice(vocabulary),
+        "words": words,
+        "sentences": sentences,
+    }
+
+
+def _source_title(rng: random.Random, topic: Dict[str, Any]) -> str:
+    words = list(topic["words"][:4])
+    if rng.random() < 0.3:
+        rng.shuffle(words)
+    if rng.random() < 0.3:
+        words.pop(rng.randrange(len(words)))
+    tag = rng.choice(SITE_TAGS)
+    title = topic["template"].format(
+        company=topic["company"], verb=topic["verb"], words=" ".join(words), extra=topic["extra"]
+    )
+    return f"{tag}{title}" if tag.endswith(" ") else f"{title}{tag}"
+
+
+def _source_content(rng: random.Random, topic: Dict[str, Any]) -> str:
+    sentences = list(topic["sentences"])
+    if rng.random() < 0.5:
+        # Syndicated copy with a small edit
+        sentences[rng.randrange(len(sentences))] = f"{topic['company']} declined to comment"
+    else:
+        # Rewrite: same facts, different order, some sentences dropped
+        rng.shuffle(sentences)
+        sentences = sentences[:max(3, len(sentences) - 2)]
+    return ". ".join(sentences) + "."
+
+
+def synthetic_stories(
+    count: int,
+    max_sources: int = 4,
+    seed: int = 0,
+    sentences: Tuple[int, int] = (6, 10)
+) -> List[Dict[str, Any]]:
+    """Generate ``count`` stories; each topic has 1..``max_sources`` sources.
+
+    Each topic's copy has ``sentences`` (min, max) sentences of 8-16 words,
+    which controls content length. Stories are shuffled, so sources of one
+    topic arrive spread out.
+    """
+    rng = random.Random(seed)
+    vocabulary = sorted({_word(rng) for _ in range(max(200, count))})
+    now = datetime.now()
+    stories: List[Dict[str, Any]] = []
+    topic_id = 0
+    while len(stories) < count:
+        topic = _topic(rng, vocabulary, sentences)
+        for source in range(min(rng.randint(1, max_sources), count - len(stories))):
+            stories.append({
+                "title": _source_title(rng, topic),
+                "content": _source_content(rng, topic),
+                "link": f"https://site{source}.example/{topic_id}",
+                "published": now - timedelta(hours=rng.randint(0, 48)),
+                "topic": topic_id,
+            })
+        topic_id += 1
+    rng.shuffle(stories)
+    return stories
+
+
+def _same_cluster_pairs(labels: Sequence[Any]) -> set:
+    groups: Dict[Any, List[int]] = {}
+    for i, label in enumerate(labels):
+        groups.setdefault(label, []).append(i)
+    return {pair for members in groups.values() for pair in combinations(members, 2)}
+
+
+def pairwise_scores(predicted: Sequence[Any], truth: Sequence[Any]) -> Tuple[float, float, float]:
+    """Pairwise precision, recall and F1 of a clustering against ground truth.
+
+    Both arguments give one cluster label per story, in the same order.
+    """
+    predicted_pairs = _same_cluster_pairs(predicted)
+    true_pairs = _same_cluster_pairs(truth)
+    hits = len(predicted_pairs & true_pairs)
+    precision = hits / len(predicted_pairs) if predicted_pairs else 1.0
+    recall = hits / len(true_pairs) if true_pairs else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
@@ -0,0 +1,254 @@
+"""Cross-run store of story clusters for incremental curation.
+
+Keeps the members of recent story clusters (article key, title, content
+sample and content MinHash signature) in SQLite. Each run restores them
+into an :class:`IncrementalStoryCombiner` without comparing them again and
+then adds the new articles: an article joins the stored cluster it matches
+or starts a new one, and an article matching two stored clusters merges
+them. Clusters that have not gained a member within the retention window
+expire, and the members a cluster gained in the runs before the current
+one give it a growth rate, so curation can favour developing stories.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+from article_record import content_prefix
+from seen_index import entry_keys
+from topic_curator import IncrementalStoryCombiner, content_signature
+
+logger = logging.getLogger(__name__)
+
+# Default store location and retention
+DEFAULT_CLUSTER_STORE_PATH = "./data/story_clusters.db"
+DEFAULT_RETENTION_HOURS = 72
+
+# Window before the current run over which cluster growth is measured
+# (covers the previous two runs of a daily schedule)
+GROWTH_WINDOW_HOURS = 48
+
+# Content kept per member (what the similarity check compares)
+CONTENT_SAMPLE_CHARS = 500
+
+
+def article_key(story: Dict[str, Any]) -> str:
+    """Return the key identifying an article across runs (link, GUID or title)."""
+    keys = entry_keys(story.get('link'), story.get('guid'))
+    return keys[0] if keys else f"title:{story.get('title', '')}"
+
+
+def _decode_signature(blob: Optional[bytes]) -> Optional[np.ndarray]:
+    return np.frombuffer(blob, dtype=np.uint64) if blob else None
+
+
+class ClusterStore:
+    """SQLite-backed story clusters that persist between runs.
+
+    Usage:
+        store = ClusterStore()
+        clusters = store.cluster(iter_recent_articles())   # {cluster_id: [stories]}
+        rates = store.growth_rates(clusters)
+    """
+
+    def __init__(
+        self,
+        store_path: str = DEFAULT_CLUSTER_STORE_PATH,
+        retention_hours: float = DEFAULT_RETENTION_HOURS
+    ):
+        self.store_path = store_path
+        self.retention_hours = retention_hours
+        self._lock = threading.Lock()
+        # Insert time and article keys of the latest cluster() run; growth
+        # is measured before it and never counts the run's own articles
+        self.run_started: Optional[float] = None
+        self.run_keys: Set[str] = set()
+        os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(store_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS clusters ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cluster_members ("
+                "article_key TEXT PRIMARY KEY, cluster_id INTEGER NOT NULL, "
+                "title TEXT NOT NULL, content TEXT NOT NULL, signature BLOB, "
+                "added_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_members_cluster ON cluster_members (cluster_id)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_clusters_updated ON clusters (updated_at)"
+            )
+        self.prune()
+
+    def cluster(self, stories: Iterable[Dict[str, Any]]) -> Dict[int, List[Dict[str, Any]]]:
+        """Assign stories to stored clusters (or new ones) and persist them.
+
+        ``stories`` may be a generator that is still fetching; each story
+        is clustered as it arrives. Articles stored by an earlier run are
+        not added again, but are still returned with their cluster.
+
+        Returns:
+            This run's stories grouped by cluster id, in order of first appearance
+        """
+        self.prune()
+        combiner = IncrementalStoryCombiner()
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT cluster_id, title, content, signature FROM cluster_members "
+                "ORDER BY cluster_id, added_at"
+            ).fetchall()
+        stored_ids: List[int] = []
+        first_member: Dict[int, int] = {}
+        for cluster_id, title, content, signature in rows:
+            combiner.restore(
+                {'title': title, 'content': content},
+                _decode_signature(signature),
+                first_member.get(cluster_id),
+            )
+            first_member.setdefault(cluster_id, len(stored_ids))
+            stored_ids.append(cluster_id)
+
+        new_stories: List[Dict[str, Any]] = []
+        signatures: List[Optional[np.ndarray]] = []
+        self.run_keys = set()
+        for story in stories:
+            signature = content_signature(story)
+            combiner.add(story, signature)
+            new_stories.append(story)
+            signatures.append(signature)
+            self.run_keys.add(article_key(story))
+
+        labels = combiner.labels()
+        # Each component keeps its oldest stored cluster id; others merge into it
+        targets: Dict[int, int] = {}
+        merged: Dict[int, int] = {}
+        for label, cluster_id in zip(labels, stored_ids):
+            target = targets.setdefault(label, cluster_id)
+            if cluster_id != target:
+                merged[cluster_id] = target
+
+        now = time.time()
+        self.run_started = now
+        grouped: Dict[int, List[Dict[str, Any]]] = {}
+        grown = set()
+        with self._lock, self._conn:
+            for old, target in merged.items():
+                self._conn.execute(
+                    "UPDATE clusters SET "
+                    "created_at = MIN(created_at, (SELECT created_at FROM clusters WHERE id = :old)), "
+                    "updated_at = MAX(updated_at, (SELECT updated_at FROM clusters WHERE id = :old)) "
+                    "WHERE id = :target", {"old": old, "target": target}
+                )
+                self._conn.execute(
+                    "UPDATE cluster_members SET cluster_id = ? WHERE cluster_id = ?", (target, old)
+                )
+                self._conn.execute("DELETE FROM clusters WHERE id = ?", (old,))
+
+            for story, signature, label in zip(new_stories, signatures, labels[len(stored_ids):]):
+                if label not in targets:
+                    cursor = self._conn.execute(
+                        "INSERT INTO clusters (created_at, updated_at) VALUES (?, ?)", (now, now)
+                    )
+                    targets[label] = cursor.lastrowid
+                cluster_id = targets[label]
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO cluster_members "
+                    "(article_key, cluster_id, title, content, signature, added_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        article_key(story), cluster_id, story.get('title', '') or '',
+                        content_prefix(story, CONTENT_SAMPLE_CHARS),
+                        signature.tobytes() if signature is not None else None, now,
+                    ),
+                )
+                if cursor.rowcount:
+                    grown.add(cluster_id)
+                grouped.setdefault(cluster_id, []).append(story)
+
+            self._conn.executemany(
+                "UPDATE clusters SET updated_at = ? WHERE id = ?", [(now, i) for i in grown]
+            )
+
+        logger.info(
+            f"Clustered {len(new_stories)} stories against {len(first_member)} stored clusters: "
+            f"{len(grouped)} clusters, {len(merged)} merged"
+        )
+        return grouped
+
+    def growth_rates(
+        self,
+        cluster_ids: Iterable[int],
+        window_hours: float = GROWTH_WINDOW_HOURS,
+        before: Optional[float] = None
+    ) -> Dict[int, float]:
+        """Members added per day within the window, per cluster id.
+
+        The window ends at ``before`` (default: the start of the latest
+        :meth:`cluster` run), so the articles of the current run, which
+        ``source_count`` already rewards, do not count as growth. Articles
+        of that run stored by an earlier one (a rerun after a failed
+        episode refetches them) are left out too.
+        """
+        ids = list(cluster_ids)
+        if not ids:
+            return {}
+        end = before if before is not None else self.run_started or time.time()
+        start = end - window_hours * 3600
+        placeholders = ",".join("?" * len(ids))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT cluster_id, article_key FROM cluster_members "
+                f"WHERE added_at >= ? AND added_at < ? AND cluster_id IN ({placeholders})",
+                [start, end, *ids],
+            ).fetchall()
+        counts = Counter(cluster_id for cluster_id, key in rows if key not in self.run_keys)
+        days = window_hours / 24
+        return {cluster_id: counts[cluster_id] / days for cluster_id in ids}
+
+    def prune(self, retention_hours: Optional[float] = None) -> int:
+        """Delete clusters that gained no member within the retention window.
+
+        Returns:
+            Number of clusters removed
+        """
+        hours = self.retention_hours if retention_hours is None else retention_hours
+        cutoff = time.time() - hours * 3600
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM cluster_members WHERE cluster_id IN "
+                "(SELECT id FROM clusters WHERE updated_at < ?)", (cutoff,)
+            )
+            cursor = self._conn.execute("DELETE FROM clusters WHERE updated_at < ?", (cutoff,))
+        if cursor.rowcount:
+            logger.info(f"Expired {cursor.rowcount} story clusters")
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM clusters").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# Singleton instance for easy access
+_cluster_store: Optional[ClusterStore] = None
+
+
+def get_cluster_store(store_path: str = DEFAULT_CLUSTER_STORE_PATH) -> ClusterStore:
+    """Get or create the cluster store singleton."""
+    global _cluster_store
+    if _cluster_store is None:
+        _cluster_store = ClusterStore(store_path)
+    return _cluster_store
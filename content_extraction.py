@@ -43,6 +43,21 @@ def extract_youtube_transcript(url: str) -> str:
 
 
 def extract_website_content(url: str) -> str:
+    """Extract content from a website, reusing the on-disk article cache."""
+    from article_cache import get_article_cache
+
+    cache = get_article_cache()
+    cached = cache.get(url, namespace="website")
+    if cached is not None:
+        return cached
+
+    content = _extract_website_content(url)
+    if content:
+        cache.put(url, content, namespace="website")
+    return content
+
+
+def _extract_website_content(url: str) -> str:
     """Extract content from a website using newspaper3k."""
     from newspaper import Article
 
@@ -0,0 +1,219 @@
+"""Per-domain health tracking and circuit breaking for article downloads.
+
+Records success/failure and latency for every news domain across runs.
+Domains that keep failing (403s, timeouts, connection errors) get an open
+circuit: their articles fall straight through to the RSS summary without a
+request. After a cooldown a single half-open probe is allowed; success
+closes the circuit, failure re-opens it with a longer cooldown.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Default state file location
+DEFAULT_DOMAIN_HEALTH_PATH = "./data/domain_health.json"
+
+# Circuit breaker tuning
+FAILURE_THRESHOLD = 3                      # Consecutive failures before opening
+OPEN_COOLDOWN_SECONDS = 6 * 3600           # First wait before a half-open probe
+MAX_COOLDOWN_SECONDS = 7 * 24 * 3600       # Cap for repeated failed probes
+EWMA_ALPHA = 0.3                           # Weight of the newest observation
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Second-level labels under which registrable domains have three labels
+SECOND_LEVEL_LABELS = {"co", "com", "org", "net", "ac", "gov", "edu"}
+
+
+def domain_of(url: str) -> str:
+    """Return the registrable domain of a URL (``news.bbc.co.uk`` -> ``bbc.co.uk``)."""
+    host = (urlparse(url).hostname or "").lower()
+    labels = host.split(".")
+    if host.replace(".", "").isdigit() or ":" in host:
+        return host  # IP address
+    if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in SECOND_LEVEL_LABELS:
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+@dataclass
+class DomainStats:
+    """Health record for one domain."""
+    domain: str
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    failure_rate: float = 0.0     # EWMA of failures (0-1)
+    avg_latency: float = 0.0      # EWMA of request latency in seconds
+    state: str = CLOSED
+    opened_at: float = 0.0
+    cooldown: float = OPEN_COOLDOWN_SECONDS
+    probe_in_flight: bool = False
+
+
+class DomainHealthTracker:
+    """Thread-safe, persistent circuit breaker keyed by domain."""
+
+    def __init__(
+        self,
+        state_path: str = DEFAULT_DOMAIN_HEALTH_PATH,
+        seed_blocked: Iterable[str] = (),
+        failure_threshold: int = FAILURE_THRESHOLD,
+        clock: Callable[[], float] = time.time
+    ):
+        self.state_path = state_path
+        self.failure_threshold = failure_threshold
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._domains: Dict[str, DomainStats] = self._load()
+
+        # Domains known to block scrapers start with an open circuit
+        for domain in seed_blocked:
+            if domain not in self._domains:
+                self._domains[domain] = DomainStats(
+                    domain=domain, state=OPEN, opened_at=self._clock()
+                )
+
+    def _load(self) -> Dict[str, DomainStats]:
+        """Load domain records from disk."""
+        if os.path.exists(self.state_path):
+            try:
+                with open(self.state_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                domains = {d: DomainStats(**stats) for d, stats in data.get("domains", {}).items()}
+                for stats in domains.values():
+                    stats.probe_in_flight = False
+                return domains
+            except (json.JSONDecodeError, IOError, TypeError) as e:
+                logger.warning(f"Could not load domain health: {e}. Starting fresh.")
+        return {}
+
+    def save(self) -> None:
+        """Write domain records to disk."""
+        with self._lock:
+            data = {"domains": {d: asdict(s) for d, s in self._domains.items()}}
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.state_path)
+
+    def _stats(self, url: str) -> DomainStats:
+        domain = domain_of(url)
+        stats = self._domains.get(domain)
+        if stats is None:
+            stats = self._domains[domain] = DomainStats(domain=domain)
+        return stats
+
+    def get(self, url: str) -> Optional[DomainStats]:
+        """Return the health record for a URL's domain, if any."""
+        with self._lock:
+            return self._domains.get(domain_of(url))
+
+    def is_open(self, url: str) -> bool:
+        """Check whether requests to this domain are currently short-circuited."""
+        with self._lock:
+            stats = self._domains.get(domain_of(url))
+            if stats is None or stats.state == CLOSED:
+                return False
+            if stats.state == OPEN:
+                return self._clock() - stats.opened_at < stats.cooldown
+            return stats.probe_in_flight
+
+    def allow_request(self, url: str) -> bool:
+        """Decide whether to request a URL, starting a half-open probe when due."""
+        with self._lock:
+            stats = self._stats(url)
+            if stats.state == CLOSED:
+                return True
+            if stats.state == OPEN:
+                if self._clock() - stats.opened_at < stats.cooldown:
+                    return False
+                stats.state = HALF_OPEN
+            if stats.probe_in_flight:
+                return False
+            stats.probe_in_flight = True
+            logger.info(f"Probing domain {stats.domain} (half-open)")
+            return True
+
+    def record_success(self, url: str, latency: float) -> None:
+        """Record a successful request; closes a half-open circuit."""
+        with self._lock:
+            stats = self._stats(url)
+            stats.successes += 1
+            stats.consecutive_failures = 0
+            stats.failure_rate = (1 - EWMA_ALPHA) * stats.failure_rate
+            stats.avg_latency = self._ewma(stats.avg_latency, latency, stats)
+            if stats.state != CLOSED:
+                logger.info(f"Domain {stats.domain} recovered; closing circuit")
+            stats.state = CLOSED
+            stats.cooldown = OPEN_COOLDOWN_SECONDS
+            stats.probe_in_flight = False
+
+    def release_probe(self, url: str) -> None:
+        """End a request that says nothing about health; a half-open circuit probes again."""
+        with self._lock:
+            stats = self._domains.get(domain_of(url))
+            if stats is not None:
+                stats.probe_in_flight = False
+
+    def record_failure(self, url: str, latency: float) -> None:
+        """Record a failed request; opens the circuit when failures persist."""
+        with self._lock:
+            stats = self._stats(url)
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            stats.failure_rate = (1 - EWMA_ALPHA) * stats.failure_rate + EWMA_ALPHA
+            stats.avg_latency = self._ewma(stats.avg_latency, latency, stats)
+
+            if stats.state == HALF_OPEN:
+                stats.cooldown = min(stats.cooldown * 2, MAX_COOLDOWN_SECONDS)
+                self._open(stats)
+            elif stats.state == CLOSED and stats.consecutive_failures >= self.failure_threshold:
+                self._open(stats)
+            stats.probe_in_flight = False
+
+    def _open(self, stats: DomainStats) -> None:
+        stats.state = OPEN
+        stats.opened_at = self._clock()
+        logger.warning(
+            f"Opening circuit for {stats.domain} for {stats.cooldown / 3600:.1f}h "
+            f"(failure rate {stats.failure_rate:.0%})"
+        )
+
+    @staticmethod
+    def _ewma(current: float, value: float, stats: DomainStats) -> float:
+        if stats.successes + stats.failures == 1:
+            return value
+        return (1 - EWMA_ALPHA) * current + EWMA_ALPHA * value
+
+    def snapshot(self) -> Dict[str, DomainStats]:
+        """Return a copy of all domain records."""
+        with self._lock:
+            return {d: DomainStats(**asdict(s)) for d, s in self._domains.items()}
+
+
+# Singleton instance for easy access
+_domain_health: Optional[DomainHealthTracker] = None
+
+
+def get_domain_health(
+    state_path: str = DEFAULT_DOMAIN_HEALTH_PATH,
+    seed_blocked: Iterable[str] = ()
+) -> DomainHealthTracker:
+    """Get or create the domain health singleton."""
+    global _domain_health
+    if _domain_health is None:
+        _domain_health = DomainHealthTracker(state_path, seed_blocked=seed_blocked)
+    return _domain_health
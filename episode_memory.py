@@ -4,19 +4,29 @@ Provides continuity between episodes by storing:
 - Past predictions and whether they came true
 - Key topics covered to avoid repetition
 - Running storylines to follow up on
+
+Memory is stored in SQLite by default; a ``.json`` memory path keeps it in
+a JSON snapshot with an append-only journal (see journal_store). The SQLite store imports an existing JSON
+memory file with the same name on first load.
 """
 
+import bisect
 import json
 import logging
 import os
+import sqlite3
+import threading
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, field, asdict, fields
+
+from journal_store import JournalStore
+from prediction_index import PredictionKeywordIndex
 
 logger = logging.getLogger(__name__)
 
-# Default memory file location
-DEFAULT_MEMORY_PATH = "./data/episode_memory.json"
+# Default memory location (a ``.json`` path selects the JSON file store)
+DEFAULT_MEMORY_PATH = "./data/episode_memory.db"
 
 
 @dataclass
@@ -52,39 +62,323 @@ class EpisodeMemory:
     last_updated: str = field(default_factory=lambda: datetime.now().isoformat())
 
 
+PREDICTION_FIELDS = tuple(f.name for f in fields(Prediction))
+EPISODE_LIST_FIELDS = ("topics_covered", "predictions_made", "key_stories", "callbacks_used")
+
+
+def _prediction_date(pred: Dict[str, Any]) -> Optional[datetime]:
+    """Parsed ``episode_date`` of a prediction; None if missing or malformed."""
+    try:
+        return datetime.strptime(pred['episode_date'], "%Y-%m-%d")
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _memory_state(memory: EpisodeMemory) -> Dict[str, Any]:
+    """JSON-ready view of memory sharing its lists (no copy)."""
+    return {
+        'predictions': memory.predictions,
+        'episodes': memory.episodes,
+        'recurring_topics': memory.recurring_topics,
+        'last_updated': memory.last_updated,
+    }
+
+
+def _apply_memory_record(state: Dict[str, Any], record: Dict[str, Any]) -> Dict[str, Any]:
+    """Replay one journaled memory change."""
+    predictions = state.setdefault('predictions', [])
+    op = record.get('op')
+    if op == 'add_prediction':
+        predictions.append(record['prediction'])
+    elif op == 'update_prediction':
+        predictions[record['index']] = record['prediction']
+    elif op == 'record_episode':
+        state.setdefault('episodes', []).append(record['episode'])
+        topics = state.setdefault('recurring_topics', {})
+        for topic in record['episode'].get('topics_covered', []):
+            topics[topic] = topics.get(topic, 0) + 1
+        predictions.extend(record['predictions'])
+    else:
+        logger.warning(f"Skipping unknown memory journal record: {op}")
+    state['last_updated'] = record.get('last_updated', state.get('last_updated'))
+    return state
+
+
+def _read_json_memory(path: str) -> Optional[EpisodeMemory]:
+    """Read a JSON memory file and its journal; None if neither exists."""
+    store = JsonMemoryStore(path)
+    return store.load() if store._journal.exists() else None
+
+
+def _prediction_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    prediction = {name: row[name] for name in PREDICTION_FIELDS}
+    prediction['resolved'] = bool(prediction['resolved'])
+    return prediction
+
+
+def _episode_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    episode = {'date': row['date'], 'main_theme': row['main_theme']}
+    for name in EPISODE_LIST_FIELDS:
+        episode[name] = json.loads(row[name]) if row[name] else []
+    return episode
+
+
+class JsonMemoryStore:
+    """Episode memory in a JSON snapshot plus an append-only journal of changes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._journal = JournalStore(path, _apply_memory_record)
+
+    def load(self) -> EpisodeMemory:
+        """Load memory from disk."""
+        data = self._journal.load({})
+        if not isinstance(data, dict):
+            logger.warning(f"Memory file {self.path} is not a JSON object. Starting fresh.")
+            data = {}
+        return EpisodeMemory(
+            predictions=data.get('predictions', []),
+            episodes=data.get('episodes', []),
+            recurring_topics=data.get('recurring_topics', {}),
+            last_updated=data.get('last_updated') or datetime.now().isoformat()
+        )
+
+    def _log(self, memory: EpisodeMemory, record: Dict[str, Any]) -> None:
+        record['last_updated'] = memory.last_updated
+        self._journal.append(record, _memory_state(memory))
+
+    def add_prediction(self, memory: EpisodeMemory, prediction: Dict[str, Any]) -> None:
+        self._log(memory, {'op': 'add_prediction', 'prediction': prediction})
+
+    def update_prediction(self, memory: EpisodeMemory, index: int) -> None:
+        self._log(memory, {'op': 'update_prediction', 'index': index, 'prediction': memory.predictions[index]})
+
+    def record_episode(
+        self,
+        memory: EpisodeMemory,
+        episode: Dict[str, Any],
+        predictions: List[Dict[str, Any]]
+    ) -> None:
+        self._log(memory, {'op': 'record_episode', 'episode': episode, 'predictions': predictions})
+
+    def close(self) -> None:
+        pass
+
+
+class SqliteMemoryStore:
+    """Episode memory in SQLite (WAL mode), written one row per change.
+
+    Episodes, predictions and topic counts live in indexed tables, and
+    recording an episode (with its predictions and topic counts) is a single
+    transaction. On first use the store imports the JSON memory file next to
+    it (same name, ``.json`` extension) if one exists.
+    """
+
+    def __init__(self, path: str, legacy_path: Optional[str] = None):
+        self.path = path
+        self.legacy_path = legacy_path or os.path.splitext(path)[0] + ".json"
+        self._lock = threading.Lock()
+        # Row ids of the loaded predictions, aligned with memory.predictions
+        self._prediction_ids: List[int] = []
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS episodes ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT NOT NULL, "
+                "main_theme TEXT NOT NULL, topics_covered TEXT, predictions_made TEXT, "
+                "key_stories TEXT, callbacks_used TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS predictions ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, text TEXT NOT NULL, "
+                "episode_date TEXT NOT NULL, topic TEXT, confidence TEXT, "
+                "resolved INTEGER NOT NULL DEFAULT 0, outcome TEXT, "
+                "resolution_date TEXT, resolution_notes TEXT)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS topic_counts ("
+                "topic TEXT PRIMARY KEY, count INTEGER NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS memory_meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_episodes_date ON episodes (date)")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_predictions_open ON predictions (resolved, episode_date)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_predictions_text ON predictions (text)")
+        if self._meta('last_updated') is None:
+            self._migrate()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM memory_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _touch(self, last_updated: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO memory_meta (key, value) VALUES ('last_updated', ?)",
+            (last_updated,)
+        )
+
+    def _insert_prediction(self, prediction: Dict[str, Any]) -> int:
+        cursor = self._conn.execute(
+            f"INSERT INTO predictions ({', '.join(PREDICTION_FIELDS)}) "
+            f"VALUES ({', '.join('?' * len(PREDICTION_FIELDS))})",
+            [prediction.get(name) for name in PREDICTION_FIELDS]
+        )
+        return cursor.lastrowid
+
+    def _insert_episode(self, episode: Dict[str, Any]) -> None:
+        self._conn.execute(
+            f"INSERT INTO episodes (date, main_theme, {', '.join(EPISODE_LIST_FIELDS)}) "
+            f"VALUES (?, ?, {', '.join('?' * len(EPISODE_LIST_FIELDS))})",
+            [episode.get('date', ''), episode.get('main_theme', '')]
+            + [json.dumps(episode.get(name) or [], default=str) for name in EPISODE_LIST_FIELDS]
+        )
+
+    def _migrate(self) -> None:
+        """Import the legacy JSON memory file in one transaction."""
+        memory = _read_json_memory(self.legacy_path)
+        if memory is None:
+            return
+        with self._lock, self._conn:
+            for prediction in memory.predictions:
+                self._insert_prediction({
+                    **asdict(Prediction(text='', episode_date='', topic='')), **prediction
+                })
+            for episode in memory.episodes:
+                self._insert_episode(episode)
+            self._conn.executemany(
+                "INSERT INTO topic_counts (topic, count) VALUES (?, ?)",
+                memory.recurring_topics.items()
+            )
+            self._touch(memory.last_updated)
+        logger.info(
+            f"Migrated {len(memory.episodes)} episodes and {len(memory.predictions)} predictions "
+            f"from {self.legacy_path} to {self.path}"
+        )
+
+    def load(self) -> EpisodeMemory:
+        """Load memory from the database."""
+        with self._lock:
+            predictions = self._conn.execute(
+                f"SELECT id, {', '.join(PREDICTION_FIELDS)} FROM predictions ORDER BY id"
+            ).fetchall()
+            episodes = self._conn.execute("SELECT * FROM episodes ORDER BY id").fetchall()
+            topics = self._conn.execute("SELECT topic, count FROM topic_counts").fetchall()
+            last_updated = self._meta('last_updated')
+        self._prediction_ids = [row['id'] for row in predictions]
+        return EpisodeMemory(
+            predictions=[_prediction_from_row(row) for row in predictions],
+            episodes=[_episode_from_row(row) for row in episodes],
+            recurring_topics={row['topic']: row['count'] for row in topics},
+            last_updated=last_updated or datetime.now().isoformat()
+        )
+
+    def add_prediction(self, memory: EpisodeMemory, prediction: Dict[str, Any]) -> None:
+        with self._lock, self._conn:
+            self._prediction_ids.append(self._insert_prediction(prediction))
+            self._touch(memory.last_updated)
+
+    def update_prediction(self, memory: EpisodeMemory, index: int) -> None:
+        prediction = memory.predictions[index]
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE predictions SET resolved = ?, outcome = ?, resolution_date = ?, "
+                "resolution_notes = ? WHERE id = ?",
+                (prediction['resolved'], prediction['outcome'], prediction['resolution_date'],
+                 prediction['resolution_notes'], self._prediction_ids[index])
+            )
+            self._touch(memory.last_updated)
+
+    def record_episode(
+        self,
+        memory: EpisodeMemory,
+        episode: Dict[str, Any],
+        predictions: List[Dict[str, Any]]
+    ) -> None:
+        with self._lock, self._conn:
+            self._insert_episode(episode)
+            for topic in episode['topics_covered']:
+                self._conn.execute(
+                    "INSERT INTO topic_counts (topic, count) VALUES (?, 1) "
+                    "ON CONFLICT (topic) DO UPDATE SET count = count + 1", (topic,)
+                )
+            self._prediction_ids.extend(self._insert_prediction(p) for p in predictions)
+            self._touch(memory.last_updated)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_memory_store(memory_path: str):
+    """Open the store for a memory path: JSON for ``.json`` files, SQLite otherwise."""
+    if memory_path.endswith(".json"):
+        return JsonMemoryStore(memory_path)
+    return SqliteMemoryStore(memory_path)
+
+
 class EpisodeMemoryManager:
     """Manages episode memory persistence and retrieval."""
 
     def __init__(self, memory_path: str = DEFAULT_MEMORY_PATH):
         self.memory_path = memory_path
         self._ensure_directory()
-        self.memory = self._load_memory()
+        self.store = open_memory_store(memory_path)
+        self.memory = self.store.load()
+        # Indexes over memory.predictions, keyed by position: keywords and
+        # (date, position) of unresolved predictions, and track-record counts
+        self._keyword_index = PredictionKeywordIndex()
+        self._open_by_date: List[Tuple[datetime, int]] = []
+        self._resolved_total = 0
+        self._resolved_correct = 0
+        # (max_age_days, today) -> unresolved positions, cleared on any change
+        self._unresolved_cache: Dict[Tuple[int, str], List[int]] = {}
+        for position in range(len(self.memory.predictions)):
+            self._track_prediction(position)
 
     def _ensure_directory(self) -> None:
         """Ensure the memory directory exists."""
-        os.makedirs(os.path.dirname(self.memory_path), exist_ok=True)
-
-    def _load_memory(self) -> EpisodeMemory:
-        """Load memory from disk."""
-        if os.path.exists(self.memory_path):
-            try:
-                with open(self.memory_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                return EpisodeMemory(
-                    predictions=data.get('predictions', []),
-                    episodes=data.get('episodes', []),
-                    recurring_topics=data.get('recurring_topics', {}),
-                    last_updated=data.get('last_updated', datetime.now().isoformat())
-                )
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load memory file: {e}. Starting fresh.")
-        return EpisodeMemory()
-
-    def _save_memory(self) -> None:
-        """Save memory to disk."""
-        self.memory.last_updated = datetime.now().isoformat()
-        with open(self.memory_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(self.memory), f, indent=2, default=str)
+        os.makedirs(os.path.dirname(self.memory_path) or ".", exist_ok=True)
+
+    def _track_prediction(self, position: int) -> None:
+        """Add a prediction to the indexes according to its current state."""
+        pred = self.memory.predictions[position]
+        self._unresolved_cache.clear()
+        if pred.get('resolved'):
+            self._resolved_total += 1
+            self._resolved_correct += pred.get('outcome') == 'correct'
+            return
+        self._keyword_index.add(position, pred.get('text', '') or '')
+        pred_date = _prediction_date(pred)
+        if pred_date is not None:
+            bisect.insort(self._open_by_date, (pred_date, position))
+
+    def _untrack_prediction(self, position: int) -> None:
+        """Remove a prediction from the indexes before its state changes."""
+        pred = self.memory.predictions[position]
+        self._unresolved_cache.clear()
+        if pred.get('resolved'):
+            self._resolved_total -= 1
+            self._resolved_correct -= pred.get('outcome') == 'correct'
+            return
+        self._keyword_index.remove(position)
+        pred_date = _prediction_date(pred)
+        if pred_date is not None:
+            i = bisect.bisect_left(self._open_by_date, (pred_date, position))
+            if i < len(self._open_by_date) and self._open_by_date[i] == (pred_date, position):
+                del self._open_by_date[i]
+
+    def _new_prediction(self, text: str, topic: str, confidence: str = "medium") -> Dict[str, Any]:
+        return asdict(Prediction(
+            text=text,
+            episode_date=datetime.now().strftime("%Y-%m-%d"),
+            topic=topic,
+            confidence=confidence
+        ))
 
     def add_prediction(
         self,
@@ -93,14 +387,11 @@ class EpisodeMemoryManager:
         confidence: str = "medium"
     ) -> None:
         """Add a new prediction."""
-        prediction = Prediction(
-            text=text,
-            episode_date=datetime.now().strftime("%Y-%m-%d"),
-            topic=topic,
-            confidence=confidence
-        )
-        self.memory.predictions.append(asdict(prediction))
-        self._save_memory()
+        prediction = self._new_prediction(text, topic, confidence)
+        self.memory.predictions.append(prediction)
+        self._track_prediction(len(self.memory.predictions) - 1)
+        self.memory.last_updated = datetime.now().isoformat()
+        self.store.add_prediction(self.memory, prediction)
         logger.info(f"Added prediction: {text[:50]}...")
 
     def get_unresolved_predictions(
@@ -108,18 +399,20 @@ class EpisodeMemoryManager:
         max_age_days: int = 90
     ) -> List[Dict[str, Any]]:
         """Get predictions that haven't been resolved yet."""
-        cutoff = datetime.now() - timedelta(days=max_age_days)
-        unresolved = []
-        for pred in self.memory.predictions:
-            if pred.get('resolved'):
-                continue
-            try:
-                pred_date = datetime.strptime(pred['episode_date'], "%Y-%m-%d")
-                if pred_date > cutoff:
-                    unresolved.append(pred)
-            except (ValueError, KeyError):
-                continue
-        return unresolved
+        return [self.memory.predictions[p] for p in self._unresolved_positions(max_age_days)]
+
+    def _unresolved_positions(self, max_age_days: int = 90) -> List[int]:
+        """Positions of unresolved predictions newer than the cutoff, in order."""
+        now = datetime.now()
+        key = (max_age_days, now.strftime("%Y-%m-%d"))
+        positions = self._unresolved_cache.get(key)
+        if positions is None:
+            cutoff = now - timedelta(days=max_age_days)
+            # Dates are midnights, so the result only changes when the day does
+            start = bisect.bisect_right(self._open_by_date, (cutoff, float('inf')))
+            positions = sorted(p for _, p in self._open_by_date[start:])
+            self._unresolved_cache[key] = positions
+        return positions
 
     def resolve_prediction(
         self,
@@ -128,13 +421,16 @@ class EpisodeMemoryManager:
         notes: Optional[str] = None
     ) -> bool:
         """Mark a prediction as resolved."""
-        for pred in self.memory.predictions:
+        for index, pred in enumerate(self.memory.predictions):
             if pred['text'] == prediction_text:
+                self._untrack_prediction(index)
                 pred['resolved'] = True
                 pred['outcome'] = outcome
                 pred['resolution_date'] = datetime.now().strftime("%Y-%m-%d")
                 pred['resolution_notes'] = notes
-                self._save_memory()
+                self._track_prediction(index)
+                self.memory.last_updated = datetime.now().isoformat()
+                self.store.update_prediction(self.memory, index)
                 logger.info(f"Resolved prediction: {outcome}")
                 return True
         return False
@@ -147,7 +443,7 @@ class EpisodeMemoryManager:
         key_stories: List[str],
         callbacks_used: List[str] = None
     ) -> None:
-        """Record a new episode."""
+        """Record a new episode, its predictions and topic counts in one write."""
         episode = EpisodeRecord(
             date=datetime.now().strftime("%Y-%m-%d"),
             main_theme=main_theme,
@@ -156,7 +452,8 @@ class EpisodeMemoryManager:
             key_stories=key_stories,
             callbacks_used=callbacks_used or []
         )
-        self.memory.episodes.append(asdict(episode))
+        episode = asdict(episode)
+        self.memory.episodes.append(episode)
 
         # Update recurring topics count
         for topic in topics_covered:
@@ -164,10 +461,13 @@ class EpisodeMemoryManager:
                 self.memory.recurring_topics.get(topic, 0) + 1
 
         # Add predictions to tracking
-        for pred_text in predictions_made:
-            self.add_prediction(pred_text, main_theme)
+        predictions = [self._new_prediction(text, main_theme) for text in predictions_made]
+        for prediction in predictions:
+            self.memory.predictions.append(prediction)
+            self._track_prediction(len(self.memory.predictions) - 1)
 
-        self._save_memory()
+        self.memory.last_updated = datetime.now().isoformat()
+        self.store.record_episode(self.memory, episode, predictions)
         logger.info(f"Recorded episode with theme: {main_theme}")
 
     def get_recent_episodes(self, count: int = 5) -> List[Dict[str, Any]]:
@@ -183,25 +483,19 @@ class EpisodeMemoryManager:
         current_stories: List[Dict[str, Any]]
     ) -> List[Dict[str, str]]:
         """Find potential callbacks from past predictions to current stories."""
-        callbacks = []
-        unresolved = self.get_unresolved_predictions()
-
-        for pred in unresolved:
-            pred_text = pred.get('text', '').lower()
-            pred_keywords = [w for w in pred_text.split() if len(w) > 4]
+        candidates = set(self._unresolved_positions())
+        matched = self._keyword_index.first_matches(current_stories, candidates)
 
-            for story in current_stories:
-                story_text = f"{story.get('title', '')} {story.get('content', '')}".lower()
-                matches = sum(1 for kw in pred_keywords if kw in story_text)
-
-                if matches >= 2:
-                    callbacks.append({
-                        "prediction": pred.get('text', ''),
-                        "episode_date": pred.get('episode_date', 'a previous episode'),
-                        "related_story": story.get('title', ''),
-                        "match_strength": matches
-                    })
-                    break
+        callbacks = []
+        for position in sorted(matched):
+            pred = self.memory.predictions[position]
+            story, matches = matched[position]
+            callbacks.append({
+                "prediction": pred.get('text', ''),
+                "episode_date": pred.get('episode_date', 'a previous episode'),
+                "related_story": story.get('title', ''),
+                "match_strength": matches
+            })
 
         # Sort by match strength and return top 3
         callbacks.sort(key=lambda x: x['match_strength'], reverse=True)
@@ -238,15 +532,11 @@ class EpisodeMemoryManager:
                 lines.append(f"  Predictions: {', '.join(pred_texts)}...")
 
         # Add running scores
-        unresolved = self.get_unresolved_predictions()
-        resolved_correct = sum(
-            1 for p in self.memory.predictions
-            if p.get('resolved') and p.get('outcome') == 'correct'
-        )
-        resolved_total = sum(1 for p in self.memory.predictions if p.get('resolved'))
-
-        if resolved_total > 0:
-            lines.append(f"\nPREDICTION TRACK RECORD: {resolved_correct}/{resolved_total} correct")
+        unresolved = self._unresolved_positions()
+        if self._resolved_total > 0:
+            lines.append(
+                f"\nPREDICTION TRACK RECORD: {self._resolved_correct}/{self._resolved_total} correct"
+            )
         if unresolved:
             lines.append(f"PENDING PREDICTIONS: {len(unresolved)} still waiting to be verified")
 
@@ -0,0 +1,158 @@
+"""Persistent RSS feed cache with conditional GET support.
+
+Stores each feed's ETag, Last-Modified and parsed entries so repeated polls
+can send conditional requests and reuse the cached entries on a 304 instead
+of re-downloading and re-parsing unchanged feeds.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import feedparser
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Default cache file location
+DEFAULT_FEED_CACHE_PATH = "./data/feed_cache.json"
+
+# Per-request timeout for feed downloads (feedparser's own fetcher has none)
+FEED_TIMEOUT_SECONDS = 15
+
+# Entry fields kept in the cache (everything get_recent_articles reads)
+CACHED_ENTRY_FIELDS = ("id", "title", "link", "summary")
+
+
+def entry_to_dict(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a feedparser entry to a JSON-serializable dict."""
+    data = {key: entry.get(key) for key in CACHED_ENTRY_FIELDS if entry.get(key) is not None}
+    published = entry.get("published_parsed")
+    if published:
+        data["published_parsed"] = list(published)
+    return data
+
+
+def entry_from_dict(data: Dict[str, Any]) -> feedparser.FeedParserDict:
+    """Rebuild a feedparser-style entry from its cached form."""
+    entry = feedparser.FeedParserDict(data)
+    if data.get("published_parsed"):
+        entry["published_parsed"] = time.struct_time(tuple(data["published_parsed"]))
+    return entry
+
+
+def download_feed(
+    feed_url: str,
+    etag: Optional[str] = None,
+    modified: Optional[str] = None,
+    timeout: float = FEED_TIMEOUT_SECONDS
+) -> feedparser.FeedParserDict:
+    """Download and parse a feed, sending a conditional request if validators are given.
+
+    Returns a feedparser result with ``status``, ``etag`` and ``modified``
+    filled from the response; a 304 yields an empty ``entries`` list.
+    """
+    headers = {"User-Agent": feedparser.USER_AGENT}
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    response = requests.get(feed_url, headers=headers, timeout=timeout)
+    if response.status_code == 304:
+        return feedparser.FeedParserDict(status=304, entries=[], etag=etag, modified=modified)
+    response.raise_for_status()
+
+    feed = feedparser.parse(response.content, response_headers=dict(response.headers))
+    feed["status"] = response.status_code
+    feed["etag"] = response.headers.get("ETag")
+    feed["modified"] = response.headers.get("Last-Modified")
+    return feed
+
+
+class FeedCache:
+    """On-disk cache of feed validators and parsed entries, keyed by feed URL."""
+
+    def __init__(self, cache_path: str = DEFAULT_FEED_CACHE_PATH):
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+        self._feeds: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache from disk."""
+        if os.path.exists(self.cache_path):
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    return json.load(f).get("feeds", {})
+            except (json.JSONDecodeError, IOError, AttributeError) as e:
+                logger.warning(f"Could not load feed cache: {e}. Starting fresh.")
+        return {}
+
+    def save(self) -> None:
+        """Write the cache to disk if anything changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = f"{self.cache_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"feeds": self._feeds}, f)
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+
+    def get(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """Return the cached record for a feed, if any."""
+        with self._lock:
+            return self._feeds.get(feed_url)
+
+    def update(
+        self,
+        feed_url: str,
+        etag: Optional[str],
+        modified: Optional[str],
+        entries: List[Dict[str, Any]]
+    ) -> None:
+        """Replace the cached record for a feed."""
+        with self._lock:
+            self._feeds[feed_url] = {
+                "etag": etag,
+                "modified": modified,
+                "entries": [entry_to_dict(e) for e in entries],
+                "fetched_at": datetime.now().isoformat(),
+            }
+            self._dirty = True
+
+    def parse(self, feed_url: str) -> feedparser.FeedParserDict:
+        """Parse a feed with a conditional GET, reusing cached entries on 304."""
+        cached = self.get(feed_url) or {}
+        feed = download_feed(feed_url, etag=cached.get("etag"), modified=cached.get("modified"))
+
+        if cached and feed.get("status") == 304:
+            self.hits += 1
+            logger.debug(f"Feed not modified: {feed_url}")
+            feed["entries"] = [entry_from_dict(e) for e in cached.get("entries", [])]
+            return feed
+
+        self.misses += 1
+        if feed.get("entries") and (feed.get("etag") or feed.get("modified")):
+            self.update(feed_url, feed.get("etag"), feed.get("modified"), feed.entries)
+        return feed
+
+
+# Singleton instance for easy access
+_feed_cache: Optional[FeedCache] = None
+
+
+def get_feed_cache(cache_path: str = DEFAULT_FEED_CACHE_PATH) -> FeedCache:
+    """Get or create the feed cache singleton."""
+    global _feed_cache
+    if _feed_cache is None:
+        _feed_cache = FeedCache(cache_path)
+    return _feed_cache
@@ -3,12 +3,13 @@
 Provides functionality to save, load, and manage generation history.
 """
 
-import json
-import os
 from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import logging
+import threading
+
+from journal_store import JournalStore
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 HISTORY_DIR = Path("./data/history")
 HISTORY_FILE = HISTORY_DIR / "sessions.json"
 
+# Sessions kept (oldest are dropped)
+MAX_SESSIONS = 500
+
 
 class SessionEntry:
     """Represents a single generation session."""
@@ -92,70 +96,140 @@ class SessionEntry:
         return f"{date_str} - {preview}"
 
 
+def _apply_history_record(sessions: List[Dict[str, Any]], record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Replay one journaled history change."""
+    if not isinstance(sessions, list):
+        sessions = []
+    op = record.get("op")
+    if op == "save":
+        sessions.insert(0, record["entry"])
+        del sessions[MAX_SESSIONS:]
+    elif op == "delete":
+        sessions[:] = [s for s in sessions if s.get("session_id") != record["session_id"]]
+    else:
+        logger.warning(f"Skipping unknown history journal record: {op}")
+    return sessions
+
+
 class HistoryManager:
-    """Manages session history storage and retrieval."""
+    """Manages session history storage and retrieval.
+
+    Sessions live in a JSON snapshot plus an append-only journal of saves
+    and deletes (see journal_store), so a change appends one line instead
+    of rewriting the file. Parsed entries are cached in memory with an
+    id index; the cache is reloaded only when the files' mtime or size
+    changes (another process wrote them), so repeated reads such as
+    sidebar rendering touch the disk with a stat call and nothing else.
+    """
 
     def __init__(self, history_file: Path = HISTORY_FILE):
         self.history_file = history_file
         self._ensure_dir()
+        self._journal = JournalStore(history_file, _apply_history_record)
+        self._lock = threading.RLock()
+        self._stamp = None
+        self._sessions: List[Dict[str, Any]] = []  # Newest first, as stored
+        self._entries: List[SessionEntry] = []
+        self._positions: Dict[str, int] = {}  # session_id -> index in _entries
+        # Bumped on every change seen by this manager (e.g. for UI cache keys)
+        self.version = 0
 
     def _ensure_dir(self):
         """Ensure history directory exists."""
         self.history_file.parent.mkdir(parents=True, exist_ok=True)
 
-    def _load_all(self) -> List[Dict[str, Any]]:
-        """Load all sessions from file."""
-        if not self.history_file.exists():
-            return []
-        try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
-            logger.error(f"Failed to load history: {e}")
-            return []
-
-    def _save_all(self, sessions: List[Dict[str, Any]]):
-        """Save all sessions to file."""
+    def _refresh(self):
+        """Reload the cache if the files changed since it was built."""
+        stamp = self._journal.stamp()
+        if stamp == self._stamp:
+            return
+        sessions = self._journal.load([])
+        if not isinstance(sessions, list):
+            logger.error(f"Failed to load history: {self.history_file} is not a JSON list")
+            sessions = []
+        self._sessions = sessions
+        self._entries = [SessionEntry.from_dict(s) for s in sessions]
+        self._reindex()
+        self._stamp = stamp
+
+    def _reindex(self):
+        self._positions = {}
+        for i, entry in enumerate(self._entries):
+            self._positions.setdefault(entry.session_id, i)
+        self.version += 1
+
+    def _log(self, record: Dict[str, Any]):
+        """Journal a change already applied to the cache."""
         self._ensure_dir()
-        with open(self.history_file, "w", encoding="utf-8") as f:
-            json.dump(sessions, f, indent=2)
+        self._journal.append(record, self._sessions)
+        self._stamp = self._journal.stamp()
 
     def save_session(self, entry: SessionEntry):
         """Save a new session entry."""
-        sessions = self._load_all()
-        sessions.insert(0, entry.to_dict())  # Newest first
-        # Keep only last 50 sessions
-        sessions = sessions[:50]
-        self._save_all(sessions)
+        record = {"op": "save", "entry": entry.to_dict()}
+        with self._lock:
+            self._refresh()
+            _apply_history_record(self._sessions, record)  # Newest first, capped
+            self._entries.insert(0, SessionEntry.from_dict(record["entry"]))
+            del self._entries[MAX_SESSIONS:]
+            self._reindex()
+            self._log(record)
         logger.info(f"Saved session: {entry.session_id}")
 
-    def get_sessions(self, limit: int = 20) -> List[SessionEntry]:
-        """Get recent sessions."""
-        sessions = self._load_all()
-        return [SessionEntry.from_dict(s) for s in sessions[:limit]]
+    def get_sessions(self, limit: int = 20, after: Optional[str] = None) -> List[SessionEntry]:
+        """Get recent sessions, newest first.
+
+        Args:
+            limit: Page size
+            after: Cursor: the session_id of the last entry of the previous
+                page; the page then continues with older sessions. An
+                unknown (e.g. deleted) cursor gives an empty page.
+        """
+        with self._lock:
+            self._refresh()
+            start = 0
+            if after is not None:
+                if after not in self._positions:
+                    return []
+                start = self._positions[after] + 1
+            return self._entries[start:start + limit]
 
     def get_session(self, session_id: str) -> Optional[SessionEntry]:
         """Get a specific session by ID."""
-        sessions = self._load_all()
-        for s in sessions:
-            if s.get("session_id") == session_id:
-                return SessionEntry.from_dict(s)
-        return None
+        with self._lock:
+            self._refresh()
+            position = self._positions.get(session_id)
+            return self._entries[position] if position is not None else None
 
     def delete_session(self, session_id: str) -> bool:
         """Delete a session by ID."""
-        sessions = self._load_all()
-        original_len = len(sessions)
-        sessions = [s for s in sessions if s.get("session_id") != session_id]
-        if len(sessions) < original_len:
-            self._save_all(sessions)
-            logger.info(f"Deleted session: {session_id}")
-            return True
-        return False
+        record = {"op": "delete", "session_id": session_id}
+        with self._lock:
+            self._refresh()
+            if session_id not in self._positions:
+                return False
+            _apply_history_record(self._sessions, record)
+            self._entries = [e for e in self._entries if e.session_id != session_id]
+            self._reindex()
+            self._log(record)
+        logger.info(f"Deleted session: {session_id}")
+        return True
+
+    def count(self) -> int:
+        """Number of stored sessions."""
+        with self._lock:
+            self._refresh()
+            return len(self._entries)
 
     def clear_all(self):
         """Clear all session history."""
-        self._save_all([])
+        self._ensure_dir()
+        with self._lock:
+            self._refresh()  # Brings the journal sequence up to date
+            self._journal.compact([])
+            self._sessions, self._entries = [], []
+            self._reindex()
+            self._stamp = self._journal.stamp()
         logger.info("Cleared all session history")
 
 
@@ -0,0 +1,187 @@
+"""Append-only JSON journal with snapshots for small persistent state.
+
+State that used to be rewritten as one JSON file on every change (episode
+memory, session history) is kept as a snapshot file plus a journal of the
+changes made since. Each change appends one JSON line to ``<path>.journal``
+and fsyncs it, so a write costs O(1) no matter how large the state is.
+Once the journal outgrows :data:`DEFAULT_COMPACT_BYTES`, the state is
+written to a temporary file and atomically swapped in as the new snapshot,
+and the journal is emptied.
+
+Every journal line carries a sequence number and the snapshot records the
+last one it includes, so a crash at any point leaves a loadable state: a
+torn last line is dropped on recovery, and lines already folded into the
+snapshot are skipped. A plain JSON file written before journaling is read
+as a snapshot, so existing files need no migration.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Journal size that triggers compaction into a new snapshot
+DEFAULT_COMPACT_BYTES = 1024 * 1024
+
+SNAPSHOT_FORMAT = "journal-snapshot/1"
+
+
+class JournalStore:
+    """Snapshot + append-only journal of JSON records for one piece of state.
+
+    The owner keeps the state in memory and changes it itself; the store
+    logs each change and replays the log on load.
+
+    Usage:
+        store = JournalStore("sessions.json", apply=apply_session_record)
+        sessions = store.load(default=[])
+        sessions.insert(0, entry)
+        store.append({"op": "save", "entry": entry}, sessions)
+
+    Args:
+        path: Snapshot file; the journal lives next to it in ``<path>.journal``
+        apply: ``apply(state, record) -> state`` replays one record on load
+        compact_bytes: Journal size that triggers compaction
+    """
+
+    def __init__(
+        self,
+        path: str,
+        apply: Callable[[Any, Any], Any],
+        compact_bytes: int = DEFAULT_COMPACT_BYTES
+    ):
+        self.path = str(path)
+        self.journal_path = f"{self.path}.journal"
+        self.apply = apply
+        self.compact_bytes = compact_bytes
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._journal_bytes = 0
+
+    def exists(self) -> bool:
+        """Whether a snapshot or journal has been written."""
+        return os.path.exists(self.path) or os.path.exists(self.journal_path)
+
+    def stamp(self) -> Tuple[Optional[Tuple[int, int]], ...]:
+        """(mtime_ns, size) of the snapshot and journal; changes whenever either is written."""
+        stamps = []
+        for path in (self.path, self.journal_path):
+            try:
+                stat = os.stat(path)
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def _read_snapshot(self, default: Any) -> Any:
+        if not os.path.exists(self.path):
+            return default
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning(f"Could not load {self.path}: {e}. Starting fresh.")
+            return default
+        if isinstance(data, dict) and data.get("format") == SNAPSHOT_FORMAT:
+            self._seq = data.get("seq", 0)
+            return data.get("state", default)
+        return data  # Plain JSON file from before journaling
+
+    def load(self, default: Any = None) -> Any:
+        """Read the snapshot and replay the journal on top of it.
+
+        A torn or corrupt tail (a crash mid-append) is truncated away.
+
+        Args:
+            default: State to start from when there is no snapshot
+        """
+        with self._lock:
+            self._seq = 0
+            state = self._read_snapshot(default)
+            snapshot_seq = self._seq
+            if not os.path.exists(self.journal_path):
+                self._journal_bytes = 0
+                return state
+
+            valid_bytes = 0
+            replayed = 0
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("incomplete line")
+                        entry = json.loads(line)
+                        seq, record = entry["seq"], entry["record"]
+                    except (ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Dropping journal tail of {self.journal_path} at byte {valid_bytes}: {e}")
+                        break
+                    valid_bytes += len(line)
+                    if seq > snapshot_seq:
+                        state = self.apply(state, record)
+                        replayed += 1
+                    self._seq = max(self._seq, seq)
+
+            if valid_bytes < os.path.getsize(self.journal_path):
+                with open(self.journal_path, 'r+b') as f:
+                    f.truncate(valid_bytes)
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._journal_bytes = valid_bytes
+            if replayed:
+                logger.debug(f"Replayed {replayed} journal records onto {self.path}")
+            return state
+
+    def append(self, record: Any, state: Any) -> None:
+        """Durably log a change that has already been made to ``state``.
+
+        Compacts into a new snapshot of ``state`` once the journal is large.
+        """
+        with self._lock:
+            self._seq += 1
+            line = json.dumps({"seq": self._seq, "record": record}, default=str) + "\n"
+            data = line.encode('utf-8')
+            with open(self.journal_path, 'ab') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            self._journal_bytes += len(data)
+            if self._journal_bytes >= self.compact_bytes:
+                self._compact(state)
+
+    def compact(self, state: Any) -> None:
+        """Write ``state`` as the new snapshot and empty the journal."""
+        with self._lock:
+            self._compact(state)
+
+    def _compact(self, state: Any) -> None:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"format": SNAPSHOT_FORMAT, "seq": self._seq, "state": state}, f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        _fsync_directory(os.path.dirname(self.path) or ".")
+        # A crash before this truncation only leaves records the snapshot already has
+        with open(self.journal_path, 'wb') as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_bytes = 0
+        logger.debug(f"Compacted journal into {self.path} at seq {self._seq}")
+
+
+def _fsync_directory(directory: str) -> None:
+    """Persist a rename on filesystems that need the directory synced."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Not supported on this platform (e.g. Windows)
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
@@ -0,0 +1,117 @@
+"""Single-pass multi-pattern keyword matching for story scoring.
+
+Significance scoring and theme detection each look for several keyword
+lists in the same story text. Modules register their lists here as named
+groups when imported; all keywords are compiled into one alternation regex with word
+boundaries, so a text is scanned once and the result answers every group.
+
+Matching is case-insensitive and whole-word, allowing simple inflections
+(``acquire`` matches "acquired", ``startup`` matches "startups"), so ``ai``
+no longer fires inside "said" or ``sec`` inside "second". A longer keyword
+also counts the keywords it contains: "breaking news" in the text counts
+for both ``breaking news`` and ``breaking``.
+"""
+
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, Optional, Sequence, Set
+
+# Inflections accepted after a keyword ("d" only after a final "e")
+KEYWORD_SUFFIXES = r"(s|es|d|ed|ing)?"
+
+
+@dataclass
+class KeywordHits:
+    """Distinct keywords found in one text, answerable per group."""
+    matched: FrozenSet[str]
+    groups: Dict[str, FrozenSet[str]] = field(repr=False)
+    version: int = field(default=0, repr=False)  # Registry version of the scanner
+
+    def keywords(self, group: str) -> Set[str]:
+        """Distinct keywords of ``group`` present in the text."""
+        return set(self.groups.get(group, frozenset()) & self.matched)
+
+    def count(self, group: str) -> int:
+        """Number of distinct keywords of ``group`` present in the text."""
+        return len(self.groups.get(group, frozenset()) & self.matched)
+
+    def any(self, group: str) -> bool:
+        """Whether any keyword of ``group`` is present in the text."""
+        return not self.groups.get(group, frozenset()).isdisjoint(self.matched)
+
+
+class KeywordScanner:
+    """Compiled matcher for a fixed set of keyword groups.
+
+    Usage:
+        scanner = KeywordScanner({"company": ["apple", "google"]})
+        hits = scanner.scan("Apple and Google shares rose")
+        hits.count("company")  # 2
+    """
+
+    def __init__(self, groups: Dict[str, Sequence[str]], version: int = 0):
+        self.version = version
+        self.groups: Dict[str, FrozenSet[str]] = {
+            name: frozenset(kw.lower() for kw in keywords) for name, keywords in groups.items()
+        }
+        keywords = sorted(set().union(*self.groups.values()), key=lambda kw: (-len(kw), kw))
+        self._implied = {kw: self._contained_keywords(kw, keywords) for kw in keywords}
+        alternation = "|".join(re.escape(kw) for kw in keywords)
+        self._pattern = re.compile(
+            rf"(?<!\w)({alternation}){KEYWORD_SUFFIXES}(?!\w)", re.IGNORECASE
+        ) if keywords else None
+
+    @staticmethod
+    def _contained_keywords(keyword: str, keywords: Iterable[str]) -> FrozenSet[str]:
+        """Keywords occurring as whole words inside ``keyword`` (including itself)."""
+        return frozenset(
+            other for other in keywords
+            if re.search(rf"(?<!\w){re.escape(other)}(?!\w)", keyword)
+        )
+
+    def scan(self, text: str) -> KeywordHits:
+        """Scan ``text`` once and return every keyword found."""
+        matched: Set[str] = set()
+        if self._pattern is not None:
+            for keyword, suffix in set(self._pattern.findall(text)):
+                keyword = keyword.lower()
+                if suffix.lower() == "d" and not keyword.endswith("e"):
+                    continue
+                matched |= self._implied[keyword]
+        return KeywordHits(frozenset(matched), self.groups, self.version)
+
+
+# Registry of keyword groups shared by all scorers
+_groups: Dict[str, Sequence[str]] = {}
+_scanner: Optional[KeywordScanner] = None
+_version = 0  # Bumped on every registration; hits from older scanners are stale
+_lock = threading.Lock()
+
+
+def register_keyword_groups(groups: Dict[str, Sequence[str]]) -> None:
+    """Add (or replace) named keyword groups in the shared scanner."""
+    global _scanner, _version
+    with _lock:
+        _groups.update(groups)
+        _scanner = None
+        _version += 1
+
+
+def registry_version() -> int:
+    """Version of the registered groups (see :attr:`KeywordHits.version`)."""
+    return _version
+
+
+def get_keyword_scanner() -> KeywordScanner:
+    """Get the shared scanner, compiling it after registrations change."""
+    global _scanner
+    with _lock:
+        if _scanner is None:
+            _scanner = KeywordScanner(_groups, _version)
+        return _scanner
+
+
+def scan_keywords(text: str) -> KeywordHits:
+    """Scan text with the shared scanner."""
+    return get_keyword_scanner().scan(text)
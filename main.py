@@ -16,7 +16,9 @@ from content_extraction import extract_content_from_sources
 from content_generation import generate_conversation_script
 from text_to_speech_conversion import convert_script_to_audio
 from upload_podcast import upload_podcast_episode
-from news_tracker import get_recent_articles
+from news_tracker import iter_recent_articles
+from seen_index import get_seen_index
+from cluster_store import get_cluster_store
 from notifications import notify_error, notify_success
 from datetime import datetime
 
@@ -24,6 +26,7 @@ from datetime import datetime
 from story_arc import create_episode_arc, format_arc_for_prompt
 from topic_curator import select_top_stories, format_curated_stories_for_prompt, format_single_story_for_prompt, curated_to_dict
 from episode_memory import get_memory_manager
+from story_features import clear_feature_cache
 
 logger = logging.getLogger(__name__)
 
@@ -49,24 +52,28 @@ async def generate_and_upload_podcast():
     current_step = "Initialization"
     try:
         print(f"Fetching recent articles for podcast generation at {datetime.now()}...")
-        current_step = "Fetching Articles"
+        current_step = "Fetching and Curating Articles"
 
-        # Fetch recent articles from news sources
-        articles = get_recent_articles()
+        # Fetch recent articles from news sources, clustering them as they arrive
+        articles = []
+
+        def fetched_articles():
+            for article in iter_recent_articles(compact=True):
+                articles.append(article)
+                print(f"  {len(articles)}. {article['title'][:70]}...")
+                yield article
+
+        # Step 1: Curate and rank stories (combines similar, selects top 3-4)
+        print("\nFetched Article Titles:")
+        top_stories = select_top_stories(
+            fetched_articles(), max_stories=4, min_significance=2.0, cluster_store=get_cluster_store()
+        )
         print(f"Fetched {len(articles)} articles.\n")
 
         if not articles:
             raise ValueError("No articles fetched from news sources")
 
-        # Display the fetched articles for verification
-        print("\nFetched Article Titles:")
-        for i, article in enumerate(articles, 1):
-            print(f"  {i}. {article['title'][:70]}...")
-
-        # Step 1: Curate and rank stories (combines similar, selects top 3-4)
-        current_step = "Curating Stories"
         print("\n--- Curating and Ranking Stories ---")
-        top_stories = select_top_stories(articles, max_stories=4, min_significance=2.0)
         print(f"Selected {len(top_stories)} top stories for in-depth coverage")
 
         if not top_stories:
@@ -198,6 +205,9 @@ GENERATION INSTRUCTIONS:
             callbacks_used=[cb.get('prediction', '')[:50] for cb in callbacks]
         )
 
+        # Skip this episode's articles on future runs
+        get_seen_index().mark_seen(articles)
+
         # Send success notification
         notify_success(
             f"Podcast episode generated and uploaded!\n\n"
@@ -223,6 +233,10 @@ GENERATION INSTRUCTIONS:
         
         sys.exit(1)
 
+    finally:
+        # Features memoized during this run hold its stories; release them
+        clear_feature_cache()
+
 
 if __name__ == '__main__':
     asyncio.run(generate_and_upload_podcast())
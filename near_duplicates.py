@@ -0,0 +1,155 @@
+"""MinHash signatures, LSH banding and union-find for near-duplicate grouping.
+
+Checking a new story against every existing story is quadratic, and each
+check runs SequenceMatcher. Instead a story's shingles are reduced to a
+fixed-size MinHash signature, and an LSH index buckets signatures band by
+band: two stories land in a shared bucket with high probability when their
+shingle sets overlap, so only those candidates need the exact comparison.
+
+Shingles are hashed with CRC32, so signatures are stable across runs.
+Verified pairs are merged with :class:`UnionFind`, so the resulting groups
+are connected components and do not depend on the order pairs are checked.
+"""
+
+import zlib
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Signature length (number of hash permutations)
+NUM_PERMUTATIONS = 64
+
+# Seed for the permutation coefficients; changing it invalidates stored signatures
+SIGNATURE_SEED = 1
+
+# Hash family h(x) = ((a * x + b) mod p) & 0xFFFFFFFF over 32-bit shingle hashes
+# (the multiply wraps at 64 bits, which is fine for hashing)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_rng = np.random.RandomState(SIGNATURE_SEED)
+_PERM_A = _rng.randint(1, (1 << 61) - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+_PERM_B = _rng.randint(0, (1 << 61) - 1, size=NUM_PERMUTATIONS, dtype=np.uint64)
+
+
+def char_shingles(text: str, k: int) -> Set[str]:
+    """Return the set of k-character shingles of whitespace-normalized text."""
+    text = " ".join(text.lower().split())
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+
+def minhash(shingles: Iterable[str]) -> Optional[np.ndarray]:
+    """Compute the MinHash signature of a shingle set (None when empty)."""
+    hashes = np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64
+    )
+    if hashes.size == 0:
+        return None
+    with np.errstate(over="ignore"):
+        values = ((np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME) & _MAX_HASH
+    return values.min(axis=1)
+
+
+def estimate_jaccard(sig1: np.ndarray, sig2: np.ndarray) -> float:
+    """Estimate the Jaccard similarity of two shingle sets from their signatures."""
+    return float(np.mean(sig1 == sig2))
+
+
+class LSHIndex:
+    """Banded MinHash index mapping signatures to candidate keys.
+
+    A signature is split into ``bands`` bands of ``rows`` values; keys whose
+    signatures agree on any whole band are candidates. Pairs with Jaccard
+    similarity above roughly ``(1 / bands) ** (1 / rows)`` are found with
+    high probability.
+
+    Usage:
+        index = LSHIndex(bands=16, rows=4)
+        index.add("story-1", minhash(char_shingles(text, 5)))
+        candidates = index.candidates(minhash(char_shingles(other_text, 5)))
+    """
+
+    def __init__(self, bands: int, rows: int):
+        if bands * rows > NUM_PERMUTATIONS:
+            raise ValueError(
+                f"{bands} bands x {rows} rows needs more than {NUM_PERMUTATIONS} permutations"
+            )
+        self.bands = bands
+        self.rows = rows
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._size = 0
+
+    @property
+    def threshold(self) -> float:
+        """Approximate Jaccard similarity at which pairs become likely candidates."""
+        return (1 / self.bands) ** (1 / self.rows)
+
+    def _band_keys(self, signature: np.ndarray) -> Iterator[Tuple[int, bytes]]:
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def add(self, key: Hashable, signature: Optional[np.ndarray]) -> None:
+        """Index ``key`` under its signature (empty signatures are not indexed)."""
+        if signature is None:
+            return
+        for band, band_key in self._band_keys(signature):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        self._size += 1
+
+    def candidates(self, signature: Optional[np.ndarray]) -> Set[Hashable]:
+        """Return keys sharing at least one band bucket with ``signature``."""
+        found: Set[Hashable] = set()
+        if signature is None:
+            return found
+        for band, band_key in self._band_keys(signature):
+            found.update(self._buckets[band].get(band_key, ()))
+        return found
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class UnionFind:
+    """Disjoint sets over the integers 0..n-1, grown with :meth:`add`."""
+
+    def __init__(self, size: int = 0):
+        self._parent: List[int] = list(range(size))
+        self._rank: List[int] = [0] * size
+
+    def add(self) -> int:
+        """Add a singleton set and return its element."""
+        element = len(self._parent)
+        self._parent.append(element)
+        self._rank.append(0)
+        return element
+
+    def find(self, element: int) -> int:
+        """Return the representative of ``element``'s set (with path halving)."""
+        parent = self._parent
+        while parent[element] != element:
+            parent[element] = parent[parent[element]]
+            element = parent[element]
+        return element
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of ``a`` and ``b``; returns False if already merged."""
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self._rank[root_a] < self._rank[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        if self._rank[root_a] == self._rank[root_b]:
+            self._rank[root_a] += 1
+        return True
+
+    def groups(self) -> List[List[int]]:
+        """All sets as sorted member lists, ordered by their smallest member."""
+        members: Dict[int, List[int]] = {}
+        for element in range(len(self._parent)):
+            members.setdefault(self.find(element), []).append(element)
+        return list(members.values())
+
+    def __len__(self) -> int:
+        return len(self._parent)
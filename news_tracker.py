@@ -1,11 +1,23 @@
-import feedparser
 import logging
 import random
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import re
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, TypeVar
+from urllib.parse import urlparse
 import requests
-from newspaper import Article
+from requests.adapters import HTTPAdapter
+from article_parser import ParsePool, parse_article_html
+from article_cache import ArticleCache, get_article_cache
+from article_record import ArticleRecord
+from domain_health import DomainHealthTracker, domain_of, get_domain_health
+from feed_cache import FeedCache, download_feed, get_feed_cache
+from seen_index import SeenArticleIndex, get_seen_index
 from settings import load_rss_feeds
 
 logger = logging.getLogger(__name__)
@@ -19,110 +31,505 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
 ]
 
-# Sites that commonly block scrapers - use summary only
+# Sites that commonly block scrapers. These seed the domain health tracker
+# with an open circuit; after a cooldown they are probed like any other site.
 BLOCKED_DOMAINS = [
     "bloomberg.com", "wsj.com", "ft.com", "nytimes.com",
     "washingtonpost.com", "economist.com", "businessinsider.com"
 ]
 
+# Concurrency limits for feed and article fetching
+MAX_CONCURRENT_FETCHES = 16   # Global cap on in-flight requests
+MAX_FETCHES_PER_HOST = 2      # Be polite to any single site
+
+# Per-request timeout for article downloads
+ARTICLE_TIMEOUT_SECONDS = 10
+
+# HTTP statuses that mean the site is blocking us (5xx also count against a domain)
+DOMAIN_FAILURE_STATUSES = (403, 429)
+
+# Overall wall-clock budget for one ingestion run (None = unbounded)
+FETCH_DEADLINE_SECONDS = 600
+
+T = TypeVar("T")
+
 
 def clean_text(text):
     """Remove HTML tags from the summary and return cleaned text."""
     return re.sub(r'<.*?>', '', text)  # Remove HTML tags
 
 
+def get_domain_tracker() -> DomainHealthTracker:
+    """Return the shared domain health tracker, seeded with BLOCKED_DOMAINS."""
+    return get_domain_health(seed_blocked=BLOCKED_DOMAINS)
+
+
 def is_blocked_domain(url: str) -> bool:
-    """Check if URL is from a domain known to block scrapers."""
-    return any(domain in url.lower() for domain in BLOCKED_DOMAINS)
+    """Check if URL is from a domain whose circuit is currently open."""
+    return get_domain_tracker().is_open(url)
+
+
+def is_domain_failure(error: Exception) -> bool:
+    """Check whether a download error says the site is blocking, failing or unreachable.
+
+    Classified by exception type and status code only: the error text
+    includes the URL, whose path may contain words like "blocked" or "403".
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        status = error.response.status_code
+        return status in DOMAIN_FAILURE_STATUSES or status >= 500
+    return False
+
+
+# Connection pool shared by every fetch thread's session (keep-alive per host)
+_http_adapter = HTTPAdapter(pool_connections=MAX_CONCURRENT_FETCHES, pool_maxsize=MAX_FETCHES_PER_HOST)
+_http_local = threading.local()
+
+
+def get_http_session() -> requests.Session:
+    """Return this thread's HTTP session; all sessions share one connection pool."""
+    session = getattr(_http_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", _http_adapter)
+        session.mount("https://", _http_adapter)
+        _http_local.session = session
+    return session
+
+
+def get_host(url: str) -> str:
+    """Return the lowercased host (with port) of a URL."""
+    return urlparse(url).netloc.lower()
+
+
+class HostLimiter:
+    """Caps the number of in-flight requests to any single host."""
+
+    def __init__(self, per_host_limit: int = MAX_FETCHES_PER_HOST):
+        self.per_host_limit = max(1, per_host_limit)
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
 
+    def _semaphore(self, url: str) -> threading.BoundedSemaphore:
+        host = get_host(url)
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._semaphores[host] = semaphore
+            return semaphore
 
-def get_full_text(url: str, max_retries: int = 2) -> str:
-    """Retrieve the full text of an article from its URL using newspaper3k.
+    @contextmanager
+    def slot(self, url: str):
+        """Hold one of the host's request slots for the duration of the block."""
+        with self._semaphore(url):
+            yield
 
-    Handles 403 errors with retry logic and user agent rotation.
+
+class FetchDeadlineExceeded(RuntimeError):
+    """A fetch was skipped because the run's fetch budget ran out."""
+
+
+class FetchBudget:
+    """Overall deadline for an ingestion run, with per-domain time accounting.
+
+    Usage:
+        budget = FetchBudget(300)
+        articles = get_recent_articles(budget=budget)
+        print(budget.report())
+    """
+
+    def __init__(self, seconds: Optional[float] = FETCH_DEADLINE_SECONDS):
+        self.seconds = seconds
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._used: Dict[str, float] = {}
+        self._in_flight: Dict[int, Tuple[str, float]] = {}
+        self._next_id = 0
+        self.latencies: List[float] = []  # Seconds per completed fetch
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None when unbounded."""
+        if self.seconds is None:
+            return None
+        return max(0.0, self.seconds - (time.monotonic() - self.started))
+
+    @property
+    def expired(self) -> bool:
+        return self.remaining() == 0.0
+
+    @contextmanager
+    def track(self, url: str):
+        """Charge the time spent inside the block to the URL's domain."""
+        if self.expired:
+            raise FetchDeadlineExceeded(url)
+        domain = domain_of(url)
+        with self._lock:
+            token = self._next_id
+            self._next_id += 1
+            self._in_flight[token] = (domain, time.monotonic())
+        try:
+            yield
+        finally:
+            with self._lock:
+                domain, started = self._in_flight.pop(token)
+                elapsed = time.monotonic() - started
+                self._used[domain] = self._used.get(domain, 0.0) + elapsed
+                self.latencies.append(elapsed)
+
+    def report(self) -> Dict[str, float]:
+        """Seconds of fetch time per domain, including fetches still in flight."""
+        now = time.monotonic()
+        with self._lock:
+            used = dict(self._used)
+            for domain, started in self._in_flight.values():
+                used[domain] = used.get(domain, 0.0) + now - started
+        return dict(sorted(used.items(), key=lambda item: item[1], reverse=True))
+
+    def log_report(self, top: int = 10) -> None:
+        elapsed = time.monotonic() - self.started
+        limit = f"{self.seconds:.0f}s" if self.seconds is not None else "unbounded"
+        logger.info(f"Fetch budget: {elapsed:.1f}s elapsed of {limit}")
+        for domain, seconds in list(self.report().items())[:top]:
+            logger.info(f"  {domain}: {seconds:.1f}s of fetch time")
+
+
+def interleave_by_host(urls: Sequence[str]) -> List[int]:
+    """Return indices into ``urls`` ordered round-robin across hosts.
+
+    Submitting work in this order keeps pool workers from piling up behind
+    a single host's per-host limit while other hosts sit idle.
     """
-    # Skip known blocked domains
-    if is_blocked_domain(url):
-        logger.debug(f"Skipping blocked domain: {url}")
+    buckets: "OrderedDict[str, List[int]]" = OrderedDict()
+    for i, url in enumerate(urls):
+        buckets.setdefault(get_host(url), []).append(i)
+
+    order = []
+    queues = list(buckets.values())
+    depth = 0
+    while len(order) < len(urls):
+        for queue in queues:
+            if depth < len(queue):
+                order.append(queue[depth])
+        depth += 1
+    return order
+
+
+def fetch_concurrently(
+    executor: ThreadPoolExecutor,
+    fetch: Callable[[str], T],
+    urls: Sequence[str],
+    limiter: HostLimiter
+) -> List[T]:
+    """Run ``fetch`` for every URL on the pool and return results in input order."""
+    return [future.result() for future in submit_concurrently(executor, fetch, urls, limiter)]
+
+
+def submit_concurrently(
+    executor: ThreadPoolExecutor,
+    fetch: Callable[[str], T],
+    urls: Sequence[str],
+    limiter: HostLimiter,
+    budget: Optional[FetchBudget] = None
+) -> List["Future[T]"]:
+    """Submit ``fetch`` for every URL, returning futures aligned with ``urls``.
+
+    With a ``budget``, fetch time is charged to each URL's domain and fetches
+    that would start after the deadline fail with FetchDeadlineExceeded.
+    """
+    def limited(url: str) -> T:
+        with limiter.slot(url):
+            if budget is None:
+                return fetch(url)
+            with budget.track(url):
+                return fetch(url)
+
+    futures = {i: executor.submit(limited, urls[i]) for i in interleave_by_host(urls)}
+    return [futures[i] for i in range(len(urls))]
+
+
+def get_full_text(
+    url: str,
+    max_retries: int = 2,
+    article_cache: Optional[ArticleCache] = None,
+    domain_health: Optional[DomainHealthTracker] = None,
+    parse_pool: Optional[ParsePool] = None
+) -> str:
+    """Retrieve the full text of an article, using the on-disk article cache.
+
+    Only successful extractions are cached, so failures are retried on the
+    next run. Domains with an open circuit are not requested at all. The
+    download runs on the calling thread; parsing goes to ``parse_pool``
+    (inline when None).
+    """
+    if article_cache is None:
+        article_cache = get_article_cache()
+    cached = article_cache.get(url)
+    if cached is not None:
+        return cached
+
+    tracker = domain_health or get_domain_tracker()
+    if not tracker.allow_request(url):
+        logger.debug(f"Skipping domain with open circuit: {url}")
+        return ""
+
+    start = time.perf_counter()
+    try:
+        html = download_html(url, max_retries)
+    except Exception as e:
+        tracker.record_failure(url, time.perf_counter() - start)
+        logger.debug(f"Could not retrieve full text for {url}: {e}")
         return ""
+    if not html:
+        # A 404 or unparseable response says nothing about the domain's health
+        tracker.release_probe(url)
+        return ""
+    tracker.record_success(url, time.perf_counter() - start)
+
+    text = extract_text(url, html, parse_pool)
+    if text:
+        article_cache.put(url, text)
+    return text
+
 
+def download_html(url: str, max_retries: int = 2) -> str:
+    """Download an article page over a pooled keep-alive session.
+
+    Rotates the user agent between attempts. Connection problems are retried
+    immediately; blocks, timeouts and server errors that persist are raised
+    so the caller can record them against the domain. Other failures
+    return "".
+    """
     for attempt in range(max_retries):
         try:
             # Use random user agent
-            user_agent = random.choice(USER_AGENTS)
+            headers = {"User-Agent": random.choice(USER_AGENTS)}
+            response = get_http_session().get(url, headers=headers, timeout=ARTICLE_TIMEOUT_SECONDS)
+            response.raise_for_status()
+            if "charset" not in response.headers.get("Content-Type", "").lower():
+                response.encoding = "utf-8"
+            return response.text
 
-            # Configure article with custom user agent
-            config = Article(url)
-            config.config.browser_user_agent = user_agent
-            config.config.request_timeout = 10
+        except Exception as e:
+            if not is_domain_failure(e):
+                logger.debug(f"Could not retrieve full text for {url}: {e}")
+                return ""
 
-            article = Article(url, config=config.config)
-            article.download()
-            article.parse()
+            logger.warning(f"Blocked or unreachable (attempt {attempt + 1}/{max_retries}): {url}")
+            if attempt == max_retries - 1:
+                raise
 
-            if article.text and len(article.text) > 100:
-                return article.text
-            return ""
+    return ""
 
-        except Exception as e:
-            error_str = str(e).lower()
-
-            # Check for 403/blocked errors
-            if "403" in error_str or "forbidden" in error_str or "blocked" in error_str:
-                logger.warning(f"Blocked (attempt {attempt + 1}/{max_retries}): {url}")
-                if attempt < max_retries - 1:
-                    time.sleep(1 + random.random())  # Random delay before retry
-                    continue
-                else:
-                    logger.info(f"Giving up on blocked URL: {url}")
-                    return ""
-
-            # Check for timeout/connection errors
-            if "timeout" in error_str or "connection" in error_str:
-                logger.warning(f"Connection issue (attempt {attempt + 1}/{max_retries}): {url}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)
-                    continue
-
-            logger.debug(f"Could not retrieve full text for {url}: {e}")
-            return ""
 
+def extract_text(url: str, html: str, parse_pool: Optional[ParsePool] = None) -> str:
+    """Parse article HTML into text, returning "" when too short to be useful."""
+    try:
+        if parse_pool is not None:
+            _, text = parse_pool.parse(url, html)
+        else:
+            _, text = parse_article_html(url, html)
+    except Exception as e:
+        logger.debug(f"Could not parse article {url}: {e}")
+        return ""
+
+    if text and len(text) > 100:
+        return text
     return ""
 
-def get_recent_articles():
-    recent_articles = []
+
+def parse_feed(feed_url: str, feed_cache: Optional[FeedCache] = None):
+    """Download and parse a single RSS feed, returning None on failure.
+
+    With a ``feed_cache`` the request is conditional and an unchanged feed
+    is served from the cache.
+    """
+    try:
+        if feed_cache is not None:
+            return feed_cache.parse(feed_url)
+        return download_feed(feed_url)
+    except Exception as e:
+        print(f"Failed to parse feed {feed_url}: {e}")
+        return None
+
+
+def iter_recent_articles(
+    feed_urls: Optional[List[str]] = None,
+    max_workers: int = MAX_CONCURRENT_FETCHES,
+    per_host_limit: int = MAX_FETCHES_PER_HOST,
+    feed_cache: Optional[FeedCache] = None,
+    article_cache: Optional[ArticleCache] = None,
+    skip_seen: bool = True,
+    seen_index: Optional[SeenArticleIndex] = None,
+    domain_health: Optional[DomainHealthTracker] = None,
+    parse_workers: Optional[int] = None,
+    ordered: bool = True,
+    budget: Optional[FetchBudget] = None,
+    compact: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """Yield articles published in the last day as soon as they are fetched.
+
+    Feeds and article pages are fetched on a bounded thread pool, with at most
+    ``per_host_limit`` requests in flight to any one host, and downloaded pages
+    are parsed on a small process pool once they back up. Entries already
+    covered by a previous episode are skipped before any download. Closing the generator early
+    cancels fetches that have not started.
+
+    The whole run is bounded by a fetch budget. When it runs out the
+    generator stops waiting: feeds still loading are dropped, outstanding
+    article fetches are cancelled and their entries fall back to the RSS
+    summary, and the per-domain time usage is logged.
+
+    Args:
+        feed_urls: Feeds to read (default: ``load_rss_feeds()``)
+        max_workers: Global cap on concurrent requests (1 = serial)
+        per_host_limit: Maximum concurrent requests per host
+        feed_cache: Conditional-GET feed cache (default: shared ``./data`` cache)
+        article_cache: Extracted-text cache (default: shared ``./data`` cache)
+        skip_seen: Skip entries recorded in the seen-article index
+        seen_index: Seen-article index (default: shared ``./data`` index)
+        domain_health: Per-domain circuit breaker (default: shared tracker)
+        parse_workers: Parser processes, started only when parses back up
+            (default: ``DEFAULT_PARSE_WORKERS``; <= 1 parses inline)
+        ordered: Yield in feed/entry order (deterministic) rather than in
+            completion order
+        budget: Fetch deadline and accounting (default:
+            ``FetchBudget(FETCH_DEADLINE_SECONDS)``)
+        compact: Yield :class:`ArticleRecord` mappings that keep only a
+            content prefix in memory and read the full text back from the
+            article cache on demand, instead of dicts
+    """
     now = datetime.now()
     cutoff_date = now - timedelta(days=1)  # Get articles from the last day
 
     # Load RSS feeds from the configuration
-    rss_feeds = load_rss_feeds()
+    rss_feeds = list(load_rss_feeds() if feed_urls is None else feed_urls)
+    limiter = HostLimiter(per_host_limit)
+    if feed_cache is None:
+        feed_cache = get_feed_cache()
+    if article_cache is None:
+        article_cache = get_article_cache()
+    if skip_seen and seen_index is None:
+        seen_index = get_seen_index()
+    if domain_health is None:
+        domain_health = get_domain_tracker()
+    if budget is None:
+        budget = FetchBudget()
+    skipped = 0
+    fetched = 0
+
+    executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+    parse_pool = ParsePool(parse_workers)
+    try:
+        feed_futures = submit_concurrently(
+            executor, lambda url: parse_feed(url, feed_cache), rss_feeds, limiter, budget
+        )
+        done, _ = wait(feed_futures, timeout=budget.remaining())
+        feeds = []
+        for feed_url, future in zip(rss_feeds, feed_futures):
+            if future in done and future.exception() is None:
+                feeds.append(future.result())
+            else:
+                future.cancel()
+                logger.warning(f"Fetch deadline reached; dropping feed {feed_url}")
+                feeds.append(None)
+        feed_cache.save()
+        logger.info(f"Feed cache: {feed_cache.hits} not modified, {feed_cache.misses} fetched")
 
-    for feed_url in rss_feeds:
+        entries = []
+        for feed_url, feed in zip(rss_feeds, feeds):
+            if feed is None:
+                continue
+            try:
+                for entry in feed.entries:
+                    # Parse the publish date
+                    published_date = datetime(*entry.published_parsed[:6])
+
+                    # Only add articles published after the cutoff date
+                    if published_date > cutoff_date:
+                        guid = entry.get('id')
+                        if skip_seen and seen_index.is_seen(entry.link, guid):
+                            skipped += 1
+                            continue
+                        entries.append((entry, entry.title, entry.link, guid, published_date))
+            except Exception as e:
+                print(f"Failed to parse feed {feed_url}: {e}")
+
+        if skipped:
+            logger.info(f"Skipped {skipped} entries already covered by earlier episodes")
+
+        def build_article(i: int, full_text: str) -> Dict[str, Any]:
+            entry, title, link, guid, published_date = entries[i]
+            cached_as = "text"  # get_full_text caches what it returns
+            if not full_text:  # If full text is unavailable, use summary
+                full_text = clean_text(entry.get('summary', 'Summary not available.'))
+                cached_as = None
+            if compact:
+                return ArticleRecord(
+                    title, link, full_text, guid or link, published_date,
+                    cache=article_cache, cached_as=cached_as
+                )
+            return {
+                "title": title,
+                "content": full_text,
+                "link": link,
+                "guid": guid or link,
+                "published": published_date
+            }
+
+        # Fetch the full text of every entry concurrently
+        links = [link for _, _, link, _, _ in entries]
+        futures = submit_concurrently(
+            executor,
+            lambda url: get_full_text(
+                url, article_cache=article_cache, domain_health=domain_health, parse_pool=parse_pool
+            ),
+            links,
+            limiter,
+            budget
+        )
+        index_of = {future: i for i, future in enumerate(futures)}
+        pending = set(range(len(futures)))
         try:
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries:
-                # Parse the publish date
-                published_date = datetime(*entry.published_parsed[:6])
-
-                # Only add articles published after the cutoff date
-                if published_date > cutoff_date:
-                    # Try to fetch the full text, falling back to summary if needed
-                    full_text = get_full_text(entry.link)
-                    if not full_text:  # If full text is unavailable, use summary
-                        full_text = clean_text(entry.get('summary', 'Summary not available.'))
-
-                    # Format the article for clear context
-                    article_content = f"Title: {entry.title}\nContent: {full_text}"
-
-                    article = {
-                        "title": entry.title,
-                        "content": full_text,
-                        "link": entry.link,
-                        "published": published_date
-                    }
-                    recent_articles.append(article)
-        except Exception as e:
-            print(f"Failed to parse feed {feed_url}: {e}")
+            for future in (futures if ordered else as_completed(futures, timeout=budget.remaining())):
+                i = index_of[future]
+                full_text = future.result(timeout=budget.remaining())
+                pending.discard(i)
+                fetched += 1
+                yield build_article(i, full_text)
+        except (FuturesTimeoutError, FetchDeadlineExceeded):
+            for future in futures:
+                future.cancel()
+            # Fetches that finished while an earlier article held up the order still count
+            finished = {
+                i for i in pending
+                if futures[i].done() and not futures[i].cancelled() and futures[i].exception() is None
+            }
+            logger.warning(
+                f"Fetch deadline reached; using summaries for {len(pending) - len(finished)} unfinished articles"
+            )
+            for i in sorted(pending):
+                fetched += 1
+                yield build_article(i, futures[i].result() if i in finished else "")
+    finally:
+        # After the deadline, abandon in-flight fetches instead of waiting on them
+        executor.shutdown(wait=not budget.expired, cancel_futures=True)
+        parse_pool.shutdown(wait=not budget.expired)
+        domain_health.save()
 
-    print(f"\nTotal articles fetched: {len(recent_articles)}")
-    return recent_articles
+    budget.log_report()
+    cache_stats = article_cache.stats()
+    logger.info(f"Article cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+    print(f"\nTotal articles fetched: {fetched}")
+
+
+def get_recent_articles(**kwargs) -> List[Dict[str, Any]]:
+    """Fetch articles published in the last day from all configured feeds.
+
+    Takes the same keyword arguments as :func:`iter_recent_articles`, and
+    returns the articles in feed order, then entry order, regardless of
+    completion order.
+    """
+    return list(iter_recent_articles(**kwargs))
@@ -0,0 +1,105 @@
+"""Inverted keyword index for matching past predictions to new stories.
+
+A prediction calls back to a story when at least
+:data:`MIN_KEYWORD_MATCHES` of its keywords (words longer than four
+characters) appear in the story. Instead of searching every story's text
+for every keyword of every prediction, :class:`PredictionKeywordIndex`
+maps each keyword to the predictions containing it; a story's distinct
+words (tokenized once, see ``StoryFeatures.tokens``) are looked up in the
+index and the hits counted per prediction, so only predictions sharing a
+word with the story are ever touched.
+"""
+
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from story_features import WORD_PATTERN, story_features
+
+# Shortest word counted as a prediction keyword
+MIN_KEYWORD_LENGTH = 5
+
+# Keywords a story must share with a prediction to call back to it
+MIN_KEYWORD_MATCHES = 2
+
+
+def prediction_keywords(text: str) -> Set[str]:
+    """Distinct lowercased keywords of a prediction."""
+    return {w for w in WORD_PATTERN.findall(text.lower()) if len(w) >= MIN_KEYWORD_LENGTH}
+
+
+class PredictionKeywordIndex:
+    """Keyword -> prediction keys postings, updated as predictions come and go."""
+
+    def __init__(self):
+        self._postings: Dict[str, Set[Hashable]] = defaultdict(set)
+        self._keywords: Dict[Hashable, Set[str]] = {}
+
+    def add(self, key: Hashable, text: str) -> None:
+        """Index a prediction's text under ``key`` (replacing any earlier text)."""
+        self.remove(key)
+        keywords = prediction_keywords(text)
+        self._keywords[key] = keywords
+        for keyword in keywords:
+            self._postings[keyword].add(key)
+
+    def remove(self, key: Hashable) -> None:
+        """Drop a prediction from the index; unknown keys are ignored."""
+        for keyword in self._keywords.pop(key, ()):
+            postings = self._postings[keyword]
+            postings.discard(key)
+            if not postings:
+                del self._postings[keyword]
+
+    def match_counts(self, story: Dict[str, Any]) -> Dict[Hashable, int]:
+        """Number of each indexed prediction's keywords found in a story."""
+        counts: Dict[Hashable, int] = defaultdict(int)
+        tokens = story_features(story).tokens
+        # Walk whichever side is smaller
+        if len(tokens) <= len(self._postings):
+            hits = (self._postings[t] for t in tokens if t in self._postings)
+        else:
+            hits = (keys for keyword, keys in self._postings.items() if keyword in tokens)
+        for keys in hits:
+            for key in keys:
+                counts[key] += 1
+        return counts
+
+    def first_matches(
+        self,
+        stories: Iterable[Dict[str, Any]],
+        keys: Optional[Set[Hashable]] = None,
+        min_matches: int = MIN_KEYWORD_MATCHES
+    ) -> Dict[Hashable, Tuple[Dict[str, Any], int]]:
+        """Map each prediction key to the first story it matches, with the match count.
+
+        Args:
+            stories: Stories in priority order
+            keys: Only consider these prediction keys (all indexed ones if None)
+            min_matches: Keywords a story must share with the prediction
+        """
+        matched: Dict[Hashable, Tuple[Dict[str, Any], int]] = {}
+        for story in stories:
+            for key, count in self.match_counts(story).items():
+                if count >= min_matches and key not in matched and (keys is None or key in keys):
+                    matched[key] = (story, count)
+        return matched
+
+    def __len__(self) -> int:
+        return len(self._keywords)
+
+
+def match_predictions(
+    predictions: List[Dict[str, Any]],
+    stories: List[Dict[str, Any]],
+    text_key: str = "text"
+) -> List[Tuple[Dict[str, Any], Dict[str, Any], int]]:
+    """Match a list of predictions against stories with a throwaway index.
+
+    Returns:
+        (prediction, first matching story, keyword matches) in prediction order
+    """
+    index = PredictionKeywordIndex()
+    for position, prediction in enumerate(predictions):
+        index.add(position, prediction.get(text_key, '') or '')
+    matched = index.first_matches(stories)
+    return [(predictions[p], *matched[p]) for p in sorted(matched)]
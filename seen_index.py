@@ -0,0 +1,119 @@
+"""Cross-run index of news entries that have already been processed.
+
+Records the GUID and normalized link of every article that went into a
+published episode, so later runs can skip those entries before downloading
+them. Records older than the retention window are pruned automatically.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from article_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+# Default index location and retention
+DEFAULT_SEEN_INDEX_PATH = "./data/seen_articles.db"
+DEFAULT_RETENTION_DAYS = 14
+
+
+def entry_keys(link: Optional[str], guid: Optional[str] = None) -> List[str]:
+    """Return the index keys identifying an entry (its link and its GUID)."""
+    keys = []
+    if link:
+        keys.append(f"link:{normalize_url(link)}")
+    if guid and guid != link:
+        keys.append(f"guid:{guid}")
+    return keys
+
+
+class SeenArticleIndex:
+    """SQLite-backed set of processed entry keys with timestamps."""
+
+    def __init__(
+        self,
+        index_path: str = DEFAULT_SEEN_INDEX_PATH,
+        retention_days: float = DEFAULT_RETENTION_DAYS
+    ):
+        self.index_path = index_path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(index_path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(index_path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS seen_articles ("
+                "key TEXT PRIMARY KEY, seen_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_seen_at ON seen_articles (seen_at)"
+            )
+        self.prune()
+
+    def is_seen(self, link: Optional[str], guid: Optional[str] = None) -> bool:
+        """Check whether an entry was processed by an earlier run."""
+        keys = entry_keys(link, guid)
+        if not keys:
+            return False
+        placeholders = ",".join("?" * len(keys))
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT 1 FROM seen_articles WHERE key IN ({placeholders}) LIMIT 1", keys
+            ).fetchone()
+        return row is not None
+
+    def mark_seen(self, articles: Iterable[Dict[str, Any]]) -> int:
+        """Record articles (dicts with ``link`` and optional ``guid``) as processed.
+
+        Returns:
+            Number of keys written
+        """
+        now = time.time()
+        rows = [
+            (key, now)
+            for article in articles
+            for key in entry_keys(article.get('link'), article.get('guid'))
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO seen_articles (key, seen_at) VALUES (?, ?)", rows
+            )
+        logger.info(f"Marked {len(rows)} article keys as seen")
+        return len(rows)
+
+    def prune(self, retention_days: Optional[float] = None) -> int:
+        """Delete records older than the retention window.
+
+        Returns:
+            Number of records removed
+        """
+        days = self.retention_days if retention_days is None else retention_days
+        cutoff = time.time() - days * 24 * 3600
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM seen_articles WHERE seen_at < ?", (cutoff,))
+        if cursor.rowcount:
+            logger.info(f"Pruned {cursor.rowcount} seen-article records")
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_articles").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# Singleton instance for easy access
+_seen_index: Optional[SeenArticleIndex] = None
+
+
+def get_seen_index(index_path: str = DEFAULT_SEEN_INDEX_PATH) -> SeenArticleIndex:
+    """Get or create the seen-article index singleton."""
+    global _seen_index
+    if _seen_index is None:
+        _seen_index = SeenArticleIndex(index_path)
+    return _seen_index
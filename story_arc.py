@@ -9,6 +9,10 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from collections import defaultdict
 
+from keyword_scanner import register_keyword_groups
+from prediction_index import match_predictions
+from story_features import story_features
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,13 +98,37 @@ THEME_KEYWORDS = {
 }
 
 
+# Keywords that signal points of debate/tension
+TENSION_KEYWORDS = {
+    "controversy": ["controversial", "debate", "critics", "backlash", "concern"],
+    "competition": ["versus", "competitor", "rival", "battle", "fight"],
+    "risk": ["risk", "danger", "warning", "threat", "fear"],
+    "opportunity": ["opportunity", "potential", "promise", "breakthrough"],
+    "uncertainty": ["uncertain", "unclear", "question", "doubt", "skeptic"],
+}
+
+# Trend indicators used for predictions
+TREND_INDICATORS = {
+    "growth": ["growing", "increasing", "surge", "boom", "expansion"],
+    "decline": ["falling", "decreasing", "decline", "crash", "downturn"],
+    "new_tech": ["announced", "launched", "unveiled", "introduced", "released"],
+    "acquisition": ["acquire", "merger", "buyout", "deal", "partnership"],
+}
+
+register_keyword_groups({
+    **{f"theme:{tid}": tdata["keywords"] for tid, tdata in THEME_KEYWORDS.items()},
+    **{f"tension:{name}": keywords for name, keywords in TENSION_KEYWORDS.items()},
+    **{f"trend:{name}": keywords for name, keywords in TREND_INDICATORS.items()},
+})
+
+
 def identify_theme(story: Dict[str, Any]) -> Optional[str]:
     """Identify the primary theme of a story based on keywords."""
-    text = f"{story.get('title', '')} {story.get('content', '')}".lower()
+    keywords = story_features(story).keywords
 
     theme_scores = {}
-    for theme_id, theme_data in THEME_KEYWORDS.items():
-        score = sum(1 for kw in theme_data["keywords"] if kw in text)
+    for theme_id in THEME_KEYWORDS:
+        score = keywords.count(f"theme:{theme_id}")
         if score > 0:
             theme_scores[theme_id] = score
 
@@ -112,19 +140,11 @@ def identify_theme(story: Dict[str, Any]) -> Optional[str]:
 
 def extract_tension_points(stories: List[Dict[str, Any]]) -> List[str]:
     """Extract potential points of debate/tension from stories."""
-    tension_keywords = {
-        "controversy": ["controversial", "debate", "critics", "backlash", "concern"],
-        "competition": ["versus", "competitor", "rival", "battle", "fight"],
-        "risk": ["risk", "danger", "warning", "threat", "fear"],
-        "opportunity": ["opportunity", "potential", "promise", "breakthrough"],
-        "uncertainty": ["uncertain", "unclear", "question", "doubt", "skeptic"],
-    }
-
     tensions = []
     for story in stories:
-        text = f"{story.get('title', '')} {story.get('content', '')}".lower()
-        for tension_type, keywords in tension_keywords.items():
-            if any(kw in text for kw in keywords):
+        keywords = story_features(story).keywords
+        for tension_type in TENSION_KEYWORDS:
+            if keywords.any(f"tension:{tension_type}"):
                 tensions.append(f"{tension_type}: {story.get('title', 'Unknown')}")
                 break
 
@@ -273,21 +293,11 @@ def check_predictions_against_stories(
     """Check if any past predictions came true in current stories."""
     callbacks = []
 
-    for pred in predictions:
-        pred_text = pred.get("prediction", "").lower()
-        pred_keywords = [w for w in pred_text.split() if len(w) > 4]
-
-        for story in stories:
-            story_text = f"{story.get('title', '')} {story.get('content', '')}".lower()
-            matches = sum(1 for kw in pred_keywords if kw in story_text)
-
-            if matches >= 2:  # At least 2 keyword matches
-                episode_ref = pred.get("episode_date", "a previous episode")
-                callbacks.append(
-                    f"Remember when we predicted '{pred.get('prediction', '')[:100]}...'? "
-                    f"Well, look at this: {story.get('title', '')}"
-                )
-                break
+    for pred, story, _ in match_predictions(predictions, stories, text_key="prediction"):
+        callbacks.append(
+            f"Remember when we predicted '{pred.get('prediction', '')[:100]}...'? "
+            f"Well, look at this: {story.get('title', '')}"
+        )
 
     return callbacks[:3]  # Limit to 3 callbacks per episode
 
@@ -296,20 +306,13 @@ def generate_predictions(stories: List[Dict[str, Any]]) -> List[str]:
     """Generate predictions based on current story trends."""
     predictions = []
 
-    # Look for trend indicators
-    trend_indicators = {
-        "growth": ["growing", "increasing", "surge", "boom", "expansion"],
-        "decline": ["falling", "decreasing", "decline", "crash", "downturn"],
-        "new_tech": ["announced", "launched", "unveiled", "introduced", "released"],
-        "acquisition": ["acquire", "merger", "buyout", "deal", "partnership"],
-    }
-
     for story in stories[:5]:  # Top 5 stories
-        text = f"{story.get('title', '')} {story.get('content', '')}".lower()
+        keywords = story_features(story).keywords
         title = story.get('title', 'This development')
 
-        for trend, keywords in trend_indicators.items():
-            if any(kw in text for kw in keywords):
+        # Look for trend indicators
+        for trend in TREND_INDICATORS:
+            if keywords.any(f"trend:{trend}"):
                 if trend == "growth":
                     predictions.append(f"Based on '{title[:50]}...', we predict this trend will continue and possibly accelerate in the coming months.")
                 elif trend == "decline":
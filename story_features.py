@@ -0,0 +1,131 @@
+"""Per-story derived text features, computed once and shared.
+
+Significance scoring, clustering, theme detection and prediction callbacks
+all need the same lowercased text, title keywords and keyword hits for a
+story. :func:`story_features` returns a :class:`StoryFeatures` whose
+properties are computed lazily on first use and memoized, and the same
+object is handed out for the same story dict during a run, so each article
+is processed once rather than once per scorer.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from article_record import ArticleRecord, content_length, content_prefix
+from keyword_scanner import KeywordHits, registry_version, scan_keywords
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Stories whose features are kept (least recently used are dropped)
+FEATURE_CACHE_SIZE = 4096
+
+TITLE_STOPWORDS = {
+    "the", "a", "an", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will",
+    "would", "could", "should", "may", "might", "must", "shall",
+    "to", "of", "in", "for", "on", "with", "at", "by", "from",
+    "as", "into", "through", "during", "before", "after", "and",
+    "but", "or", "nor", "so", "yet", "both", "either", "neither",
+}
+
+
+def extract_title_keywords(title: str) -> List[str]:
+    """Extract significant keywords from a title."""
+    words = re.findall(r'\b\w+\b', title.lower())
+    return [w for w in words if w not in TITLE_STOPWORDS and len(w) > 2]
+
+
+class StoryFeatures:
+    """Lazily computed, memoized text features of one story dict or record.
+
+    ``content_prefix`` and ``content_length`` never load an
+    :class:`ArticleRecord`'s full text; ``content`` and the features built
+    on it do. For records the lowercased ``text`` is rebuilt on each access
+    rather than kept, so only the derived features stay in memory.
+    """
+
+    def __init__(self, story: Dict[str, Any]):
+        self.story = story
+        self.title: str = story.get('title', '') or ''
+        self.content_prefix: str = content_prefix(story)
+        self.content_length: int = content_length(story)
+        # Records are read-only; a dict's content is checked by identity
+        self._content = None if isinstance(story, ArticleRecord) else story.get('content', '') or ''
+        self._text = None
+        self._keywords = None
+
+    @property
+    def content(self) -> str:
+        return self._content if self._content is not None else self.story['content']
+
+    @property
+    def text(self) -> str:
+        """Lowercased "title content" (memoized for dicts only)."""
+        if self._text is not None:
+            return self._text
+        text = f"{self.title} {self.content}".lower()
+        if self._content is not None:
+            self._text = text
+        return text
+
+    @cached_property
+    def tokens(self) -> FrozenSet[str]:
+        """Distinct lowercased words of the title and content."""
+        return frozenset(WORD_PATTERN.findall(self.text))
+
+    @cached_property
+    def title_keywords(self) -> List[str]:
+        return extract_title_keywords(self.title)
+
+    @property
+    def keywords(self) -> KeywordHits:
+        """Keyword-group hits for the title and content (one scan).
+
+        Rescanned if keyword groups were registered since (e.g. story_arc
+        imported after the story was scored), so every group is answered.
+        """
+        if self._keywords is None or self._keywords.version != registry_version():
+            self._keywords = scan_keywords(self.text)
+        return self._keywords
+
+    def is_current(self) -> bool:
+        """Whether the story's title and content are unchanged since creation."""
+        return (self.story.get('title', '') or '') is self.title and \
+            (self._content is None or (self.story.get('content', '') or '') is self._content)
+
+
+# Per-run memo keyed by dict identity; holding the story keeps its id unique.
+# Long-lived callers clear it when a run ends (see clear_feature_cache).
+_features: "OrderedDict[int, Tuple[Dict[str, Any], StoryFeatures]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def story_features(story: Dict[str, Any]) -> StoryFeatures:
+    """Return the shared features object for a story dict.
+
+    A story whose title or content was replaced gets fresh features.
+    """
+    key = id(story)
+    with _lock:
+        entry = _features.get(key)
+        if entry is not None and entry[0] is story and entry[1].is_current():
+            _features.move_to_end(key)
+            return entry[1]
+        features = StoryFeatures(story)
+        _features[key] = (story, features)
+        while len(_features) > FEATURE_CACHE_SIZE:
+            _features.popitem(last=False)
+        return features
+
+
+def clear_feature_cache() -> None:
+    """Drop all memoized story features (and the stories they hold).
+
+    Call at the end of a pipeline run so a long-lived process (scheduler,
+    web UI) does not keep the last run's stories in memory.
+    """
+    with _lock:
+        _features.clear()
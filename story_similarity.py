@@ -0,0 +1,201 @@
+"""Vectorized TF-IDF similarity for story clustering.
+
+Builds TF-IDF term matrices over every story's title and content sample at
+once and computes cosine similarities as blocked matrix products, instead
+of running SequenceMatcher pair by pair. Terms are hashed into a fixed
+number of columns (CRC32, so results are stable across runs), so no
+vocabulary is held. The matrices are stored sparse, as each row's nonzero
+columns and weights, so memory grows with the number of terms; only the
+blocks being multiplied are expanded to dense rows.
+
+The similarity test mirrors the clustering edges of
+``topic_curator.IncrementalStoryCombiner``: two stories match on title
+keyword overlap or content similarity, each against a configurable
+threshold. A title cosine test can be switched on, but is off by default,
+because clusters are connected components and a loose title match chains
+unrelated headlines that share a frame.
+"""
+
+import logging
+import re
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from near_duplicates import UnionFind
+from story_features import story_features
+
+logger = logging.getLogger(__name__)
+
+# Hashed feature columns per field
+TITLE_FEATURES = 1 << 11
+KEYWORD_FEATURES = 1 << 11
+CONTENT_FEATURES = 1 << 12
+
+# Rows per similarity block (block x stories results and block x features
+# dense tiles are materialized)
+BLOCK_SIZE = 512
+
+@dataclass
+class SimilarityThresholds:
+    """Cut-offs for the vectorized similarity test (all strict, like stories_are_similar).
+
+    ``keyword_overlap`` is the same measure as in stories_are_similar. The
+    cosine defaults were calibrated on the benchmark corpus: content > 0.3
+    matches the true same-story pairs (the content ratio > 0.4 also fires on
+    unrelated stories sharing boilerplate). ``title`` enables the title
+    cosine test (0.35 agrees best with the title ratio > 0.6); None, the
+    default, leaves it out like the blocked clustering path does.
+    """
+    title: Optional[float] = None
+    keyword_overlap: float = 0.5
+    content: float = 0.3
+    content_chars: int = 500
+
+
+def _hashed_counts(terms: Iterable[str], features: int) -> Counter:
+    return Counter(zlib.crc32(term.encode("utf-8")) % features for term in terms)
+
+
+def _word_terms(text: str) -> List[str]:
+    words = re.findall(r'\b\w+\b', text.lower())
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class SparseRows:
+    """Rows of a sparse float32 matrix in CSR layout.
+
+    Row ``i`` has weights ``values[indptr[i]:indptr[i + 1]]`` in columns
+    ``indices[indptr[i]:indptr[i + 1]]``; every other column is zero.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, values: np.ndarray, features: int):
+        self.indptr = indptr
+        self.indices = indices
+        self.values = values
+        self.features = features
+
+    @classmethod
+    def from_counts(cls, rows: Sequence[Counter], features: int) -> "SparseRows":
+        """Build from one {column: value} mapping per row."""
+        lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.fromiter(
+            (column for row in rows for column in row), dtype=np.int32, count=int(indptr[-1])
+        )
+        values = np.fromiter(
+            (value for row in rows for value in row.values()), dtype=np.float32, count=int(indptr[-1])
+        )
+        return cls(indptr, indices, values, features)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row_ids(self) -> np.ndarray:
+        """Row number of every stored value."""
+        return np.repeat(np.arange(len(self)), np.diff(self.indptr))
+
+    def dense(self, rows: slice = slice(None)) -> np.ndarray:
+        """Expand a range of rows to a dense (rows x features) array."""
+        start, stop, _ = rows.indices(len(self))
+        stop = max(start, stop)
+        block = np.zeros((stop - start, self.features), dtype=np.float32)
+        lo, hi = self.indptr[start], self.indptr[stop]
+        block_rows = np.repeat(np.arange(stop - start), np.diff(self.indptr[start:stop + 1]))
+        block[block_rows, self.indices[lo:hi]] = self.values[lo:hi]
+        return block
+
+    def dot_rows(self, rows: slice, columns: slice = slice(None)) -> np.ndarray:
+        """``rows x columns`` matrix of row dot products, computed in tiles."""
+        left = self.dense(rows)
+        start, stop, _ = columns.indices(len(self))
+        stop = max(start, stop)
+        result = np.empty((len(left), stop - start), dtype=np.float32)
+        for tile in range(start, stop, BLOCK_SIZE):
+            end = min(tile + BLOCK_SIZE, stop)
+            result[:, tile - start:end - start] = left @ self.dense(slice(tile, end)).T
+        return result
+
+
+def tfidf_matrix(documents: Sequence[List[str]], features: int) -> SparseRows:
+    """Build an L2-normalized TF-IDF matrix (documents x hashed features).
+
+    Uses sublinear term frequency and smoothed IDF.
+    """
+    matrix = SparseRows.from_counts([_hashed_counts(terms, features) for terms in documents], features)
+    matrix.values = 1.0 + np.log(matrix.values)
+    df = np.bincount(matrix.indices, minlength=features)
+    idf = (np.log((1 + len(documents)) / (1 + df)) + 1).astype(np.float32)
+    matrix.values *= idf[matrix.indices]
+    row_ids = matrix.row_ids()
+    norms = np.sqrt(np.bincount(row_ids, weights=matrix.values ** 2, minlength=len(matrix)))
+    matrix.values /= norms[row_ids].astype(np.float32)
+    return matrix
+
+
+class TfidfSimilarity:
+    """Batched similarity over a fixed set of stories.
+
+    Usage:
+        engine = TfidfSimilarity(stories)
+        clusters = engine.cluster()    # lists of story indices
+    """
+
+    def __init__(
+        self,
+        stories: Sequence[Dict[str, Any]],
+        thresholds: Optional[SimilarityThresholds] = None
+    ):
+        self.thresholds = thresholds or SimilarityThresholds()
+        self.size = len(stories)
+        self.titles = tfidf_matrix(
+            [_word_terms(story_features(s).title[:500]) for s in stories], TITLE_FEATURES
+        )
+        self.contents = tfidf_matrix(
+            [_word_terms(story_features(s).content_prefix[:self.thresholds.content_chars]) for s in stories],
+            CONTENT_FEATURES,
+        )
+
+        # Binary keyword sets: overlap = |shared| / max(|a|, |b|)
+        keyword_columns = [
+            _hashed_counts(set(story_features(s).title_keywords), KEYWORD_FEATURES).keys() for s in stories
+        ]
+        self.keywords = SparseRows.from_counts([Counter(c) for c in keyword_columns], KEYWORD_FEATURES)
+        self.keyword_counts = np.diff(self.keywords.indptr).astype(np.float32)
+
+    def title_similarity(self, rows: slice, columns: slice = slice(None)) -> np.ndarray:
+        return self.titles.dot_rows(rows, columns)
+
+    def content_similarity(self, rows: slice, columns: slice = slice(None)) -> np.ndarray:
+        return self.contents.dot_rows(rows, columns)
+
+    def keyword_overlap(self, rows: slice, columns: slice = slice(None)) -> np.ndarray:
+        shared = self.keywords.dot_rows(rows, columns)
+        largest = np.maximum(self.keyword_counts[rows, None], self.keyword_counts[None, columns])
+        return np.divide(shared, largest, out=np.zeros_like(shared), where=largest > 0)
+
+    def similar(self, rows: slice, columns: slice = slice(None)) -> np.ndarray:
+        """Boolean matrix of story pairs that pass any of the enabled tests."""
+        t = self.thresholds
+        result = self.keyword_overlap(rows, columns) > t.keyword_overlap
+        result |= self.content_similarity(rows, columns) > t.content
+        if t.title is not None:
+            result |= self.title_similarity(rows, columns) > t.title
+        return result
+
+    def cluster(self) -> List[List[int]]:
+        """Connected components of the similarity graph, as story index lists
+        ordered by first appearance (membership does not depend on input order).
+        """
+        components = UnionFind(self.size)
+        for start in range(0, self.size, BLOCK_SIZE):
+            end = min(start + BLOCK_SIZE, self.size)
+            block = self.similar(slice(start, end), slice(0, end))
+            rows, columns = np.nonzero(np.tril(block, k=start - 1))
+            for row, column in zip(rows.tolist(), columns.tolist()):
+                components.union(start + row, column)
+        return components.groups()
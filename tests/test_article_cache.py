@@ -0,0 +1,74 @@
+"""Tests for article_cache module."""
+
+import os
+import time
+
+import pytest
+
+from article_cache import ArticleCache, normalize_url, url_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArticleCache(str(tmp_path / "articles"), ttl_seconds=60, max_bytes=10_000)
+
+
+class TestNormalizeUrl:
+    """Tests for URL normalization."""
+
+    def test_strips_tracking_and_fragment(self):
+        assert normalize_url("HTTPS://Example.com/a/?utm_source=x&b=2&a=1#top") == \
+            "https://example.com/a?a=1&b=2"
+
+    def test_equivalent_urls_share_key(self):
+        assert url_key("https://example.com/story/") == url_key("https://EXAMPLE.com/story?fbclid=1")
+
+    def test_namespaces_are_distinct(self):
+        assert url_key("https://example.com/a", "text") != url_key("https://example.com/a", "website")
+
+
+class TestArticleCache:
+    """Tests for the on-disk article cache."""
+
+    def test_miss_then_hit(self, cache):
+        assert cache.get("https://example.com/a") is None
+        cache.put("https://example.com/a", "Body text")
+        assert cache.get("https://example.com/a/") == "Body text"
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_a_miss(self, cache):
+        cache.put("https://example.com/a", "Body text")
+        path = cache._path(url_key("https://example.com/a"))
+        old = time.time() - 120
+        os.utime(path, (old, old))
+        assert cache.get("https://example.com/a") is None
+        assert not os.path.exists(path)
+
+    def test_evicts_least_recently_used(self, cache):
+        for i in range(3):
+            cache.put(f"https://example.com/{i}", "x" * 3000)
+            path = cache._path(url_key(f"https://example.com/{i}"))
+            stamp = time.time() - 30 + i
+            os.utime(path, (stamp, stamp))
+        cache.get("https://example.com/0")  # Touch the oldest entry
+
+        cache.put("https://example.com/3", "x" * 3000)
+
+        assert cache.total_bytes <= 10_000
+        assert cache.get("https://example.com/0") is not None
+        assert cache.get("https://example.com/1") is None
+        assert cache.get("https://example.com/2") is not None
+
+    def test_full_cache_is_not_rescanned_on_every_put(self, cache, monkeypatch):
+        scans = []
+        evict = cache.evict
+        monkeypatch.setattr(cache, "evict", lambda: scans.append(1) or evict())
+        for i in range(200):
+            cache.put(f"https://example.com/{i}", "x" * 200)
+        assert cache.total_bytes <= 10_000
+        assert len(scans) <= 200 * 200 // 1000 + 1  # One scan per 10% of the cap written
+
+    def test_size_survives_reload(self, cache):
+        cache.put("https://example.com/a", "abc")
+        assert ArticleCache(cache.cache_dir).total_bytes == 3
@@ -0,0 +1,127 @@
+"""Tests for article_parser module."""
+
+from concurrent.futures.process import BrokenProcessPool
+
+import article_parser
+from article_parser import LEAN_MIN_TEXT_LENGTH, ParsePool, extract_lean, parse_article_html
+
+BODY = "Body paragraph with enough real text in it to count towards the score."
+
+
+def make_page(paragraphs=8):
+    return (
+        '<html><head><meta property="og:title" content="Real Title"><title>Site</title></head>'
+        '<body><nav><p>Home World Tech Sports Business Opinion Culture</p></nav><main>'
+        + '<div class="related">' + "<p>Related story teaser that is long enough to count.</p>" * 3 + "</div>"
+        + '<div class="article-body">' + f"<p>{BODY}</p>" * paragraphs
+        + '<p><a href="/x">A paragraph that is nothing but a long link to elsewhere</a></p></div>'
+        + '<div id="comments">' + "<p>Reader comment that is long enough to be scored too.</p>" * 10 + "</div>"
+        + "</main><footer><p>Copyright notice and other footer text here</p></footer></body></html>"
+    )
+
+
+class TestExtractLean:
+    """Tests for the readability-style extractor."""
+
+    def test_picks_article_body(self):
+        title, text = extract_lean(make_page())
+        assert title == "Real Title"
+        assert text.split("\n\n") == [BODY] * 8
+
+    def test_falls_back_to_title_tag(self):
+        title, _ = extract_lean("<html><head><title> Plain </title></head><body></body></html>")
+        assert title == "Plain"
+
+    def test_page_without_paragraphs(self):
+        assert extract_lean("<html><body><div>Just a div</div></body></html>") == ("", "")
+
+    def test_empty_document(self):
+        assert extract_lean("") == ("", "")
+
+    def test_hinted_html_class_is_kept(self):
+        page = make_page().replace("<html>", '<html class="js cookies">')
+        _, text = extract_lean(page)
+        assert text.split("\n\n") == [BODY] * 8
+
+    def test_hinted_body_class_is_kept(self):
+        page = make_page().replace("<body>", '<body class="page has-sidebar">')
+        _, text = extract_lean(page)
+        assert text.split("\n\n") == [BODY] * 8
+
+
+class TestParseArticleHtml:
+    """Tests for the lean-first parse with newspaper fallback."""
+
+    def test_long_lean_text_skips_newspaper(self, monkeypatch):
+        def fail(url, html):
+            raise AssertionError("newspaper should not run")
+
+        monkeypatch.setattr(article_parser, "parse_with_newspaper", fail)
+        _, text = parse_article_html("http://example.com/a", make_page())
+        assert len(text) >= LEAN_MIN_TEXT_LENGTH
+
+    def test_short_lean_text_falls_back(self, monkeypatch):
+        monkeypatch.setattr(
+            article_parser, "parse_with_newspaper", lambda url, html: ("NP Title", "x" * 800)
+        )
+        title, text = parse_article_html("http://example.com/a", make_page(paragraphs=1))
+        assert (title, text) == ("NP Title", "x" * 800)
+
+    def test_lean_error_falls_back(self, monkeypatch):
+        def fail(html):
+            raise AssertionError("lxml failure")
+
+        monkeypatch.setattr(article_parser, "extract_lean", fail)
+        monkeypatch.setattr(
+            article_parser, "parse_with_newspaper", lambda url, html: ("NP Title", "x" * 800)
+        )
+        assert parse_article_html("http://example.com/a", make_page()) == ("NP Title", "x" * 800)
+
+    def test_keeps_lean_text_when_fallback_is_shorter(self, monkeypatch):
+        monkeypatch.setattr(article_parser, "parse_with_newspaper", lambda url, html: ("", ""))
+        title, text = parse_article_html("http://example.com/a", make_page(paragraphs=1))
+        assert (title, text) == ("Real Title", BODY)
+
+
+class TestParsePool:
+    """Tests for starting parser processes only under a backlog."""
+
+    def test_parses_inline_without_backlog(self):
+        pool = ParsePool(workers=2, backlog=4)
+        pages = [("http://example.com/a", make_page())] * 3
+        assert pool.parse_many(pages) == [parse_article_html(*pages[0])] * 3
+        assert pool.parse(*pages[0]) == parse_article_html(*pages[0])
+        assert pool._executor is None
+        pool.shutdown()
+
+    def test_single_worker_never_starts_processes(self):
+        pool = ParsePool(workers=1, backlog=1)
+        pool.parse_many([("http://example.com/a", make_page())] * 5)
+        assert pool._executor is None
+
+    def test_broken_pool_finishes_inline(self):
+        class BrokenFuture:
+            def result(self):
+                raise BrokenProcessPool("worker killed")
+
+        class DoneFuture:
+            def __init__(self, value):
+                self.value = value
+
+            def result(self):
+                return self.value
+
+        class Executor:
+            def __init__(self):
+                self.submitted = 0
+
+            def submit(self, fn, url, html):
+                self.submitted += 1
+                return DoneFuture(("first", "")) if self.submitted == 1 else BrokenFuture()
+
+        pool = ParsePool(workers=2, backlog=1)
+        pool._executor = Executor()
+        pages = [("http://example.com/a", make_page())] * 3
+        results = pool.parse_many(pages)
+        assert results == [("first", "")] + [parse_article_html(*pages[0])] * 2
+        assert pool._broken
@@ -0,0 +1,59 @@
+"""Tests for article_record module."""
+
+from datetime import datetime
+
+import pytest
+
+from article_cache import ArticleCache
+from article_record import PREFIX_CHARS, ArticleRecord, content_length, content_prefix
+from story_features import story_features
+
+LONG_TEXT = "Chipmakers reported record demand. " * 200
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ArticleCache(str(tmp_path / "articles"))
+
+
+class TestArticleRecord:
+    """Tests for the compact article representation."""
+
+    def test_keeps_only_a_prefix(self, cache):
+        record = ArticleRecord("Chips", "https://a.example/1", LONG_TEXT, cache=cache)
+        assert record.prefix == LONG_TEXT[:PREFIX_CHARS]
+        assert record.content_length == len(LONG_TEXT)
+        assert record["content"] == LONG_TEXT
+        assert cache.stats()["hits"] == 1
+
+    def test_reads_text_cached_by_the_fetcher(self, cache):
+        cache.put("https://a.example/1", LONG_TEXT)
+        record = ArticleRecord("Chips", "https://a.example/1", LONG_TEXT, cache=cache, cached_as="text")
+        assert record.content == LONG_TEXT
+
+    def test_falls_back_to_prefix_when_evicted(self, cache):
+        record = ArticleRecord("Chips", "https://a.example/1", LONG_TEXT, cache=cache, cached_as="text")
+        assert record.content == record.prefix
+
+    def test_short_text_and_no_cache_stay_in_memory(self):
+        assert ArticleRecord("Chips", "https://a.example/1", "Short").content == "Short"
+        assert ArticleRecord("Chips", "https://a.example/1", LONG_TEXT).content == LONG_TEXT
+
+    def test_behaves_like_an_article_dict(self):
+        published = datetime(2026, 1, 1)
+        record = ArticleRecord("Chips", "https://a.example/1", "Short", "guid-1", published)
+        assert dict(record) == {
+            "title": "Chips", "content": "Short", "link": "https://a.example/1",
+            "guid": "guid-1", "published": published,
+        }
+        assert record.get("source", "Unknown") == "Unknown"
+        with pytest.raises(KeyError):
+            record["source"]
+
+    def test_helpers_do_not_load_full_text(self, cache):
+        record = ArticleRecord("Chips", "https://a.example/1", LONG_TEXT, cache=cache)
+        features = story_features(record)
+        assert content_prefix(record, 500) == features.content_prefix[:500] == LONG_TEXT[:500]
+        assert content_length(record) == features.content_length == len(LONG_TEXT)
+        assert content_length({"content": "abc"}) == 3
+        assert cache.stats()["hits"] == 0
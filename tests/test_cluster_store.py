@@ -0,0 +1,94 @@
+"""Tests for cluster_store module."""
+
+import time
+
+import pytest
+
+from cluster_store import ClusterStore
+from topic_curator import select_top_stories
+
+GPT5 = {"title": "OpenAI launches GPT-5 model", "content": "OpenAI announced GPT-5 today. " * 20,
+        "link": "https://a.example/gpt5"}
+GPT5_FOLLOWUP = {"title": "OpenAI GPT-5 model launches to developers", "content": "Developers got access. " * 20,
+                 "link": "https://b.example/gpt5"}
+BITCOIN = {"title": "Bitcoin hits record high", "content": "Bitcoin rose 10% to $100,000. " * 20,
+           "link": "https://c.example/btc"}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ClusterStore(str(tmp_path / "clusters.db"), retention_hours=24)
+    yield store
+    store.close()
+
+
+class TestClusterStore:
+    """Tests for cross-run story clusters."""
+
+    def test_new_articles_join_stored_clusters(self, store):
+        first = store.cluster([GPT5, BITCOIN])
+        reopened = ClusterStore(store.store_path)
+        second = reopened.cluster(iter([GPT5_FOLLOWUP]))
+        reopened.close()
+
+        gpt5_cluster = next(i for i, members in first.items() if GPT5 in members)
+        assert second == {gpt5_cluster: [GPT5_FOLLOWUP]}
+        assert len(store) == 2
+
+    def test_refetched_article_is_not_stored_twice(self, store):
+        first = store.cluster([GPT5])
+        second = store.cluster([dict(GPT5)])
+        assert list(second) == list(first)
+        assert store.growth_rates(second, window_hours=24) == {list(first)[0]: 0.0}
+
+    def test_rerun_does_not_count_refetched_articles(self, store):
+        first = store.cluster([GPT5])
+        # The episode failed, so the rerun fetches GPT5 again along with a new article
+        second = store.cluster([dict(GPT5), GPT5_FOLLOWUP])
+        assert list(second) == list(first)
+        assert store.growth_rates(second, window_hours=24) == {list(first)[0]: 0.0}
+
+    def test_growth_excludes_current_run(self, store):
+        first = store.cluster([GPT5, BITCOIN])
+        assert set(store.growth_rates(first).values()) == {0.0}
+        second = store.cluster([GPT5_FOLLOWUP])
+        gpt5_cluster = next(i for i, members in first.items() if GPT5 in members)
+        assert store.growth_rates(second, window_hours=24) == {gpt5_cluster: 1.0}
+
+    def test_merged_cluster_keeps_latest_update(self, store):
+        a = {"title": "Nvidia unveils Blackwell chips", "content": "", "link": "https://a.example/1"}
+        c = {"title": "Blackwell chips for datacenters ship", "content": "", "link": "https://c.example/1"}
+        first = store.cluster([a, c])
+        target, merged = sorted(first)
+        store._conn.execute("UPDATE clusters SET updated_at = ? WHERE id = ?", (time.time() - 20 * 3600, target))
+        store._conn.execute("UPDATE clusters SET updated_at = ? WHERE id = ?", (time.time() - 3600, merged))
+
+        # A refetch of a with a bridging headline merges the clusters without adding a member
+        bridge = dict(a, title="Nvidia unveils Blackwell chips for datacenters")
+        assert list(store.cluster([bridge])) == [target]
+        assert store.prune(retention_hours=10) == 0
+        assert len(store) == 1
+
+    def test_bridging_article_merges_clusters(self, store):
+        a = {"title": "Nvidia unveils Blackwell chips", "content": "", "link": "https://a.example/1"}
+        c = {"title": "Blackwell chips for datacenters ship", "content": "", "link": "https://c.example/1"}
+        b = {"title": "Nvidia unveils Blackwell chips for datacenters", "content": "", "link": "https://b.example/1"}
+        first = store.cluster([a, c])
+        assert len(first) == 2
+        second = store.cluster([b])
+        assert list(second) == [min(first)]
+        assert len(store) == 1
+
+    def test_expires_stale_clusters(self, store):
+        store.cluster([GPT5])
+        store._conn.execute("UPDATE clusters SET updated_at = ?", (time.time() - 48 * 3600,))
+        assert store.prune() == 1
+        assert len(store) == 0
+
+    def test_growth_boosts_ranking(self, store):
+        store.cluster([GPT5])
+        selected = select_top_stories([GPT5_FOLLOWUP, BITCOIN], cluster_store=store)
+        gpt5 = next(s for s in selected if s.title == GPT5_FOLLOWUP["title"])
+        assert gpt5.cluster_id is not None
+        assert gpt5.growth_rate == pytest.approx(1 / 2)
+        assert selected[0] is gpt5
@@ -0,0 +1,47 @@
+"""Tests for content_extraction module."""
+
+import pytest
+
+pytest.importorskip("pptx")
+
+import article_cache  # noqa: E402
+import content_extraction  # noqa: E402
+from article_cache import ArticleCache  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = ArticleCache(str(tmp_path / "articles"))
+    monkeypatch.setattr(article_cache, "_article_cache", cache)
+    return cache
+
+
+class TestExtractWebsiteContent:
+    """Tests for the cached website extraction."""
+
+    def test_hit_skips_network(self, monkeypatch, cache):
+        def fail(url):
+            raise AssertionError("network should not be used")
+
+        cache.put("https://example.com/a", "Cached body", namespace="website")
+        monkeypatch.setattr(content_extraction, "_extract_website_content", fail)
+        assert content_extraction.extract_website_content("https://example.com/a") == "Cached body"
+
+    def test_miss_stores_result(self, monkeypatch, cache):
+        calls = []
+
+        def extract(url):
+            calls.append(url)
+            return "Title\n\nBody"
+
+        monkeypatch.setattr(content_extraction, "_extract_website_content", extract)
+        assert content_extraction.extract_website_content("https://example.com/a") == "Title\n\nBody"
+        assert cache.get("https://example.com/a", namespace="website") == "Title\n\nBody"
+        assert cache.get("https://example.com/a") is None
+        assert content_extraction.extract_website_content("https://example.com/a") == "Title\n\nBody"
+        assert calls == ["https://example.com/a"]
+
+    def test_empty_result_is_not_cached(self, monkeypatch, cache):
+        monkeypatch.setattr(content_extraction, "_extract_website_content", lambda url: "")
+        assert content_extraction.extract_website_content("https://example.com/a") == ""
+        assert cache.get("https://example.com/a", namespace="website") is None
@@ -0,0 +1,107 @@
+"""Tests for domain_health module."""
+
+import pytest
+
+from domain_health import CLOSED, HALF_OPEN, OPEN, DomainHealthTracker, domain_of
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(tmp_path, clock):
+    return DomainHealthTracker(str(tmp_path / "domains.json"), failure_threshold=2, clock=clock)
+
+
+class TestDomainOf:
+    """Tests for registrable domain extraction."""
+
+    def test_strips_subdomains(self):
+        assert domain_of("https://www.theverge.com/a") == "theverge.com"
+        assert domain_of("https://news.bbc.co.uk/a") == "bbc.co.uk"
+
+    def test_keeps_ip_hosts(self):
+        assert domain_of("http://127.0.0.1:8080/a") == "127.0.0.1"
+
+
+class TestDomainHealthTracker:
+    """Tests for the per-domain circuit breaker."""
+
+    def test_opens_after_consecutive_failures(self, tracker):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        assert tracker.allow_request(url)
+        tracker.record_failure(url, 1.0)
+        assert not tracker.allow_request(url)
+        assert tracker.get(url).state == OPEN
+
+    def test_success_resets_failure_streak(self, tracker):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_success(url, 0.5)
+        tracker.record_failure(url, 1.0)
+        assert tracker.get(url).state == CLOSED
+
+    def test_half_open_allows_single_probe(self, tracker, clock):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_failure(url, 1.0)
+        clock.now += tracker.get(url).cooldown
+
+        assert tracker.allow_request(url)
+        assert tracker.get(url).state == HALF_OPEN
+        assert not tracker.allow_request(url)
+
+        tracker.record_success(url, 0.2)
+        assert tracker.get(url).state == CLOSED
+
+    def test_failed_probe_doubles_cooldown(self, tracker, clock):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_failure(url, 1.0)
+        cooldown = tracker.get(url).cooldown
+        clock.now += cooldown
+
+        assert tracker.allow_request(url)
+        tracker.record_failure(url, 1.0)
+        assert tracker.get(url).state == OPEN
+        assert tracker.get(url).cooldown == cooldown * 2
+
+    def test_released_probe_stays_half_open(self, tracker, clock):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_failure(url, 1.0)
+        clock.now += tracker.get(url).cooldown
+
+        assert tracker.allow_request(url)
+        tracker.release_probe(url)
+        assert tracker.get(url).state == HALF_OPEN
+        assert tracker.allow_request(url)
+
+    def test_seeded_domains_start_open(self, tmp_path, clock):
+        tracker = DomainHealthTracker(
+            str(tmp_path / "domains.json"), seed_blocked=["wsj.com"], clock=clock
+        )
+        assert tracker.is_open("https://www.wsj.com/articles/x")
+
+    def test_state_persists(self, tracker, tmp_path, clock):
+        url = "https://example.com/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_failure(url, 3.0)
+        tracker.save()
+
+        reloaded = DomainHealthTracker(tracker.state_path, clock=clock)
+        stats = reloaded.get(url)
+        assert stats.state == OPEN
+        assert stats.failures == 2
+        assert stats.avg_latency == pytest.approx(1.6)
@@ -192,3 +192,131 @@ class TestEpisodeMemoryManager:
         context = memory_manager.get_host_memory_context()
         assert "EPISODE HISTORY" in context
         assert "AI Revolution" in context
+
+
+class TestSqliteMemoryStore:
+    """Tests for the SQLite memory backend."""
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "memory.db")
+        manager1 = EpisodeMemoryManager(memory_path=path)
+        manager1.add_prediction("Standalone prediction", "test", confidence="high")
+        manager1.record_episode(
+            main_theme="Test Theme",
+            topics_covered=["Topic 1", "Topic 2"],
+            predictions_made=["Pred 1", "Pred 2"],
+            key_stories=["Story 1"]
+        )
+        manager1.record_episode(
+            main_theme="Second Theme",
+            topics_covered=["Topic 1"],
+            predictions_made=[],
+            key_stories=[]
+        )
+        manager1.resolve_prediction("Pred 1", "correct", notes="It happened")
+
+        manager2 = EpisodeMemoryManager(memory_path=path)
+        assert manager2.memory.predictions == manager1.memory.predictions
+        assert manager2.memory.episodes == manager1.memory.episodes
+        assert manager2.get_topic_frequency("Topic 1") == 2
+        assert manager2.memory.predictions[1]['resolved'] is True
+        assert manager2.store._conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_record_episode_is_one_transaction(self, tmp_path):
+        manager = EpisodeMemoryManager(memory_path=str(tmp_path / "memory.db"))
+        statements = []
+        manager.store._conn.set_trace_callback(statements.append)
+        manager.record_episode(
+            main_theme="AI",
+            topics_covered=["AI News", "Tech"],
+            predictions_made=["Pred 1", "Pred 2", "Pred 3"],
+            key_stories=[]
+        )
+        assert sum(1 for s in statements if s == "COMMIT") == 1
+
+    def test_migrates_json_on_first_load(self, tmp_path):
+        legacy = tmp_path / "memory.json"
+        json_manager = EpisodeMemoryManager(memory_path=str(legacy))
+        json_manager.record_episode(
+            main_theme="Legacy",
+            topics_covered=["Old Topic"],
+            predictions_made=["Old prediction"],
+            key_stories=["Old story"]
+        )
+
+        manager = EpisodeMemoryManager(memory_path=str(tmp_path / "memory.db"))
+        assert manager.memory.episodes == json_manager.memory.episodes
+        assert manager.memory.predictions == json_manager.memory.predictions
+        assert manager.get_topic_frequency("Old Topic") == 1
+
+        # Later loads read the database only
+        manager.record_episode("New", ["Old Topic"], [], [])
+        reopened = EpisodeMemoryManager(memory_path=str(tmp_path / "memory.db"))
+        assert len(reopened.memory.episodes) == 2
+        assert reopened.get_topic_frequency("Old Topic") == 2
+
+
+class TestCallbackIndex:
+    """Tests for the prediction keyword index behind callbacks."""
+
+    def test_resolved_predictions_stop_matching(self, memory_manager):
+        memory_manager.add_prediction("Bitcoin will reach new highs this quarter", "crypto")
+        stories = [{'title': 'Bitcoin Reaches Record Highs', 'content': 'New highs this quarter.'}]
+        assert len(memory_manager.get_callbacks_for_stories(stories)) == 1
+
+        memory_manager.resolve_prediction("Bitcoin will reach new highs this quarter", "correct")
+        assert memory_manager.get_callbacks_for_stories(stories) == []
+
+    def test_index_rebuilt_on_load(self, temp_memory_file):
+        EpisodeMemoryManager(memory_path=temp_memory_file).record_episode(
+            main_theme="Crypto",
+            topics_covered=["Bitcoin"],
+            predictions_made=["Bitcoin will reach new highs this quarter"],
+            key_stories=[]
+        )
+        manager = EpisodeMemoryManager(memory_path=temp_memory_file)
+        stories = [{'title': 'Bitcoin Reaches Record Highs', 'content': 'New highs this quarter.'}]
+        callbacks = manager.get_callbacks_for_stories(stories)
+        assert callbacks[0]['match_strength'] == 3
+
+
+class TestUnresolvedIndex:
+    """Tests for the date-ordered unresolved prediction index."""
+
+    def _add_dated(self, manager, text, days_ago):
+        manager.add_prediction(text, "topic")
+        manager._untrack_prediction(len(manager.memory.predictions) - 1)
+        date = (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+        manager.memory.predictions[-1]['episode_date'] = date
+        manager._track_prediction(len(manager.memory.predictions) - 1)
+
+    def test_age_window_keeps_insertion_order(self, memory_manager):
+        self._add_dated(memory_manager, "Recent", 5)
+        self._add_dated(memory_manager, "Old", 120)
+        self._add_dated(memory_manager, "Older but in window", 60)
+
+        texts = [p['text'] for p in memory_manager.get_unresolved_predictions()]
+        assert texts == ["Recent", "Older but in window"]
+        assert [p['text'] for p in memory_manager.get_unresolved_predictions(max_age_days=30)] == ["Recent"]
+        assert len(memory_manager.get_unresolved_predictions(max_age_days=365)) == 3
+
+    def test_results_refresh_after_changes(self, memory_manager):
+        memory_manager.add_prediction("First", "topic")
+        assert len(memory_manager.get_unresolved_predictions()) == 1
+        memory_manager.add_prediction("Second", "topic")
+        assert len(memory_manager.get_unresolved_predictions()) == 2
+        memory_manager.resolve_prediction("First", "correct")
+        assert [p['text'] for p in memory_manager.get_unresolved_predictions()] == ["Second"]
+
+    def test_track_record_counts(self, temp_memory_file):
+        manager = EpisodeMemoryManager(memory_path=temp_memory_file)
+        manager.record_episode("AI", ["AI"], ["One", "Two", "Three"], [])
+        manager.resolve_prediction("One", "correct")
+        manager.resolve_prediction("Two", "incorrect")
+        manager.resolve_prediction("Two", "correct")  # Re-resolving replaces the outcome
+        assert "TRACK RECORD: 2/2 correct" in manager.get_host_memory_context()
+
+        reopened = EpisodeMemoryManager(memory_path=temp_memory_file)
+        context = reopened.get_host_memory_context()
+        assert "TRACK RECORD: 2/2 correct" in context
+        assert "PENDING PREDICTIONS: 1" in context
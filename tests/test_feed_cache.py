@@ -0,0 +1,59 @@
+"""Tests for feed_cache module."""
+
+import time
+
+import pytest
+
+from feed_cache import FeedCache, entry_from_dict, entry_to_dict
+from benchmarks.news_server import StandInNewsServer
+
+
+@pytest.fixture
+def news_server():
+    with StandInNewsServer(sites=1, feeds_per_site=1, items_per_feed=3, latency=0) as server:
+        yield server
+
+
+class TestEntrySerialization:
+    """Tests for cached entry round-tripping."""
+
+    def test_round_trip(self):
+        published = time.gmtime(0)
+        entry = {"title": "T", "link": "http://x/1", "summary": "S", "published_parsed": published}
+        restored = entry_from_dict(entry_to_dict(entry))
+        assert restored.title == "T"
+        assert restored.link == "http://x/1"
+        assert restored.published_parsed[:6] == published[:6]
+
+
+class TestFeedCache:
+    """Tests for conditional-GET feed polling."""
+
+    def test_second_poll_is_not_modified(self, news_server, tmp_path):
+        cache = FeedCache(str(tmp_path / "feeds.json"))
+        feed_url = news_server.feed_urls[0]
+
+        first = cache.parse(feed_url)
+        second = cache.parse(feed_url)
+
+        assert news_server.not_modified == 1
+        assert cache.hits == 1 and cache.misses == 1
+        assert [e.link for e in second.entries] == [e.link for e in first.entries]
+
+    def test_persists_across_instances(self, news_server, tmp_path):
+        path = str(tmp_path / "feeds.json")
+        feed_url = news_server.feed_urls[0]
+        cache = FeedCache(path)
+        cache.parse(feed_url)
+        cache.save()
+
+        reloaded = FeedCache(path)
+        feed = reloaded.parse(feed_url)
+        assert reloaded.hits == 1
+        assert len(feed.entries) == 3
+        assert feed.entries[0].published_parsed is not None
+
+    def test_corrupt_file_starts_fresh(self, tmp_path):
+        path = tmp_path / "feeds.json"
+        path.write_text("{not json")
+        assert FeedCache(str(path)).get("http://x/feed") is None
@@ -143,9 +143,12 @@ class TestHistoryStorage:
     """Tests for history storage format."""
 
     def test_uses_json_storage(self):
-        """History should use JSON for storage."""
+        """History should use JSON for storage (a snapshot plus a JSON-lines journal)."""
         with open('history.py', 'r') as f:
             content = f.read()
+        assert 'JournalStore' in content
+        with open('journal_store.py', 'r') as f:
+            content = f.read()
         assert 'json.load' in content
         assert 'json.dump' in content
 
@@ -160,3 +163,74 @@ class TestHistoryStorage:
         with open('history.py', 'r') as f:
             content = f.read()
         assert 'def create_session_entry' in content
+
+
+class TestHistoryManager:
+    """Tests for HistoryManager persistence."""
+
+    def _entry(self, session_id):
+        from history import SessionEntry
+        return SessionEntry(session_id, "2026-01-01T10:00:00", "feed", "rss", "Auto", "Jack", "Corr", "Script")
+
+    def test_save_get_delete(self, tmp_path):
+        from history import HistoryManager
+        manager = HistoryManager(tmp_path / "sessions.json")
+        manager.save_session(self._entry("a"))
+        manager.save_session(self._entry("b"))
+        assert [s.session_id for s in manager.get_sessions()] == ["b", "a"]
+        assert manager.delete_session("a") is True
+        assert manager.delete_session("missing") is False
+
+        reopened = HistoryManager(tmp_path / "sessions.json")
+        assert [s.session_id for s in reopened.get_sessions()] == ["b"]
+        assert reopened.get_session("b").host_1_name == "Jack"
+
+    def test_cap_and_clear(self, tmp_path):
+        from history import MAX_SESSIONS, HistoryManager
+        manager = HistoryManager(tmp_path / "sessions.json")
+        for i in range(MAX_SESSIONS + 5):
+            manager.save_session(self._entry(str(i)))
+        sessions = manager.get_sessions(limit=MAX_SESSIONS + 10)
+        assert len(sessions) == MAX_SESSIONS
+        assert sessions[0].session_id == str(MAX_SESSIONS + 4)
+
+        manager.clear_all()
+        assert HistoryManager(tmp_path / "sessions.json").get_sessions() == []
+
+    def test_reads_legacy_file(self, tmp_path):
+        from history import HistoryManager
+        path = tmp_path / "sessions.json"
+        path.write_text(json.dumps([self._entry("old").to_dict()]))
+        manager = HistoryManager(path)
+        manager.save_session(self._entry("new"))
+        assert [s.session_id for s in manager.get_sessions()] == ["new", "old"]
+
+    def test_cursor_pagination(self, tmp_path):
+        from history import HistoryManager
+        manager = HistoryManager(tmp_path / "sessions.json")
+        for i in range(7):
+            manager.save_session(self._entry(str(i)))
+
+        pages, cursor = [], None
+        while True:
+            page = manager.get_sessions(limit=3, after=cursor)
+            if not page:
+                break
+            pages.append([s.session_id for s in page])
+            cursor = page[-1].session_id
+        assert pages == [["6", "5", "4"], ["3", "2", "1"], ["0"]]
+        assert manager.get_sessions(after="missing") == []
+
+    def test_cache_reloads_only_on_file_change(self, tmp_path):
+        from history import HistoryManager
+        manager = HistoryManager(tmp_path / "sessions.json")
+        manager.save_session(self._entry("a"))
+        first = manager.get_sessions()
+        version = manager.version
+        assert manager.get_sessions()[0] is first[0]
+        assert manager.version == version
+
+        # Another process writes the same history
+        HistoryManager(tmp_path / "sessions.json").save_session(self._entry("b"))
+        assert [s.session_id for s in manager.get_sessions()] == ["b", "a"]
+        assert manager.version > version
@@ -0,0 +1,84 @@
+"""Tests for journal_store module."""
+
+import json
+
+import pytest
+
+from journal_store import JournalStore
+
+
+def apply_append(state, record):
+    state.append(record)
+    return state
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "state.json")
+
+
+class TestJournalStore:
+    """Tests for the snapshot + journal store."""
+
+    def test_replays_journal(self, path):
+        store = JournalStore(path, apply_append)
+        state = store.load([])
+        for i in range(3):
+            state.append(i)
+            store.append(i, state)
+        assert JournalStore(path, apply_append).load([]) == [0, 1, 2]
+
+    def test_appends_do_not_rewrite_snapshot(self, path):
+        with open(path, 'w') as f:
+            json.dump(["legacy"], f)
+        store = JournalStore(path, apply_append)
+        state = store.load([])
+        state.append("new")
+        store.append("new", state)
+        with open(path) as f:
+            assert json.load(f) == ["legacy"]
+        assert JournalStore(path, apply_append).load([]) == ["legacy", "new"]
+
+    def test_compacts_past_threshold(self, path):
+        store = JournalStore(path, apply_append, compact_bytes=100)
+        state = store.load([])
+        for i in range(20):
+            state.append(i)
+            store.append(i, state)
+        assert store._journal_bytes < 100
+        with open(path) as f:
+            assert json.load(f)["state"][:5] == [0, 1, 2, 3, 4]
+        assert JournalStore(path, apply_append).load([]) == list(range(20))
+
+    def test_drops_torn_tail(self, path):
+        store = JournalStore(path, apply_append)
+        state = store.load([])
+        state.append("kept")
+        store.append("kept", state)
+        with open(store.journal_path, 'ab') as f:
+            f.write(b'{"seq": 2, "rec')  # Crash mid-append
+
+        recovered = JournalStore(path, apply_append)
+        state = recovered.load([])
+        assert state == ["kept"]
+        state.append("next")
+        recovered.append("next", state)
+        assert JournalStore(path, apply_append).load([]) == ["kept", "next"]
+
+    def test_crash_between_snapshot_and_truncation(self, path):
+        store = JournalStore(path, apply_append)
+        state = store.load([])
+        state.append("a")
+        store.append("a", state)
+        with open(store.journal_path, 'rb') as f:
+            journal = f.read()
+        store.compact(state)
+        # Simulate the journal truncation never happening
+        with open(store.journal_path, 'wb') as f:
+            f.write(journal)
+        assert JournalStore(path, apply_append).load([]) == ["a"]
+
+    def test_corrupt_snapshot_starts_fresh(self, path):
+        with open(path, 'w') as f:
+            f.write("{not json")
+        assert JournalStore(path, apply_append).load([]) == []
@@ -0,0 +1,64 @@
+"""Tests for keyword_scanner module."""
+
+from keyword_scanner import KeywordScanner, get_keyword_scanner, register_keyword_groups, scan_keywords
+
+GROUPS = {
+    "breaking": ["breaking", "breaking news", "just announced"],
+    "company": ["apple", "openai", "x corp"],
+    "trend": ["announced", "acquire"],
+    "regulatory": ["sec", "ban"],
+    "theme": ["ai", "self-driving"],
+}
+
+
+class TestKeywordScanner:
+    """Tests for single-pass matching."""
+
+    def setup_method(self):
+        self.scanner = KeywordScanner(GROUPS)
+
+    def test_counts_distinct_keywords_per_group(self):
+        hits = self.scanner.scan("Apple and OpenAI: Apple again, and X Corp too")
+        assert hits.count("company") == 3
+        assert hits.keywords("company") == {"apple", "openai", "x corp"}
+        assert not hits.any("breaking")
+
+    def test_whole_words_only(self):
+        hits = self.scanner.scan("She said the second band will appear")
+        assert hits.matched == frozenset()
+
+    def test_simple_inflections(self):
+        hits = self.scanner.scan("The startup was acquired after SEC bans")
+        assert hits.keywords("trend") == {"acquire"}
+        assert hits.keywords("regulatory") == {"sec", "ban"}
+
+    def test_longer_keyword_implies_contained_ones(self):
+        hits = self.scanner.scan("BREAKING NEWS: OpenAI just announced a model")
+        assert hits.keywords("breaking") == {"breaking", "breaking news", "just announced"}
+        assert hits.any("trend")
+
+    def test_punctuated_keywords(self):
+        assert self.scanner.scan("Self-driving cars and AI.").count("theme") == 2
+
+    def test_unknown_group_and_empty_scanner(self):
+        assert self.scanner.scan("apple").count("missing") == 0
+        assert KeywordScanner({}).scan("anything").matched == frozenset()
+
+
+class TestSharedScanner:
+    """Tests for the registry shared by curator and story arc."""
+
+    def test_registered_groups_are_scanned_together(self):
+        import story_arc  # noqa: F401 - registers theme groups
+        import topic_curator  # noqa: F401 - registers significance groups
+
+        hits = scan_keywords("Breaking: Nvidia faces an antitrust lawsuit over AI chips")
+        assert hits.any("breaking")
+        assert hits.count("company") == 1
+        assert hits.any("regulatory")
+        assert hits.any("theme:ai_revolution")
+
+    def test_registration_recompiles(self):
+        register_keyword_groups({"test:extra": ["zyxwv"]})
+        assert scan_keywords("zyxwv").any("test:extra")
+        assert get_keyword_scanner() is get_keyword_scanner()
@@ -0,0 +1,69 @@
+"""Tests for near_duplicates module."""
+
+import pytest
+
+from near_duplicates import LSHIndex, UnionFind, char_shingles, estimate_jaccard, minhash
+
+TEXT = "OpenAI announced GPT-5 today, cutting inference costs by forty percent for developers."
+
+
+class TestMinHash:
+    """Tests for shingling and signatures."""
+
+    def test_shingles_normalize_whitespace_and_case(self):
+        assert char_shingles("Ab  C", 3) == char_shingles("ab c", 3) == {"ab ", "b c"}
+
+    def test_short_and_empty_text(self):
+        assert char_shingles("ab", 3) == {"ab"}
+        assert char_shingles("", 3) == set()
+        assert minhash(set()) is None
+
+    def test_signature_is_stable(self):
+        assert (minhash(char_shingles(TEXT, 5)) == minhash(char_shingles(TEXT, 5))).all()
+
+    def test_jaccard_estimate(self):
+        near = minhash(char_shingles(TEXT.replace("forty", "thirty"), 5))
+        far = minhash(char_shingles("Bitcoin rallied to a record high on ETF inflows.", 5))
+        sig = minhash(char_shingles(TEXT, 5))
+        assert estimate_jaccard(sig, near) > 0.6
+        assert estimate_jaccard(sig, far) < 0.2
+
+
+class TestLSHIndex:
+    """Tests for the banded candidate index."""
+
+    def test_near_duplicates_are_candidates(self):
+        index = LSHIndex(bands=16, rows=4)
+        index.add("gpt5", minhash(char_shingles(TEXT, 5)))
+        index.add("btc", minhash(char_shingles("Bitcoin rallied to a record high on ETF inflows.", 5)))
+        query = minhash(char_shingles(TEXT.replace("forty", "thirty"), 5))
+        assert index.candidates(query) == {"gpt5"}
+        assert len(index) == 2
+
+    def test_empty_signature_is_ignored(self):
+        index = LSHIndex(bands=16, rows=4)
+        index.add("empty", None)
+        assert len(index) == 0
+        assert index.candidates(None) == set()
+
+    def test_rejects_oversized_bands(self):
+        with pytest.raises(ValueError):
+            LSHIndex(bands=64, rows=2)
+
+
+class TestUnionFind:
+    """Tests for disjoint-set merging."""
+
+    def test_groups_are_connected_components(self):
+        sets = UnionFind(5)
+        assert sets.union(3, 1)
+        assert sets.union(1, 4)
+        assert not sets.union(4, 3)
+        assert sets.groups() == [[0], [1, 3, 4], [2]]
+
+    def test_add_grows_the_universe(self):
+        sets = UnionFind()
+        assert [sets.add(), sets.add()] == [0, 1]
+        sets.union(0, 1)
+        assert sets.find(0) == sets.find(1)
+        assert len(sets) == 2
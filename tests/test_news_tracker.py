@@ -0,0 +1,301 @@
+"""Tests for news_tracker module."""
+
+import threading
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+import news_tracker
+from article_cache import ArticleCache
+from article_record import ArticleRecord
+from feed_cache import FeedCache
+from news_tracker import FetchBudget, HostLimiter, interleave_by_host
+from domain_health import HALF_OPEN, DomainHealthTracker
+from seen_index import SeenArticleIndex
+
+
+def make_entry(link, title="Story", summary="<p>Summary</p>"):
+    entry = SimpleNamespace(
+        title=title,
+        link=link,
+        published_parsed=datetime.now().timetuple(),
+    )
+    entry.get = lambda key, default=None: summary if key == "summary" else default
+    return entry
+
+
+@pytest.fixture
+def seen_index(tmp_path):
+    index = SeenArticleIndex(str(tmp_path / "seen.db"))
+    yield index
+    index.close()
+
+
+@pytest.fixture
+def fake_feeds(monkeypatch, tmp_path, seen_index):
+    """Two feeds on different hosts; article fetches finish in reverse order."""
+    tracker = DomainHealthTracker(str(tmp_path / "domains.json"))
+    feeds = {
+        "http://a.example/feed": [make_entry(f"http://a.example/{i}", f"A{i}") for i in range(3)],
+        "http://b.example/feed": [make_entry(f"http://b.example/{i}", f"B{i}") for i in range(3)],
+    }
+
+    def fake_parse(url, feed_cache=None):
+        return SimpleNamespace(entries=feeds[url])
+
+    def fake_full_text(url, **kwargs):
+        time.sleep(0.01 * (3 - int(url.rsplit("/", 1)[1])))
+        return "" if url.endswith("/2") else f"Full text of {url}"
+
+    monkeypatch.setattr(news_tracker, "parse_feed", fake_parse)
+    monkeypatch.setattr(news_tracker, "get_feed_cache", lambda: FeedCache(str(tmp_path / "feeds.json")))
+    monkeypatch.setattr(news_tracker, "get_article_cache", lambda: ArticleCache(str(tmp_path / "articles")))
+    monkeypatch.setattr(news_tracker, "get_full_text", fake_full_text)
+    monkeypatch.setattr(news_tracker, "get_seen_index", lambda: seen_index)
+    monkeypatch.setattr(news_tracker, "get_domain_tracker", lambda: tracker)
+    return list(feeds)
+
+
+class TestInterleaveByHost:
+    """Tests for round-robin host ordering."""
+
+    def test_round_robin(self):
+        urls = ["http://a/1", "http://a/2", "http://a/3", "http://b/1", "http://c/1"]
+        assert interleave_by_host(urls) == [0, 3, 4, 1, 2]
+
+    def test_covers_every_index(self):
+        urls = [f"http://h{i % 3}/{i}" for i in range(10)]
+        assert sorted(interleave_by_host(urls)) == list(range(10))
+
+
+class TestHostLimiter:
+    """Tests for per-host request limiting."""
+
+    def test_same_host_shares_slots(self):
+        limiter = HostLimiter(per_host_limit=1)
+        assert limiter._semaphore("http://a.example/1") is limiter._semaphore("http://A.example/2")
+        assert limiter._semaphore("http://a.example/1") is not limiter._semaphore("http://b.example/1")
+
+
+class TestGetRecentArticles:
+    """Tests for concurrent article fetching."""
+
+    def test_order_is_deterministic(self, fake_feeds):
+        articles = news_tracker.get_recent_articles(feed_urls=fake_feeds, max_workers=8)
+        assert [a["title"] for a in articles] == ["A0", "A1", "A2", "B0", "B1", "B2"]
+
+    def test_matches_serial_path(self, fake_feeds):
+        serial = news_tracker.get_recent_articles(feed_urls=fake_feeds, max_workers=1)
+        pooled = news_tracker.get_recent_articles(feed_urls=fake_feeds, max_workers=8)
+        assert serial == pooled
+
+    def test_falls_back_to_summary(self, fake_feeds):
+        articles = news_tracker.get_recent_articles(feed_urls=fake_feeds)
+        assert articles[2]["content"] == "Summary"
+        assert articles[0]["content"] == "Full text of http://a.example/0"
+
+    def test_compact_records(self, fake_feeds):
+        articles = news_tracker.get_recent_articles(feed_urls=fake_feeds, compact=True)
+        assert all(isinstance(a, ArticleRecord) for a in articles)
+        assert articles[0]["content"] == "Full text of http://a.example/0"
+        assert articles[2].get("content") == "Summary"
+
+    def test_skips_seen_entries(self, fake_feeds, seen_index):
+        seen_index.mark_seen([{"link": "http://a.example/1"}, {"link": "http://b.example/0/"}])
+        articles = news_tracker.get_recent_articles(feed_urls=fake_feeds)
+        assert [a["title"] for a in articles] == ["A0", "A2", "B1", "B2"]
+
+    def test_skip_seen_can_be_disabled(self, fake_feeds, seen_index):
+        seen_index.mark_seen([{"link": "http://a.example/1"}])
+        articles = news_tracker.get_recent_articles(feed_urls=fake_feeds, skip_seen=False)
+        assert len(articles) == 6
+
+
+class TestGetFullText:
+    """Tests for circuit breaking around article downloads."""
+
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        return DomainHealthTracker(str(tmp_path / "domains.json"), failure_threshold=2)
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ArticleCache(str(tmp_path / "articles"))
+
+    def test_open_circuit_skips_download(self, monkeypatch, tracker, cache):
+        calls = []
+
+        def failing_download(url, max_retries=2):
+            calls.append(url)
+            raise RuntimeError("Article download() failed with 403 Client Error: Forbidden")
+
+        monkeypatch.setattr(news_tracker, "download_html", failing_download)
+        for i in range(4):
+            assert news_tracker.get_full_text(
+                f"https://site.example/{i}", article_cache=cache, domain_health=tracker
+            ) == ""
+
+        assert len(calls) == 2
+        assert tracker.is_open("https://www.site.example/other")
+
+    def test_success_is_cached(self, monkeypatch, tracker, cache):
+        monkeypatch.setattr(news_tracker, "download_html", lambda url, max_retries=2: "<html>")
+        monkeypatch.setattr(news_tracker, "extract_text", lambda url, html, parse_pool=None: "Body")
+        assert news_tracker.get_full_text(
+            "https://site.example/a", article_cache=cache, domain_health=tracker
+        ) == "Body"
+        monkeypatch.setattr(news_tracker, "download_html", None)
+        assert news_tracker.get_full_text(
+            "https://site.example/a", article_cache=cache, domain_health=tracker
+        ) == "Body"
+
+    def test_empty_download_does_not_close_circuit(self, monkeypatch, tmp_path, cache):
+        now = [1_000_000.0]
+        tracker = DomainHealthTracker(
+            str(tmp_path / "domains.json"), failure_threshold=2, clock=lambda: now[0]
+        )
+        url = "https://site.example/a"
+        tracker.record_failure(url, 1.0)
+        tracker.record_failure(url, 1.0)
+        now[0] += tracker.get(url).cooldown
+        monkeypatch.setattr(news_tracker, "download_html", lambda url, max_retries=2: "")
+
+        assert news_tracker.get_full_text(url, article_cache=cache, domain_health=tracker) == ""
+        assert tracker.get(url).state == HALF_OPEN
+        assert tracker.get(url).successes == 0
+        assert tracker.allow_request(url)
+
+
+class TestDownloadHtml:
+    """Tests for the pooled-session downloader."""
+
+    class FakeSession:
+        def __init__(self, responses):
+            self.responses = list(responses)
+            self.user_agents = []
+
+        def get(self, url, headers=None, timeout=None):
+            self.user_agents.append(headers["User-Agent"])
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+    @staticmethod
+    def response(status, body=b"<html>ok</html>", content_type="text/html"):
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers["Content-Type"] = content_type
+        response.url = "http://example.com/a"
+        return response
+
+    def test_returns_decoded_html(self, monkeypatch):
+        session = self.FakeSession([self.response(200, "café".encode("utf-8"))])
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        assert news_tracker.download_html("http://example.com/a") == "café"
+
+    def test_not_found_is_not_a_domain_failure(self, monkeypatch):
+        session = self.FakeSession([self.response(404)])
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        assert news_tracker.download_html("http://example.com/a") == ""
+
+    def test_url_text_is_not_a_domain_failure(self, monkeypatch):
+        url = "http://example.com/blocked-403-timeout-connection"
+        response = self.response(404)
+        response.url = url
+        session = self.FakeSession([response, response])
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        assert news_tracker.download_html(url) == ""
+        assert len(session.user_agents) == 1
+
+    def test_server_error_is_raised(self, monkeypatch):
+        session = self.FakeSession([self.response(500), self.response(503)])
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        with pytest.raises(requests.HTTPError):
+            news_tracker.download_html("http://example.com/a", max_retries=2)
+
+    def test_connection_error_is_raised(self, monkeypatch):
+        session = self.FakeSession([requests.ConnectionError("refused")] * 2)
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        with pytest.raises(requests.ConnectionError):
+            news_tracker.download_html("http://example.com/a", max_retries=2)
+
+    def test_persistent_block_is_raised(self, monkeypatch):
+        session = self.FakeSession([self.response(403), self.response(403)])
+        monkeypatch.setattr(news_tracker, "get_http_session", lambda: session)
+        with pytest.raises(requests.HTTPError):
+            news_tracker.download_html("http://example.com/a", max_retries=2)
+        assert len(session.user_agents) == 2
+
+    def test_sessions_share_one_pool(self):
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(news_tracker.get_http_session()))
+        thread.start()
+        thread.join()
+        main_session = news_tracker.get_http_session()
+        assert sessions[0] is not main_session
+        assert sessions[0].get_adapter("http://x") is main_session.get_adapter("https://y")
+
+
+class TestIterRecentArticles:
+    """Tests for the streaming article generator."""
+
+    def test_unordered_yields_every_article(self, fake_feeds):
+        articles = list(news_tracker.iter_recent_articles(feed_urls=fake_feeds, ordered=False))
+        assert sorted(a["title"] for a in articles) == ["A0", "A1", "A2", "B0", "B1", "B2"]
+
+    def test_can_stop_early(self, fake_feeds):
+        stream = news_tracker.iter_recent_articles(feed_urls=fake_feeds, max_workers=1)
+        assert next(stream)["title"] == "A0"
+        stream.close()
+
+
+class TestFetchBudget:
+    """Tests for the ingestion deadline."""
+
+    def test_unbounded_budget_never_expires(self):
+        budget = FetchBudget(None)
+        assert budget.remaining() is None
+        assert not budget.expired
+
+    def test_report_charges_time_per_domain(self):
+        budget = FetchBudget(60)
+        with budget.track("http://news.a.example/1"):
+            time.sleep(0.02)
+        with budget.track("http://b.example/1"):
+            pass
+        report = budget.report()
+        assert list(report) == ["a.example", "b.example"]
+        assert report["a.example"] >= 0.02
+        assert len(budget.latencies) == 2
+        assert budget.latencies[0] >= 0.02
+
+    def test_expired_deadline_falls_back_to_summaries(self, fake_feeds, monkeypatch):
+        def slow_full_text(url, **kwargs):
+            time.sleep(0.5)
+            return f"Full text of {url}"
+
+        monkeypatch.setattr(news_tracker, "get_full_text", slow_full_text)
+        budget = FetchBudget(0.2)
+        start = time.monotonic()
+        articles = list(news_tracker.iter_recent_articles(feed_urls=fake_feeds, budget=budget))
+        assert time.monotonic() - start < 0.5
+        assert [a["title"] for a in articles] == ["A0", "A1", "A2", "B0", "B1", "B2"]
+        assert all(a["content"] == "Summary" for a in articles)
+        assert set(budget.report()) == {"a.example", "b.example"}
+
+    def test_deadline_keeps_finished_fetches(self, fake_feeds, monkeypatch):
+        def head_is_slow(url, **kwargs):
+            time.sleep(1.0 if url == "http://a.example/0" else 0)
+            return f"Full text of {url}"
+
+        monkeypatch.setattr(news_tracker, "get_full_text", head_is_slow)
+        budget = FetchBudget(0.3)
+        articles = list(news_tracker.iter_recent_articles(feed_urls=fake_feeds, budget=budget))
+        assert [a["title"] for a in articles] == ["A0", "A1", "A2", "B0", "B1", "B2"]
+        assert articles[0]["content"] == "Summary"
+        assert all(a["content"].startswith("Full text of") for a in articles[1:])
@@ -0,0 +1,54 @@
+"""Tests for prediction_index module."""
+
+from prediction_index import PredictionKeywordIndex, match_predictions, prediction_keywords
+from story_arc import check_predictions_against_stories
+
+BITCOIN = {"title": "Bitcoin Reaches Record Highs",
+           "content": "Bitcoin surged to new record highs this quarter, exceeding expectations."}
+NVIDIA = {"title": "Nvidia ships Blackwell chips", "content": "Datacenter demand keeps growing."}
+
+
+class TestPredictionKeywordIndex:
+    """Tests for keyword -> prediction matching."""
+
+    def test_keywords_are_long_words(self):
+        assert prediction_keywords("Bitcoin will reach new highs, this quarter!") == {
+            "bitcoin", "reach", "highs", "quarter"
+        }
+
+    def test_match_counts(self):
+        index = PredictionKeywordIndex()
+        index.add("btc", "Bitcoin will reach new highs this quarter")
+        index.add("nvda", "Nvidia Blackwell demand will soften")
+        assert index.match_counts(BITCOIN) == {"btc": 3}
+        assert index.match_counts(NVIDIA) == {"nvda": 3}
+
+    def test_remove(self):
+        index = PredictionKeywordIndex()
+        index.add("btc", "Bitcoin will reach new highs this quarter")
+        index.remove("btc")
+        index.remove("unknown")
+        assert index.match_counts(BITCOIN) == {}
+        assert len(index) == 0
+
+    def test_first_matching_story_wins(self):
+        index = PredictionKeywordIndex()
+        index.add(0, "Bitcoin record highs ahead")
+        repeat = {"title": "Bitcoin record highs again", "content": ""}
+        assert index.first_matches([BITCOIN, repeat]) == {0: (BITCOIN, 3)}
+        assert index.first_matches([BITCOIN], keys={1}) == {}
+
+    def test_matches_words_not_substrings(self):
+        predictions = [{"text": "Quarter results will beat estimates"}]
+        story = {"title": "Quarterly results", "content": "Analysts were surprised."}
+        assert match_predictions(predictions, [story]) == []
+
+    def test_story_arc_callbacks(self):
+        predictions = [
+            {"prediction": "Nvidia Blackwell demand will soften", "episode_date": "2026-01-01"},
+            {"prediction": "Bitcoin will reach new highs this quarter", "episode_date": "2026-01-02"},
+        ]
+        callbacks = check_predictions_against_stories(predictions, [BITCOIN, NVIDIA])
+        assert len(callbacks) == 2
+        assert callbacks[0].endswith(NVIDIA["title"])
+        assert callbacks[1].endswith(BITCOIN["title"])
@@ -0,0 +1,45 @@
+"""Tests for seen_index module."""
+
+import time
+
+import pytest
+
+from seen_index import SeenArticleIndex, entry_keys
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = SeenArticleIndex(str(tmp_path / "seen.db"), retention_days=1)
+    yield index
+    index.close()
+
+
+class TestSeenArticleIndex:
+    """Tests for the cross-run seen-article index."""
+
+    def test_entry_keys(self):
+        assert entry_keys("https://Example.com/a/", "guid-1") == [
+            "link:https://example.com/a", "guid:guid-1"
+        ]
+        assert entry_keys("https://example.com/a", "https://example.com/a") == [
+            "link:https://example.com/a"
+        ]
+
+    def test_matches_by_link_or_guid(self, index):
+        index.mark_seen([{"link": "https://example.com/a", "guid": "guid-1"}])
+        assert index.is_seen("https://example.com/a?utm_source=rss")
+        assert index.is_seen("https://mirror.example.com/a", "guid-1")
+        assert not index.is_seen("https://example.com/b", "guid-2")
+
+    def test_persists_across_instances(self, index):
+        index.mark_seen([{"link": "https://example.com/a"}])
+        reopened = SeenArticleIndex(index.index_path)
+        assert reopened.is_seen("https://example.com/a")
+        reopened.close()
+
+    def test_prunes_old_records(self, index):
+        index.mark_seen([{"link": "https://example.com/a"}])
+        with index._conn:
+            index._conn.execute("UPDATE seen_articles SET seen_at = ?", (time.time() - 2 * 86400,))
+        assert index.prune() == 1
+        assert len(index) == 0
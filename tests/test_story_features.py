@@ -0,0 +1,88 @@
+"""Tests for story_features module."""
+
+import pytest
+
+import story_features
+import topic_curator  # noqa: F401  Registers the scoring keyword groups
+from story_features import StoryFeatures, clear_feature_cache, extract_title_keywords
+
+STORY = {"title": "OpenAI Launches GPT-5", "content": "It is faster. Critics are wary! Really?"}
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    clear_feature_cache()
+    yield
+    clear_feature_cache()
+
+
+class TestStoryFeatures:
+    """Tests for lazily computed features."""
+
+    def test_features(self):
+        features = StoryFeatures(dict(STORY))
+        assert features.text == "openai launches gpt-5 it is faster. critics are wary! really?"
+        assert features.title_keywords == ["openai", "launches", "gpt"]
+        assert "openai" in features.keywords.matched
+
+    def test_computed_lazily(self):
+        features = StoryFeatures(dict(STORY))
+        assert features._keywords is None
+        features.keywords
+        assert features._keywords is not None
+
+    def test_rescans_after_new_keyword_groups(self, monkeypatch):
+        import keyword_scanner
+        for name in ("_groups", "_scanner", "_version"):  # Restored after the test
+            monkeypatch.setattr(keyword_scanner, name, getattr(keyword_scanner, name))
+        monkeypatch.setattr(keyword_scanner, "_groups", dict(keyword_scanner._groups))
+        features = StoryFeatures({"title": "Quantum chip unveiled", "content": ""})
+        assert not features.keywords.any("test:quantum")
+        keyword_scanner.register_keyword_groups({"test:quantum": ["quantum"]})
+        assert features.keywords.any("test:quantum")
+
+    def test_record_text_is_not_kept(self, tmp_path):
+        from article_cache import ArticleCache
+        from article_record import PREFIX_CHARS, ArticleRecord
+        body = "Filler text here. " * PREFIX_CHARS + "The lawsuit was filed."
+        record = ArticleRecord("EU fines OpenAI", "https://a.example/1", body,
+                               cache=ArticleCache(str(tmp_path / "articles")))
+        features = StoryFeatures(record)
+        assert features.keywords.any("regulatory")
+        assert features._text is None
+        assert features.text.endswith("the lawsuit was filed.")
+
+    def test_missing_fields(self):
+        features = StoryFeatures({"title": None})
+        assert features.text == " "
+        assert features.title_keywords == []
+
+    def test_title_keywords_skip_stopwords(self):
+        assert extract_title_keywords("The EU is to ban an AI app") == ["ban", "app"]
+
+
+class TestStoryFeaturesCache:
+    """Tests for the shared per-story memo."""
+
+    def test_same_story_same_features(self):
+        story = dict(STORY)
+        assert story_features.story_features(story) is story_features.story_features(story)
+
+    def test_equal_dicts_are_separate(self):
+        assert story_features.story_features(dict(STORY)) is not story_features.story_features(dict(STORY))
+
+    def test_changed_content_is_recomputed(self):
+        story = dict(STORY)
+        first = story_features.story_features(story)
+        story["content"] = "Replaced body."
+        second = story_features.story_features(story)
+        assert second is not first
+        assert second.text.endswith("replaced body.")
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(story_features, "FEATURE_CACHE_SIZE", 2)
+        stories = [{"title": str(i)} for i in range(3)]
+        first = story_features.story_features(stories[0])
+        story_features.story_features(stories[1])
+        story_features.story_features(stories[2])
+        assert story_features.story_features(stories[0]) is not first
@@ -0,0 +1,80 @@
+"""Tests for story_similarity module."""
+
+import numpy as np
+
+from story_features import extract_title_keywords
+from story_similarity import SimilarityThresholds, TfidfSimilarity, tfidf_matrix
+
+STORIES = [
+    {"title": "OpenAI launches GPT-5 model", "content": "OpenAI announced GPT-5 today for developers."},
+    {"title": "Bitcoin hits record high", "content": "Bitcoin rose 10% to a record on ETF inflows."},
+    {"title": "OpenAI launches GPT-5 model to developers", "content": "GPT-5 is here, OpenAI said."},
+    {"title": "EU opens antitrust probe into Apple", "content": "Regulators opened an antitrust case."},
+    {"title": "Apple faces EU antitrust probe", "content": "The European Commission opened a case."},
+]
+
+
+class TestTfidfMatrix:
+    """Tests for the hashed TF-IDF matrix."""
+
+    def test_rows_are_normalized(self):
+        matrix = tfidf_matrix([["a", "b"], ["b", "c", "c"], []], 64)
+        norms = np.linalg.norm(matrix.dense(), axis=1)
+        assert np.allclose(norms, [1.0, 1.0, 0.0])
+
+    def test_rare_terms_weigh_more(self):
+        matrix = tfidf_matrix([["common", "rare"], ["common"], ["common"]], 1024)
+        row = matrix.dense(slice(0, 1))[0]
+        row = row[row > 0]
+        assert row.max() > row.min()
+
+    def test_stores_only_nonzero_terms(self):
+        matrix = tfidf_matrix([["a", "b"], ["b", "c", "c"], []], 1 << 12)
+        assert matrix.indptr.tolist() == [0, 2, 4, 4]
+        assert len(matrix.values) == 4
+
+    def test_tiled_products_match_dense(self, monkeypatch):
+        import story_similarity
+
+        matrix = tfidf_matrix([["a", "b"], ["b", "c"], ["c"], [], ["a", "c"]], 64)
+        dense = matrix.dense()
+        monkeypatch.setattr(story_similarity, "BLOCK_SIZE", 2)
+        assert np.allclose(matrix.dot_rows(slice(1, 4), slice(0, 5)), dense[1:4] @ dense.T)
+
+
+class TestTfidfSimilarity:
+    """Tests for the batched similarity engine."""
+
+    def test_keywords_match_title_helper(self):
+        assert extract_title_keywords("The EU opens an antitrust probe") == ["opens", "antitrust", "probe"]
+
+    def test_keyword_overlap_matches_pairwise_definition(self):
+        engine = TfidfSimilarity(STORIES)
+        overlap = engine.keyword_overlap(slice(None))
+        kw3, kw4 = set(extract_title_keywords(STORIES[3]["title"])), set(extract_title_keywords(STORIES[4]["title"]))
+        assert overlap[3, 4] == len(kw3 & kw4) / max(len(kw3), len(kw4))
+        assert overlap[0, 1] == 0
+
+    def test_cluster_groups_same_story(self):
+        assert TfidfSimilarity(STORIES).cluster() == [[0, 2], [1], [3, 4]]
+
+    def test_thresholds_are_configurable(self):
+        strict = SimilarityThresholds(title=0.99, keyword_overlap=0.99, content=0.99)
+        assert TfidfSimilarity(STORIES, strict).cluster() == [[0], [1], [2], [3], [4]]
+
+    def test_title_test_is_opt_in(self):
+        only_titles = SimilarityThresholds(keyword_overlap=0.99, content=0.99)
+        assert TfidfSimilarity(STORIES, only_titles).cluster() == [[0], [1], [2], [3], [4]]
+        only_titles.title = 0.35
+        assert [0, 2] in TfidfSimilarity(STORIES, only_titles).cluster()
+
+    def test_blocks_give_same_clusters(self, monkeypatch):
+        import story_similarity
+
+        expected = TfidfSimilarity(STORIES).cluster()
+        monkeypatch.setattr(story_similarity, "BLOCK_SIZE", 2)
+        assert TfidfSimilarity(STORIES).cluster() == expected
+
+    def test_empty_story_fields(self):
+        engine = TfidfSimilarity([{"title": "", "content": ""}, {}])
+        assert engine.cluster() == [[0], [1]]
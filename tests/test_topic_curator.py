@@ -0,0 +1,154 @@
+"""Tests for topic_curator module."""
+
+from datetime import datetime
+
+import pytest
+
+from benchmarks.story_corpus import synthetic_stories
+from story_similarity import SimilarityThresholds
+from topic_curator import (
+    IncrementalStoryCombiner,
+    blocking_keys,
+    calculate_significance_score,
+    combine_similar_stories,
+    extract_key_facts,
+    extract_key_quotes,
+    rank_stories,
+    select_top_stories,
+    significance_upper_bound,
+    stories_are_similar,
+)
+
+
+@pytest.fixture
+def stories():
+    now = datetime.now()
+    return [
+        {"title": "OpenAI launches GPT-5 model", "content": "OpenAI announced GPT-5 today. " * 20,
+         "link": "https://a.example/1", "published": now},
+        {"title": "Bitcoin hits record high", "content": "Bitcoin rose 10% to $100,000. " * 20,
+         "link": "https://b.example/1", "published": now},
+        {"title": "OpenAI launches GPT-5 model to developers", "content": "GPT-5 is here. " * 50,
+         "link": "https://c.example/1", "published": now},
+        {"title": "EU opens antitrust investigation into Apple", "content": "Regulators said. " * 30,
+         "link": "https://d.example/1", "published": now},
+    ]
+
+
+class TestIncrementalStoryCombiner:
+    """Tests for incremental story clustering."""
+
+    def test_matches_batch_clustering(self, stories):
+        combiner = IncrementalStoryCombiner()
+        for story in stories:
+            combiner.add(story)
+        incremental = combiner.curated()
+        batch = combine_similar_stories(stories)
+
+        assert [c.title for c in incremental] == [c.title for c in batch]
+        assert [c.source_count for c in incremental] == [2, 1, 1]
+
+    def test_index_matches_exhaustive_scan(self, stories):
+        indexed = IncrementalStoryCombiner()
+        exhaustive = IncrementalStoryCombiner(use_index=False)
+        indexed.extend(stories)
+        exhaustive.extend(stories)
+        assert indexed.labels() == exhaustive.labels() == [0, 1, 0, 2]
+        assert indexed.comparisons < exhaustive.comparisons
+
+    def test_clusters_do_not_depend_on_order(self, stories):
+        forward = combine_similar_stories(stories)
+        backward = combine_similar_stories(reversed(stories))
+        assert sorted(sorted(s["link"] for s in c.sources) for c in forward) == \
+            sorted(sorted(s["link"] for s in c.sources) for c in backward)
+
+    def test_merges_chained_matches(self):
+        # a~b and b~c but not a~c: union-find joins all three
+        a = {"title": "Nvidia unveils Blackwell chips", "content": ""}
+        b = {"title": "Nvidia unveils Blackwell chips for datacenters", "content": ""}
+        c = {"title": "Blackwell chips for datacenters ship", "content": ""}
+        assert not stories_are_similar(a, c)
+        assert [s.source_count for s in combine_similar_stories([a, c, b])] == [3]
+
+    def test_shared_headline_frame_does_not_link(self):
+        a = {"title": "OpenAI launches GPT-5 model", "content": ""}
+        b = {"title": "Meta launches Llama 4 model", "content": ""}
+        assert stories_are_similar(a, b)
+        assert [s.source_count for s in combine_similar_stories([a, b])] == [1, 1]
+
+    def test_primary_is_longest_source(self, stories):
+        curated = combine_similar_stories(stories)
+        assert curated[0].title == "OpenAI launches GPT-5 model to developers"
+
+    def test_tfidf_clustering(self, stories):
+        curated = combine_similar_stories(iter(stories), similarity=SimilarityThresholds())
+        assert [c.source_count for c in curated] == [2, 1, 1]
+        assert curated[0].title == "OpenAI launches GPT-5 model to developers"
+
+
+class TestBlockingKeys:
+    """Tests for title-keyword blocking."""
+
+    def test_keyword_pairs(self):
+        assert blocking_keys({"title": "Apple sues Google"}) == {"apple google", "apple sues", "google sues"}
+
+    def test_single_keyword(self):
+        assert blocking_keys({"title": "The Apple"}) == {"apple"}
+
+
+class TestSelectTopStories:
+    """Tests for top story selection."""
+
+    def test_accepts_generator(self, stories):
+        selected = select_top_stories(iter(stories), max_stories=2)
+        assert len(selected) == 2
+        assert selected[0].source_count == 2
+
+    def test_empty_input(self):
+        assert select_top_stories(iter([])) == []
+
+    def test_matches_full_ranking(self):
+        corpus = synthetic_stories(120, seed=3)
+        ranked = rank_stories(combine_similar_stories(corpus))
+        selected = select_top_stories(corpus, max_stories=4, min_significance=0)
+        assert [(s.title, s.significance_score) for s in selected] == \
+            [(s.title, s.significance_score) for s in ranked[:4]]
+        assert selected[0].key_facts == ranked[0].key_facts
+
+    def test_upper_bound_holds(self, stories):
+        for story in stories:
+            for sources in (1, 3):
+                assert significance_upper_bound(story, sources) >= \
+                    calculate_significance_score(story, sources)
+
+
+class TestSignificanceScore:
+    """Tests for keyword-based significance scoring."""
+
+    def test_keyword_groups(self):
+        story = {"title": "Breaking: Apple and Google sued", "content": "An antitrust lawsuit was filed."}
+        # breaking (2.5) + two companies (2 x 2.0) + regulatory (1.5)
+        assert calculate_significance_score(story) == 8.0
+
+    def test_substrings_do_not_count(self):
+        story = {"title": "Reporters said a second bank opened", "content": "Nothing else happened."}
+        assert calculate_significance_score(story) == 0.0
+
+
+class TestKeyContent:
+    """Tests for key fact and quote extraction."""
+
+    def test_facts_stop_at_limit(self):
+        content = "Revenue rose 12% this quarter. Nothing else happened here at all. " * 10
+        assert extract_key_facts(content) == ["Revenue rose 12% this quarter"] * 5
+        assert extract_key_facts(content, limit=2) == ["Revenue rose 12% this quarter"] * 2
+
+    def test_fact_indicators_and_length(self):
+        content = "Apple announced a new product line today. Too short 5%. Weather was fine today overall."
+        assert extract_key_facts(content) == ["Apple announced a new product line today"]
+
+    def test_quotes_dedupe_in_order_of_preference(self):
+        said = "We are shipping the new model to every developer"
+        content = (f"\u201cSmart quotes are the typographer's choice here\u201d, then "
+                   f'"{said}" and again "{said.upper()}".')
+        assert extract_key_quotes(content) == [said, "Smart quotes are the typographer's choice here"]
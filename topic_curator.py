@@ -4,13 +4,28 @@ Ranks stories by significance, combines similar stories from multiple sources,
 and selects only the top 3-4 stories for in-depth coverage.
 """
 
+import heapq
 import logging
 import re
-from typing import List, Dict, Any, Tuple, Optional
+from collections import defaultdict
+from itertools import combinations
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Set, Tuple, Optional
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
 
+import numpy as np
+
+from article_record import content_length
+from keyword_scanner import register_keyword_groups
+from near_duplicates import LSHIndex, UnionFind, char_shingles, minhash
+from story_features import extract_title_keywords  # noqa: F401  Re-exported for older callers
+from story_features import story_features
+from story_similarity import SimilarityThresholds, TfidfSimilarity
+
+if TYPE_CHECKING:
+    from cluster_store import ClusterStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +39,8 @@ class CuratedStory:
     key_facts: List[str] = field(default_factory=list)
     key_quotes: List[str] = field(default_factory=list)
     combined_at: datetime = field(default_factory=datetime.now)
+    cluster_id: Optional[int] = None
+    growth_rate: float = 0.0
 
     @property
     def source_count(self) -> int:
@@ -49,8 +66,17 @@ SIGNIFICANCE_WEIGHTS = {
     "financial_impact": 1.5,      # Has financial numbers/impact
     "regulatory": 1.5,            # Regulatory/legal significance
     "content_depth": 1.0,         # Longer, more detailed content
+    "growth": 1.0,                # Per article/day a stored cluster gained before this run
 }
 
+# Most the keyword and financial terms of a score can add
+MAX_TEXT_SCORE = (
+    SIGNIFICANCE_WEIGHTS["breaking_news"]
+    + SIGNIFICANCE_WEIGHTS["major_company"] * 3
+    + SIGNIFICANCE_WEIGHTS["financial_impact"] * 1.5
+    + SIGNIFICANCE_WEIGHTS["regulatory"]
+)
+
 # Keywords that indicate breaking/significant news
 BREAKING_KEYWORDS = [
     "breaking", "exclusive", "just announced", "breaking news",
@@ -64,6 +90,42 @@ MAJOR_COMPANIES = [
     "coinbase", "binance", "twitter", "x corp", "bytedance", "tiktok"
 ]
 
+# Keywords that indicate regulatory/legal significance
+REGULATORY_KEYWORDS = ["sec", "regulation", "lawsuit", "ban", "antitrust", "investigation"]
+
+register_keyword_groups({
+    "breaking": BREAKING_KEYWORDS,
+    "company": MAJOR_COMPANIES,
+    "regulatory": REGULATORY_KEYWORDS,
+})
+
+
+# Key facts: sentences with financial figures or key fact indicators
+SENTENCE_PATTERN = re.compile(r'[^.!?]+')
+FACT_PATTERN = re.compile(
+    r'\$[\d,]+|\d+%|\d+\s*(?:million|billion|trillion)|announced|reported|confirmed|revealed',
+    re.I
+)
+
+# Key quotes, in order of preference
+QUOTE_PATTERNS = [
+    re.compile(r'"([^"]{30,200})"'),   # Double quotes
+    re.compile(r"'([^']{30,200})'"),   # Single quotes (be careful with contractions)
+    re.compile(r'\u201c([^\u201d]{30,200})\u201d'),  # Smart quotes
+]
+
+MAX_KEY_FACTS = 5
+MAX_KEY_QUOTES = 3
+
+# Title keyword overlap above which stories are the same topic
+KEYWORD_OVERLAP_THRESHOLD = 0.5
+
+# LSH banding (bands, rows) for content candidate lookup (threshold ~0.36 Jaccard)
+CONTENT_LSH_BANDS = (21, 3)
+
+# Shingle size for content signatures
+CONTENT_SHINGLE_SIZE = 5
+
 
 def calculate_similarity(text1: str, text2: str) -> float:
     """Calculate similarity between two texts using SequenceMatcher."""
@@ -73,42 +135,36 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return SequenceMatcher(None, t1, t2).ratio()
 
 
-def extract_title_keywords(title: str) -> List[str]:
-    """Extract significant keywords from a title."""
-    # Remove common words
-    stopwords = {"the", "a", "an", "is", "are", "was", "were", "be", "been",
-                 "being", "have", "has", "had", "do", "does", "did", "will",
-                 "would", "could", "should", "may", "might", "must", "shall",
-                 "to", "of", "in", "for", "on", "with", "at", "by", "from",
-                 "as", "into", "through", "during", "before", "after", "and",
-                 "but", "or", "nor", "so", "yet", "both", "either", "neither"}
-
-    words = re.findall(r'\b\w+\b', title.lower())
-    return [w for w in words if w not in stopwords and len(w) > 2]
+def title_keyword_overlap(story1: Dict[str, Any], story2: Dict[str, Any]) -> float:
+    """Shared title keywords as a fraction of the longer keyword set."""
+    kw1 = set(story_features(story1).title_keywords)
+    kw2 = set(story_features(story2).title_keywords)
+    if not (kw1 and kw2):
+        return 0.0
+    return len(kw1 & kw2) / max(len(kw1), len(kw2))
 
 
 def stories_are_similar(story1: Dict[str, Any], story2: Dict[str, Any],
-                       threshold: float = 0.4) -> bool:
-    """Determine if two stories are about the same topic."""
-    title1 = story1.get('title', '')
-    title2 = story2.get('title', '')
-
-    # Check title similarity
-    title_sim = calculate_similarity(title1, title2)
-    if title_sim > 0.6:
-        return True
+                       threshold: float = 0.4, compare_titles: bool = True) -> bool:
+    """Determine if two stories are about the same topic.
 
-    # Check keyword overlap
-    kw1 = set(extract_title_keywords(title1))
-    kw2 = set(extract_title_keywords(title2))
-    if kw1 and kw2:
-        overlap = len(kw1 & kw2) / max(len(kw1), len(kw2))
-        if overlap > 0.5:
+    ``compare_titles=False`` skips the title character ratio, which also
+    fires on unrelated headlines sharing a frame ("X launches Y model"),
+    leaving keyword overlap and content similarity.
+    """
+    if compare_titles:
+        # Check title similarity
+        title_sim = calculate_similarity(story1.get('title', ''), story2.get('title', ''))
+        if title_sim > 0.6:
             return True
 
+    # Check keyword overlap
+    if title_keyword_overlap(story1, story2) > KEYWORD_OVERLAP_THRESHOLD:
+        return True
+
     # Check content similarity (sample)
-    content1 = story1.get('content', '')
-    content2 = story2.get('content', '')
+    content1 = story_features(story1).content_prefix
+    content2 = story_features(story2).content_prefix
     if content1 and content2:
         content_sim = calculate_similarity(content1, content2)
         if content_sim > threshold:
@@ -117,59 +173,52 @@ def stories_are_similar(story1: Dict[str, Any], story2: Dict[str, Any],
     return False
 
 
-def extract_key_facts(content: str) -> List[str]:
-    """Extract key facts from article content."""
-    facts = []
+def content_signature(story: Dict[str, Any]) -> Optional[np.ndarray]:
+    """Return the MinHash signature of a story's content sample.
 
-    # Look for sentences with numbers (often factual)
-    sentences = re.split(r'[.!?]', content)
-    for sentence in sentences:
-        sentence = sentence.strip()
-        # Contains numbers (financial figures, percentages, etc.)
-        if re.search(r'\$[\d,]+|\d+%|\d+\s*(million|billion|trillion)', sentence, re.I):
-            if 20 < len(sentence) < 200:
-                facts.append(sentence)
-        # Contains key fact indicators
-        elif any(kw in sentence.lower() for kw in ["announced", "reported", "confirmed", "revealed"]):
-            if 20 < len(sentence) < 200:
-                facts.append(sentence)
+    Uses the same 500-character sample as the exact comparison.
+    """
+    return minhash(char_shingles(story_features(story).content_prefix[:500], CONTENT_SHINGLE_SIZE))
 
-    return facts[:5]  # Return top 5 facts
 
+def extract_key_facts(content: str, limit: int = MAX_KEY_FACTS) -> List[str]:
+    """Extract key facts from article content.
 
-def extract_key_quotes(content: str) -> List[str]:
-    """Extract notable quotes from article content."""
-    quotes = []
+    Walks the sentences lazily and stops once ``limit`` facts are found.
+    """
+    facts = []
+    for match in SENTENCE_PATTERN.finditer(content):
+        sentence = match.group().strip()
+        # Financial figures, percentages or key fact indicators
+        if 20 < len(sentence) < 200 and FACT_PATTERN.search(sentence):
+            facts.append(sentence)
+            if len(facts) == limit:
+                break
+    return facts
 
-    # Look for quoted text
-    quote_patterns = [
-        r'"([^"]{30,200})"',  # Double quotes
-        r"'([^']{30,200})'",  # Single quotes (be careful with contractions)
-        r'"([^"]{30,200})"',  # Smart quotes
-    ]
 
-    for pattern in quote_patterns:
-        matches = re.findall(pattern, content)
-        quotes.extend(matches)
+def extract_key_quotes(content: str, limit: int = MAX_KEY_QUOTES) -> List[str]:
+    """Extract notable quotes from article content.
 
-    # Deduplicate and limit
+    Quote styles are tried in order of preference; each scan stops as
+    soon as ``limit`` distinct quotes are found.
+    """
+    quotes = []
     seen = set()
-    unique_quotes = []
-    for q in quotes:
-        q_lower = q.lower()
-        if q_lower not in seen:
-            seen.add(q_lower)
-            unique_quotes.append(q)
-
-    return unique_quotes[:3]  # Return top 3 quotes
-
-
-def calculate_significance_score(story: Dict[str, Any], source_count: int = 1) -> float:
-    """Calculate significance score for a story."""
+    for pattern in QUOTE_PATTERNS:
+        for match in pattern.finditer(content):
+            quote = match.group(1)
+            if quote.lower() not in seen:
+                seen.add(quote.lower())
+                quotes.append(quote)
+                if len(quotes) == limit:
+                    return quotes
+    return quotes
+
+
+def _metadata_score(story: Dict[str, Any], source_count: int) -> float:
+    """Significance from source count, recency and content depth (no text scans)."""
     score = 0.0
-    title = story.get('title', '').lower()
-    content = story.get('content', '').lower()
-    text = f"{title} {content}"
 
     # Multiple sources covering the same story
     if source_count > 1:
@@ -185,12 +234,29 @@ def calculate_significance_score(story: Dict[str, Any], source_count: int = 1) -
             elif hours_old < 24:
                 score += SIGNIFICANCE_WEIGHTS["recency"]
 
+    # Content depth
+    content_length = story_features(story).content_length
+    if content_length > 2000:
+        score += SIGNIFICANCE_WEIGHTS["content_depth"] * 2
+    elif content_length > 1000:
+        score += SIGNIFICANCE_WEIGHTS["content_depth"]
+
+    return score
+
+
+def calculate_significance_score(story: Dict[str, Any], source_count: int = 1) -> float:
+    """Calculate significance score for a story."""
+    score = _metadata_score(story, source_count)
+    features = story_features(story)
+    text = features.text
+    keywords = features.keywords
+
     # Breaking news keywords
-    if any(kw in text for kw in BREAKING_KEYWORDS):
+    if keywords.any("breaking"):
         score += SIGNIFICANCE_WEIGHTS["breaking_news"]
 
     # Major company involvement
-    company_count = sum(1 for company in MAJOR_COMPANIES if company in text)
+    company_count = keywords.count("company")
     score += SIGNIFICANCE_WEIGHTS["major_company"] * min(company_count, 3)
 
     # Financial impact (contains dollar amounts, percentages)
@@ -200,66 +266,210 @@ def calculate_significance_score(story: Dict[str, Any], source_count: int = 1) -
         score += SIGNIFICANCE_WEIGHTS["financial_impact"] * 0.5
 
     # Regulatory significance
-    if any(kw in text for kw in ["sec", "regulation", "lawsuit", "ban", "antitrust", "investigation"]):
+    if keywords.any("regulatory"):
         score += SIGNIFICANCE_WEIGHTS["regulatory"]
 
-    # Content depth
-    content_length = len(content)
-    if content_length > 2000:
-        score += SIGNIFICANCE_WEIGHTS["content_depth"] * 2
-    elif content_length > 1000:
-        score += SIGNIFICANCE_WEIGHTS["content_depth"]
-
     return score
 
 
-def combine_similar_stories(stories: List[Dict[str, Any]]) -> List[CuratedStory]:
-    """Combine similar stories from multiple sources into single curated stories."""
-    if not stories:
-        return []
+def significance_upper_bound(story: Dict[str, Any], source_count: int = 1) -> float:
+    """Upper bound of :func:`calculate_significance_score` without scanning the text."""
+    return _metadata_score(story, source_count) + MAX_TEXT_SCORE
 
-    curated: List[CuratedStory] = []
-    used_indices = set()
 
-    for i, story in enumerate(stories):
-        if i in used_indices:
-            continue
+def primary_story(similar_stories: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """The source with the longest content (the first one on ties)."""
+    return max(similar_stories, key=content_length)
 
-        # Find all similar stories
-        similar_stories = [story]
-        used_indices.add(i)
 
-        for j, other_story in enumerate(stories):
-            if j in used_indices:
-                continue
-            if stories_are_similar(story, other_story):
-                similar_stories.append(other_story)
-                used_indices.add(j)
+def build_curated_story(similar_stories: List[Dict[str, Any]]) -> CuratedStory:
+    """Build a curated story from a cluster of similar source stories."""
+    # Use the longest content as primary
+    similar_stories = sorted(similar_stories, key=content_length, reverse=True)
+    primary = similar_stories[0]  # Same as primary_story()
+
+    curated_story = CuratedStory(
+        title=primary.get('title', 'Untitled'),
+        content=primary.get('content', ''),
+        sources=similar_stories
+    )
+
+    # Extract key facts and quotes from all sources
+    all_content = " ".join(s.get('content', '') for s in similar_stories)
+    curated_story.key_facts = extract_key_facts(all_content)
+    curated_story.key_quotes = extract_key_quotes(all_content)
+
+    # Calculate significance score
+    curated_story.significance_score = calculate_significance_score(
+        primary, source_count=len(similar_stories)
+    )
+
+    return curated_story
+
 
-        # Create curated story from similar stories
-        # Use the longest content as primary
-        similar_stories.sort(key=lambda s: len(s.get('content', '')), reverse=True)
-        primary = similar_stories[0]
+def blocking_keys(story: Dict[str, Any]) -> Set[str]:
+    """Inverted-index keys for a story's title keywords.
 
-        curated_story = CuratedStory(
-            title=primary.get('title', 'Untitled'),
-            content=primary.get('content', ''),
-            sources=similar_stories
-        )
+    Every pair of distinct keywords is a key (a one-keyword title uses the
+    keyword itself). Keyword overlap above 1/2 between titles with two or
+    more keywords means sharing at least two keywords, so every pair that
+    passes that test in :func:`stories_are_similar` shares a key, while a
+    single common word such as a company name does not make a block.
+    """
+    keywords = sorted(set(story_features(story).title_keywords))
+    if len(keywords) == 1:
+        return {keywords[0]}
+    return {f"{a} {b}" for a, b in combinations(keywords, 2)}
+
+
+class IncrementalStoryCombiner:
+    """Cluster stories one at a time, as they arrive, with union-find.
+
+    A new story is checked with :func:`stories_are_similar` only against
+    candidate stories: those sharing a title-keyword block (see
+    :func:`blocking_keys`) or an LSH bucket of content MinHash signatures.
+    Matching stories' clusters are merged, so clusters are the connected
+    components of the similarity graph and their membership does not depend
+    on the order stories arrive in. Candidates already in the story's
+    cluster are skipped. ``use_index=False`` checks every earlier story
+    instead.
+
+    Matches are transitive here, so the title character ratio is not used:
+    it links unrelated headlines with a shared frame, which then chain whole
+    topics together. Keyword overlap and content similarity still apply.
+
+    Usage:
+        combiner = IncrementalStoryCombiner()
+        for article in iter_recent_articles():
+            combiner.add(article)
+        curated = combiner.curated()
+    """
+
+    def __init__(self, use_index: bool = True):
+        self.stories: List[Dict[str, Any]] = []
+        self.comparisons = 0
+        self.use_index = use_index
+        self._components = UnionFind()
+        self._keyword_index: Dict[str, List[int]] = defaultdict(list)
+        self._content_index = LSHIndex(*CONTENT_LSH_BANDS)
+
+    @property
+    def story_count(self) -> int:
+        return len(self.stories)
+
+    def add(self, story: Dict[str, Any], signature: Optional[np.ndarray] = None) -> None:
+        """Add a story, merging it with every cluster it is similar to.
+
+        ``signature`` is the story's :func:`content_signature`, if already known.
+        """
+        story_id = self._components.add()
+        self.stories.append(story)
+        if self.use_index:
+            keys = blocking_keys(story)
+            if signature is None:
+                signature = content_signature(story)
+            content_candidates = self._content_index.candidates(signature)
+            candidates = set(content_candidates)
+            for key in keys:
+                candidates.update(self._keyword_index.get(key, ()))
+            candidates = sorted(candidates)
+        else:
+            candidates = range(story_id)
+
+        for other in candidates:
+            if self._components.find(other) == self._components.find(story_id):
+                continue
+            # A keyword-block candidate can only match on keyword overlap
+            # (content matches are what the LSH candidates are for)
+            if self.use_index and other not in content_candidates and \
+                    title_keyword_overlap(self.stories[other], story) <= KEYWORD_OVERLAP_THRESHOLD:
+                continue
+            self.comparisons += 1
+            if stories_are_similar(self.stories[other], story, compare_titles=False):
+                self._components.union(other, story_id)
+
+        if self.use_index:
+            self._index(story_id, keys, signature)
+
+    def restore(
+        self,
+        story: Dict[str, Any],
+        signature: Optional[np.ndarray] = None,
+        cluster_with: Optional[int] = None
+    ) -> None:
+        """Add a story clustered by an earlier run, without similarity checks.
+
+        ``cluster_with`` is the index of an earlier story in the same
+        cluster; None starts a new cluster.
+        """
+        story_id = self._components.add()
+        self.stories.append(story)
+        if cluster_with is not None:
+            self._components.union(cluster_with, story_id)
+        if self.use_index:
+            self._index(story_id, blocking_keys(story), signature)
+
+    def _index(self, story_id: int, keys: Set[str], signature: Optional[np.ndarray]) -> None:
+        for key in keys:
+            self._keyword_index[key].append(story_id)
+        self._content_index.add(story_id, signature)
+
+    def extend(self, stories: Iterable[Dict[str, Any]]) -> None:
+        for story in stories:
+            self.add(story)
+
+    @property
+    def clusters(self) -> List[List[Dict[str, Any]]]:
+        """Current clusters, each in arrival order, ordered by first appearance."""
+        return [[self.stories[i] for i in members] for members in self._components.groups()]
+
+    def labels(self) -> List[int]:
+        """Index into :attr:`clusters` of each story's cluster, in arrival order."""
+        labels = [0] * len(self.stories)
+        for label, members in enumerate(self._components.groups()):
+            for i in members:
+                labels[i] = label
+        return labels
+
+    def curated(self) -> List[CuratedStory]:
+        """Build curated stories for the current clusters."""
+        return [build_curated_story(cluster) for cluster in self.clusters]
+
+
+def cluster_stories(
+    stories: Iterable[Dict[str, Any]],
+    similarity: Optional[SimilarityThresholds] = None
+) -> List[List[Dict[str, Any]]]:
+    """Group similar stories into clusters, in order of first appearance.
+
+    Clusters are connected components of the similarity graph. With
+    ``similarity`` thresholds, all stories are compared at once with the
+    vectorized TF-IDF engine; otherwise they are clustered one at a time as
+    they arrive (see :class:`IncrementalStoryCombiner`).
+    """
+    if similarity is None:
+        combiner = IncrementalStoryCombiner()
+        combiner.extend(stories)
+        return combiner.clusters
 
-        # Extract key facts and quotes from all sources
-        all_content = " ".join(s.get('content', '') for s in similar_stories)
-        curated_story.key_facts = extract_key_facts(all_content)
-        curated_story.key_quotes = extract_key_quotes(all_content)
+    stories = list(stories)
+    if not stories:
+        return []
+    engine = TfidfSimilarity(stories, similarity)
+    return [[stories[i] for i in members] for members in engine.cluster()]
 
-        # Calculate significance score
-        curated_story.significance_score = calculate_significance_score(
-            primary, source_count=len(similar_stories)
-        )
 
-        curated.append(curated_story)
+def combine_similar_stories(
+    stories: Iterable[Dict[str, Any]],
+    similarity: Optional[SimilarityThresholds] = None
+) -> List[CuratedStory]:
+    """Combine similar stories from multiple sources into single curated stories.
 
-    return curated
+    ``stories`` may be any iterable, including a generator that is still
+    fetching; stories are clustered as they arrive unless ``similarity``
+    selects batch TF-IDF clustering.
+    """
+    return [build_curated_story(cluster) for cluster in cluster_stories(stories, similarity)]
 
 
 def rank_stories(curated_stories: List[CuratedStory]) -> List[CuratedStory]:
@@ -268,37 +478,80 @@ def rank_stories(curated_stories: List[CuratedStory]) -> List[CuratedStory]:
 
 
 def select_top_stories(
-    stories: List[Dict[str, Any]],
+    stories: Iterable[Dict[str, Any]],
     max_stories: int = 4,
-    min_significance: float = 2.0
+    min_significance: float = 2.0,
+    similarity: Optional[SimilarityThresholds] = None,
+    cluster_store: Optional["ClusterStore"] = None
 ) -> List[CuratedStory]:
     """Select the top stories for an episode.
 
     Args:
-        stories: Raw list of stories from news tracker
+        stories: Raw stories from news tracker; a list, or a generator such
+            as ``iter_recent_articles()`` to cluster while fetching
         max_stories: Maximum number of stories to select (default: 4)
         min_significance: Minimum significance score to include
+        similarity: Thresholds for batch TF-IDF clustering; None clusters
+            incrementally as stories arrive
+        cluster_store: Cross-run cluster store; stories join the clusters of
+            earlier runs, and fast-growing clusters rank higher (incremental
+            clustering only, so not combined with ``similarity``)
 
     Returns:
         List of top curated stories, ranked by significance
     """
-    if not stories:
-        return []
+    if cluster_store is not None and similarity is not None:
+        raise ValueError("cluster_store clusters incrementally; it cannot be combined with similarity")
 
     # Combine similar stories
-    curated = combine_similar_stories(stories)
-    logger.info(f"Combined {len(stories)} stories into {len(curated)} unique topics")
-
-    # Rank by significance
-    ranked = rank_stories(curated)
+    if cluster_store is not None:
+        stored = cluster_store.cluster(stories)
+        clusters = list(stored.values())
+        cluster_ids: List[Optional[int]] = list(stored)
+        rates = cluster_store.growth_rates(stored)
+        growth = [rates[cluster_id] for cluster_id in stored]
+    else:
+        clusters = cluster_stories(stories, similarity)
+        cluster_ids = [None] * len(clusters)
+        growth = [0.0] * len(clusters)
+    if not clusters or max_stories < 1:
+        return []
+    story_count = sum(len(cluster) for cluster in clusters)
+    logger.info(f"Combined {story_count} stories into {len(clusters)} unique topics")
+
+    # Keep the best clusters in a bounded min-heap of (score, -position);
+    # earlier clusters win ties, as in rank_stories
+    heap: List[Tuple[float, int]] = []
+    pruned = 0
+    for position, cluster in enumerate(clusters):
+        primary = primary_story(cluster)
+        bonus = SIGNIFICANCE_WEIGHTS["growth"] * min(growth[position], 3)
+        if len(heap) == max_stories and \
+                significance_upper_bound(primary, len(cluster)) + bonus <= heap[0][0]:
+            pruned += 1
+            continue
+        entry = (calculate_significance_score(primary, len(cluster)) + bonus, -position)
+        if len(heap) < max_stories:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    if pruned:
+        logger.debug(f"Skipped scoring {pruned} clusters that could not reach the top {max_stories}")
+
+    # Build (with facts and quotes) only the winners, ranked by significance
+    ranked = []
+    for _, negated_position in sorted(heap, reverse=True):
+        position = -negated_position
+        story = build_curated_story(clusters[position])
+        story.cluster_id = cluster_ids[position]
+        story.growth_rate = growth[position]
+        story.significance_score += SIGNIFICANCE_WEIGHTS["growth"] * min(story.growth_rate, 3)
+        ranked.append(story)
 
     # Filter by minimum significance (but always keep at least 1)
-    filtered = [s for s in ranked if s.significance_score >= min_significance]
-    if not filtered and ranked:
-        filtered = [ranked[0]]
-
-    # Select top stories
-    selected = filtered[:max_stories]
+    selected = [s for s in ranked if s.significance_score >= min_significance]
+    if not selected and ranked:
+        selected = [ranked[0]]
 
     logger.info(f"Selected {len(selected)} top stories for episode")
     for i, story in enumerate(selected, 1):
@@ -349,6 +602,8 @@ def curated_to_dict(story: CuratedStory) -> Dict[str, Any]:
         'key_facts': story.key_facts,
         'key_quotes': story.key_quotes,
         'all_links': story.get_all_links(),
+        'cluster_id': story.cluster_id,
+        'growth_rate': story.growth_rate,
     }
 
 
@@ -30,6 +30,9 @@ from seo import init_seo
 MAX_FILE_SIZE_MB = 10
 MAX_TEXT_LENGTH = 100000
 
+# Sessions per page in the sidebar history
+HISTORY_PAGE_SIZE = 10
+
 # Define paths
 SCRIPT_FILE_PATH = './data/transcripts/'
 AUDIO_FILE_PATH = './data/audio/podcast/'
@@ -317,7 +320,15 @@ with st.sidebar:
 
     # Session History
     st.subheader("Session History")
-    sessions = history_manager.get_sessions(limit=10)
+    # Cursors of the pages shown so far; the last one is the current page
+    history_cursors = st.session_state.setdefault('history_cursors', [None])
+    sessions = history_manager.get_sessions(limit=HISTORY_PAGE_SIZE + 1, after=history_cursors[-1])
+    if not sessions and len(history_cursors) > 1:
+        # The page's cursor was deleted; start over from the newest sessions
+        history_cursors[:] = [None]
+        sessions = history_manager.get_sessions(limit=HISTORY_PAGE_SIZE + 1)
+    has_older = len(sessions) > HISTORY_PAGE_SIZE
+    sessions = sessions[:HISTORY_PAGE_SIZE]
     if sessions:
         session_options = ["-- Select a session --"] + [s.display_name for s in sessions]
         selected_idx = st.selectbox(
@@ -335,6 +346,13 @@ with st.sidebar:
                 st.session_state['host_1_name'] = selected_session.host_1_name
                 st.session_state['host_2_name'] = selected_session.host_2_name
                 st.success("Settings loaded! Refresh to apply.")
+        newer_col, older_col = st.columns(2)
+        if len(history_cursors) > 1 and newer_col.button("Newer", key="history_newer"):
+            history_cursors.pop()
+            st.rerun()
+        if has_older and older_col.button("Older", key="history_older"):
+            history_cursors.append(sessions[-1].session_id)
+            st.rerun()
     else:
         st.caption("No previous sessions")
 